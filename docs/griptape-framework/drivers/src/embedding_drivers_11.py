@@ -0,0 +1,13 @@
+from griptape.drivers.embedding.cached import CachedEmbeddingDriver
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+from griptape.drivers.embedding_cache.sqlite import SqliteEmbeddingCacheDriver
+
+driver = CachedEmbeddingDriver(
+    embedding_driver=OpenAiEmbeddingDriver(),
+    cache_driver=SqliteEmbeddingCacheDriver(database_file="embeddings.db"),
+)
+
+driver.embed("Hello Griptape!")
+driver.embed("Hello Griptape!")
+
+print(f"Hits: {driver.hits}, Misses: {driver.misses}")
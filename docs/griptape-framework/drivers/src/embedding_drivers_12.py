@@ -0,0 +1,14 @@
+from griptape.artifacts import TextArtifact
+from griptape.drivers.embedding.huggingface_local import HuggingFaceLocalEmbeddingDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+
+driver = HuggingFaceLocalEmbeddingDriver(model="sentence-transformers/all-MiniLM-L6-v2", batch_size=64)
+
+embeddings = driver.embed("Hello world!")
+
+# display the first 3 embeddings
+print(embeddings[:3])
+
+# Artifacts that are upserted concurrently are embedded in batches.
+vector_store_driver = LocalVectorStoreDriver(embedding_driver=driver)
+vector_store_driver.upsert_collection([TextArtifact(f"Document {i}") for i in range(100)])
@@ -0,0 +1,20 @@
+import os
+
+from griptape.drivers.event_listener.webhook import WebhookEventListenerDriver
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+from griptape.events import EventBus, EventListener
+from griptape.structures import Agent
+
+event_listener_driver = WebhookEventListenerDriver(
+    webhook_url=os.environ["WEBHOOK_URL"],
+    batch_size=50,
+    flush_interval=0.5,
+    max_queue_size=10_000,
+    queue_full_policy="drop",
+)
+EventBus.add_event_listener(EventListener(event_listener_driver=event_listener_driver))
+
+agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4.1", stream=True))
+agent.run("Tell me a story about a webhook.")
+
+print(event_listener_driver.metrics)
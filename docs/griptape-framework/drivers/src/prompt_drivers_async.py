@@ -0,0 +1,19 @@
+import asyncio
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
+
+driver = OpenAiChatPromptDriver(model="gpt-4.1")
+
+
+async def main() -> None:
+    results = await asyncio.gather(
+        driver.arun(TextArtifact("What is the capital of France?")),
+        driver.arun(TextArtifact("What is the capital of Germany?")),
+    )
+
+    for result in results:
+        print(result.value)
+
+
+asyncio.run(main())
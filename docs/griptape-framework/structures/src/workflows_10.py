@@ -0,0 +1,23 @@
+from concurrent import futures
+
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import ExecutorRegistry
+
+# Run at most 4 Workflow tasks at a time across all Workflows.
+ExecutorRegistry.configure_pool("workflows", max_workers=4)
+
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about the number {i}") for i in range(8)],
+)
+workflow.run()
+
+metrics = ExecutorRegistry.metrics()["workflows"]
+print(f"Ran {metrics.completed} tasks, waited {metrics.average_wait_time:.2f}s on average for a worker")
+
+# Or use a dedicated executor for a single Workflow.
+workflow = Workflow(
+    tasks=[PromptTask(f"Write a haiku about the number {i}") for i in range(8)],
+    create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=2),
+)
+workflow.run()
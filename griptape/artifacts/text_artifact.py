@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 @define
 class TextArtifact(BaseArtifact):
+    COMPILED_SERIALIZATION = True
+
     value: str = field(converter=str, metadata={"serializable": True})
     embedding: list[float] | None = field(default=None, kw_only=True)
 
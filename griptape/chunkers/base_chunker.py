@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import functools
 from abc import ABC
 
 from attrs import Attribute, Factory, define, field
@@ -38,7 +40,7 @@ class BaseChunker(ABC):
         return [TextArtifact(c, reference=reference) for c in self._chunk_recursively(text_to_chunk)]
 
     def _chunk_recursively(self, chunk: str, current_separator: ChunkSeparator | None = None) -> list[str]:
-        token_count = self.tokenizer.count_tokens(chunk)
+        token_count = self.tokenizer.count_tokens_for_limit(chunk, self.max_tokens)
         half_token_count = token_count // 2
 
         if token_count <= self.max_tokens:
@@ -60,7 +62,7 @@ class BaseChunker(ABC):
 
             if len(non_empty_subchunks) > 1:
                 # Find what combination of subchunks results in the most balanced split of the chunk.
-                midpoint_index = self.__find_midpoint_index(separator, subchunks, half_token_count)
+                midpoint_index = self._find_midpoint_index(separator, subchunks, half_token_count)
 
                 # Create the two subchunks based on the best separator.
                 first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, midpoint_index)
@@ -95,16 +97,30 @@ class BaseChunker(ABC):
 
         return first_subchunk, second_subchunk
 
-    def __find_midpoint_index(self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int) -> int:
-        midpoint_index = -1
-        best_midpoint_distance = float("inf")
+    def _find_midpoint_index(self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int) -> int:
+        """Finds the index of the subchunk that ends the most balanced split.
 
-        for index, _ in enumerate(subchunks):
-            subchunk_tokens_count = self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+        The token count of the joined prefix `subchunks[: index + 1]` does not decrease as `index` grows, so the most
+        balanced split is either the first prefix that reaches `half_token_count` or the prefix just before it. Both
+        are found with a binary search, which tokenizes O(log n) prefixes instead of all n.
+        """
 
-            midpoint_distance = abs(subchunk_tokens_count - half_token_count)
-            if midpoint_distance < best_midpoint_distance:
-                midpoint_index = index
-                best_midpoint_distance = midpoint_distance
+        @functools.cache
+        def prefix_token_count(index: int) -> int:
+            return self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
 
-        return midpoint_index
+        indexes = range(len(subchunks))
+        upper_index = bisect.bisect_left(indexes, half_token_count, key=prefix_token_count)
+
+        if upper_index == 0:
+            return 0
+
+        # Ties go to the earliest index, so step back to the first prefix with the same token count.
+        lower_token_count = prefix_token_count(upper_index - 1)
+        lower_index = bisect.bisect_left(indexes, lower_token_count, hi=upper_index - 1, key=prefix_token_count)
+
+        if upper_index == len(subchunks) or (
+            half_token_count - lower_token_count <= prefix_token_count(upper_index) - half_token_count
+        ):
+            return lower_index
+        return upper_index
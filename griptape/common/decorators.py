@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import inspect
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
 import wrapt
@@ -47,4 +48,23 @@ def observable(wrapped: Callable[P, T] | Any | None = None, **dkwargs: Any) -> A
             ),
         )
 
+    @wrapt.decorator
+    async def async_wrapper(wrapped: Callable[P, Any], instance: Any, args: Any, kwargs: Any) -> Any:
+        from griptape.common.observable import Observable
+        from griptape.observability.observability import Observability
+
+        return await Observability.aobserve(
+            Observable.Call(
+                func=wrapped,
+                instance=instance,
+                args=args,
+                kwargs=kwargs,
+                decorator_args=(),
+                decorator_kwargs=dkwargs,
+            )
+        )
+
+    if inspect.iscoroutinefunction(wrapped):
+        return async_wrapper(wrapped)  # pyright: ignore[reportCallIssue]
+
     return wrapper(wrapped)  # pyright: ignore[reportCallIssue]
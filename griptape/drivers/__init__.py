@@ -30,10 +30,17 @@ from .embedding.amazon_sagemaker_jumpstart import AmazonSageMakerJumpstartEmbedd
 from .embedding.amazon_bedrock import AmazonBedrockTitanEmbeddingDriver, AmazonBedrockCohereEmbeddingDriver
 from .embedding.voyageai import VoyageAiEmbeddingDriver
 from .embedding.huggingface_hub import HuggingFaceHubEmbeddingDriver
+from .embedding.huggingface_local import HuggingFaceLocalEmbeddingDriver
 from .embedding.google import GoogleEmbeddingDriver
 from .embedding.dummy import DummyEmbeddingDriver
 from .embedding.cohere import CohereEmbeddingDriver
 from .embedding.ollama import OllamaEmbeddingDriver
+from .embedding.cached import CachedEmbeddingDriver
+
+from .embedding_cache import BaseEmbeddingCacheDriver
+from .embedding_cache.local import LocalEmbeddingCacheDriver
+from .embedding_cache.sqlite import SqliteEmbeddingCacheDriver
+from .embedding_cache.redis import RedisEmbeddingCacheDriver
 
 from .vector import BaseVectorStoreDriver
 from .vector.local import LocalVectorStoreDriver
@@ -158,6 +165,7 @@ __all__ = [
     "BaseAudioTranscriptionDriver",
     "BaseConversationMemoryDriver",
     "BaseDiffusionImageGenerationPipelineDriver",
+    "BaseEmbeddingCacheDriver",
     "BaseEmbeddingDriver",
     "BaseEventListenerDriver",
     "BaseFileManagerDriver",
@@ -176,6 +184,7 @@ __all__ = [
     "BaseWebSearchDriver",
     "BedrockStableDiffusionImageGenerationModelDriver",
     "BedrockTitanImageGenerationModelDriver",
+    "CachedEmbeddingDriver",
     "CohereEmbeddingDriver",
     "CoherePromptDriver",
     "CohereRerankDriver",
@@ -204,10 +213,12 @@ __all__ = [
     "GrokPromptDriver",
     "HuggingFaceHubEmbeddingDriver",
     "HuggingFaceHubPromptDriver",
+    "HuggingFaceLocalEmbeddingDriver",
     "HuggingFacePipelineImageGenerationDriver",
     "HuggingFacePipelinePromptDriver",
     "LeonardoImageGenerationDriver",
     "LocalConversationMemoryDriver",
+    "LocalEmbeddingCacheDriver",
     "LocalFileManagerDriver",
     "LocalRerankDriver",
     "LocalRulesetDriver",
@@ -236,9 +247,11 @@ __all__ = [
     "PusherEventListenerDriver",
     "QdrantVectorStoreDriver",
     "RedisConversationMemoryDriver",
+    "RedisEmbeddingCacheDriver",
     "RedisVectorStoreDriver",
     "SnowflakeSqlDriver",
     "SqlDriver",
+    "SqliteEmbeddingCacheDriver",
     "StableDiffusion3ControlNetImageGenerationPipelineDriver",
     "StableDiffusion3ImageGenerationPipelineDriver",
     "StableDiffusion3Img2ImgImageGenerationPipelineDriver",
@@ -29,12 +29,14 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         session: Optionally provide custom `boto3.Session`.
         tokenizer: Optionally provide custom `BedrockCohereTokenizer`.
         client: Optionally provide custom `bedrock-runtime` client.
+        batch_size: Maximum number of chunks per request. Defaults to Cohere's limit of 96.
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     input_type: str = field(default="search_query", kw_only=True)
+    batch_size: int = field(default=96, kw_only=True)
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: AmazonBedrockTokenizer(model=self.model), takes_self=True),
@@ -49,7 +51,10 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         return self.session.client("bedrock-runtime")
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk], **kwargs)[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.client.invoke_model(
             body=json.dumps(payload),
@@ -59,4 +64,4 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
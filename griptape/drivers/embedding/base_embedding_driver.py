@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, cast
 
 from attrs import define, field
 
@@ -12,6 +12,8 @@ from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from griptape.tokenizers import BaseTokenizer
 
 VectorOperation = Literal["query", "upsert"]
@@ -24,10 +26,14 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        batch_size: The maximum number of chunks `embed_batch` sends to the provider in a single request.
+        max_batch_tokens: An optional limit on the total number of tokens `embed_batch` sends in a single request.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: BaseTokenizer | None = field(default=None, kw_only=True)
+    batch_size: int = field(default=1, kw_only=True)
+    max_batch_tokens: int | None = field(default=None, kw_only=True)
     chunker: BaseChunker | None = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -69,6 +75,55 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
                     return self.try_embed_artifact(value, vector_operation=vector_operation)
         raise RuntimeError("Failed to embed string.")
 
+    def embed_batch(
+        self,
+        values: Sequence[str | TextArtifact | ImageArtifact],
+        *,
+        vector_operation: VectorOperation | None = None,
+    ) -> list[list[float]]:
+        """Embeds multiple values, sending up to `batch_size` chunks to the provider per request.
+
+        Strings that exceed the tokenizer's max input tokens are chunked and averaged like in `embed`.
+        Image Artifacts are embedded one at a time.
+
+        Args:
+            values: The values to embed.
+            vector_operation: The vector operation the embeddings are used for.
+
+        Returns:
+            The embeddings, in the same order as `values`.
+        """
+        embeddings: list[list[float] | None] = [None] * len(values)
+        batch: list[tuple[int, str]] = []
+        batch_tokens = 0
+
+        for index, value in enumerate(values):
+            if not isinstance(value, (str, TextArtifact)):
+                embeddings[index] = self.embed(value, vector_operation=vector_operation)
+                continue
+
+            text = value if isinstance(value, str) else value.to_text()
+            tokens = self.tokenizer.count_tokens(text) if self.tokenizer is not None else 0
+
+            if self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                embeddings[index] = self._embed_long_string(text, vector_operation=vector_operation)
+                continue
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                self._embed_batch_chunks(batch, embeddings, vector_operation=vector_operation)
+                batch, batch_tokens = [], 0
+
+            batch.append((index, text))
+            batch_tokens += tokens
+
+        if batch:
+            self._embed_batch_chunks(batch, embeddings, vector_operation=vector_operation)
+
+        return cast("list[list[float]]", embeddings)
+
     def try_embed_artifact(
         self, artifact: TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
     ) -> list[float]:
@@ -82,6 +137,32 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # TODO: Remove for griptape 2.0, subclasses should implement `try_embed_artifact` instead
         pass
 
+    def try_embed_chunks(
+        self, chunks: list[str], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        """Embeds multiple chunks in a single request.
+
+        Drivers whose provider supports batch requests should override this method, the default implementation embeds
+        the chunks one at a time.
+        """
+        return [self.try_embed_chunk(chunk, vector_operation=vector_operation) for chunk in chunks]
+
+    def _embed_batch_chunks(
+        self,
+        batch: list[tuple[int, str]],
+        embeddings: list[list[float] | None],
+        *,
+        vector_operation: VectorOperation | None = None,
+    ) -> None:
+        for attempt in self.retrying():
+            with attempt:
+                batch_embeddings = self.try_embed_chunks(
+                    [chunk for _, chunk in batch], vector_operation=vector_operation
+                )
+
+                for (index, _), embedding in zip(batch, batch_embeddings, strict=True):
+                    embeddings[index] = embedding
+
     def _embed_long_string(self, string: str, *, vector_operation: VectorOperation | None = None) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
@@ -91,11 +172,8 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
 
         chunks = self.chunker.chunk(string)  # pyright: ignore[reportOptionalMemberAccess] In practice this is never None
 
-        embedding_chunks = []
-        length_chunks = []
-        for chunk in chunks:
-            embedding_chunks.append(self.embed(chunk.value, vector_operation=vector_operation))
-            length_chunks.append(len(chunk))
+        embedding_chunks = self.embed_batch([chunk.value for chunk in chunks], vector_operation=vector_operation)
+        length_chunks = [len(chunk) for chunk in chunks]
 
         # generate weighted averages
         embedding_chunks = np.average(embedding_chunks, axis=0, weights=length_chunks)
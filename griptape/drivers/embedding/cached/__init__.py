@@ -0,0 +1,3 @@
+from griptape.drivers.embedding.cached_embedding_driver import CachedEmbeddingDriver
+
+__all__ = ["CachedEmbeddingDriver"]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING
+
+from attrs import Factory, define, field
+
+from griptape.artifacts import ImageArtifact, TextArtifact
+from griptape.drivers.embedding import BaseEmbeddingDriver
+from griptape.drivers.embedding_cache.local import LocalEmbeddingCacheDriver
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.drivers.embedding.base_embedding_driver import VectorOperation
+    from griptape.drivers.embedding_cache import BaseEmbeddingCacheDriver
+    from griptape.tokenizers import BaseTokenizer
+
+
+@define
+class CachedEmbeddingDriver(BaseEmbeddingDriver):
+    """An Embedding Driver that caches the embeddings of another Embedding Driver.
+
+    Embeddings are cached by model, vector operation, and the SHA-256 hash of the embedded content, so only values
+    that are not in the cache reach the wrapped Driver.
+
+    Attributes:
+        embedding_driver: The Embedding Driver to cache embeddings for.
+        cache_driver: The Embedding Cache Driver to store embeddings in. Defaults to an in-memory LRU cache.
+        hits: The number of values that were served from the cache.
+        misses: The number of values that were embedded by `embedding_driver`.
+    """
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    cache_driver: BaseEmbeddingCacheDriver = field(
+        default=Factory(LocalEmbeddingCacheDriver), kw_only=True, metadata={"serializable": True}
+    )
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    tokenizer: BaseTokenizer | None = field(
+        default=Factory(lambda self: self.embedding_driver.tokenizer, takes_self=True), kw_only=True
+    )
+    batch_size: int = field(
+        default=Factory(lambda self: self.embedding_driver.batch_size, takes_self=True), kw_only=True
+    )
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _stats_lock: threading.Lock = field(default=Factory(threading.Lock), init=False)
+
+    def embed(
+        self, value: str | TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
+    ) -> list[float]:
+        return self.embed_batch([value], vector_operation=vector_operation)[0]
+
+    def embed_batch(
+        self,
+        values: Sequence[str | TextArtifact | ImageArtifact],
+        *,
+        vector_operation: VectorOperation | None = None,
+    ) -> list[list[float]]:
+        keys = [self._cache_key(value, vector_operation=vector_operation) for value in values]
+        embeddings = dict(zip(keys, self.cache_driver.load_embeddings(keys), strict=True))
+
+        # Identical values within a batch are only embedded once.
+        misses = {key: value for key, value in zip(keys, values, strict=True) if embeddings[key] is None}
+
+        if misses:
+            new_embeddings = dict(
+                zip(
+                    misses.keys(),
+                    self.embedding_driver.embed_batch(list(misses.values()), vector_operation=vector_operation),
+                    strict=True,
+                )
+            )
+
+            self.cache_driver.store_embeddings(new_embeddings)
+            embeddings.update(new_embeddings)
+
+        with self._stats_lock:
+            self.misses += len(misses)
+            self.hits += len(values) - len(misses)
+
+        return [embeddings[key] for key in keys]  # pyright: ignore[reportReturnType] Every key has an embedding here
+
+    def try_embed_artifact(
+        self, artifact: TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
+    ) -> list[float]:
+        return self.embedding_driver.try_embed_artifact(artifact, vector_operation=vector_operation)
+
+    def try_embed_chunk(self, chunk: str, *, vector_operation: VectorOperation | None = None) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk, vector_operation=vector_operation)
+
+    def try_embed_chunks(
+        self, chunks: list[str], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks, vector_operation=vector_operation)
+
+    def _cache_key(
+        self, value: str | TextArtifact | ImageArtifact, *, vector_operation: VectorOperation | None = None
+    ) -> str:
+        if isinstance(value, TextArtifact):
+            value = value.to_text()
+
+        content = value.encode() if isinstance(value, str) else value.value
+
+        return f"{self.model}:{vector_operation or ''}:{hashlib.sha256(content).hexdigest()}"
@@ -12,3 +12,6 @@ class DummyEmbeddingDriver(BaseEmbeddingDriver):
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
         raise DummyError(__class__.__name__, "try_embed_chunk")
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        raise DummyError(__class__.__name__, "try_embed_chunks")
@@ -0,0 +1,3 @@
+from griptape.drivers.embedding.huggingface_local_embedding_driver import HuggingFaceLocalEmbeddingDriver
+
+__all__ = ["HuggingFaceLocalEmbeddingDriver"]
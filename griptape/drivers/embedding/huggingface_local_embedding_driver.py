@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from attrs import Factory, define, field
+
+from griptape.drivers.embedding import BaseEmbeddingDriver
+from griptape.tokenizers import HuggingFaceTokenizer
+from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
+from griptape.utils.micro_batcher import MicroBatcher
+
+if TYPE_CHECKING:
+    from transformers import PreTrainedModel
+    from transformers.tokenization_utils_base import PreTrainedTokenizerBase
+
+    from griptape.drivers.embedding.base_embedding_driver import VectorOperation
+
+# Models are loaded once per process, and shared by every driver that uses them.
+_pretrained_models: dict[tuple[str, str], tuple[PreTrainedTokenizerBase, PreTrainedModel]] = {}
+_pretrained_models_lock = threading.Lock()
+
+
+def _load_pretrained_model(model: str, device: str) -> tuple[PreTrainedTokenizerBase, PreTrainedModel]:
+    with _pretrained_models_lock:
+        if (model, device) not in _pretrained_models:
+            transformers = import_optional_dependency("transformers")
+
+            _pretrained_models[(model, device)] = (
+                transformers.AutoTokenizer.from_pretrained(model),
+                transformers.AutoModel.from_pretrained(model).to(device).eval(),
+            )
+
+        return _pretrained_models[(model, device)]
+
+
+@define
+class HuggingFaceLocalEmbeddingDriver(BaseEmbeddingDriver):
+    """Hugging Face Local Embedding Driver.
+
+    Embeds text with a Hugging Face Transformers model that runs in the current process. The embedding is the mean of
+    the model's token embeddings, like in most Sentence Transformers models.
+
+    Chunks that are embedded concurrently, for example by a Vector Store Driver's `upsert_collection`, are coalesced
+    into batches, so that the model runs once per batch.
+
+    Attributes:
+        model: Hugging Face Hub model name or path to a local model.
+        device: The device to run the model on.
+        normalize: Whether to normalize embeddings to unit length.
+        batch_size: The maximum number of chunks in a batch.
+        max_batch_wait: The maximum number of seconds that a batch waits for more chunks.
+        pretrained_tokenizer: Custom Transformers tokenizer.
+        pretrained_model: Custom Transformers model.
+    """
+
+    device: str = field(default="cpu", kw_only=True, metadata={"serializable": True})
+    normalize: bool = field(default=True, kw_only=True, metadata={"serializable": True})
+    batch_size: int = field(default=32, kw_only=True)
+    max_batch_wait: float = field(default=0.005, kw_only=True, metadata={"serializable": True})
+    _pretrained_tokenizer: PreTrainedTokenizerBase | None = field(
+        default=None, kw_only=True, alias="pretrained_tokenizer", metadata={"serializable": False}
+    )
+    _pretrained_model: PreTrainedModel | None = field(
+        default=None, kw_only=True, alias="pretrained_model", metadata={"serializable": False}
+    )
+    tokenizer: HuggingFaceTokenizer = field(
+        default=Factory(
+            lambda self: HuggingFaceTokenizer(model=self.model, tokenizer=self.pretrained_tokenizer), takes_self=True
+        ),
+        kw_only=True,
+    )
+    _micro_batcher: MicroBatcher[str, list[float]] = field(
+        default=Factory(
+            lambda self: MicroBatcher(self._embed_texts, max_batch_size=self.batch_size, max_wait=self.max_batch_wait),
+            takes_self=True,
+        ),
+        init=False,
+    )
+
+    @lazy_property()
+    def pretrained_tokenizer(self) -> PreTrainedTokenizerBase:
+        return _load_pretrained_model(self.model, self.device)[0]
+
+    @lazy_property()
+    def pretrained_model(self) -> PreTrainedModel:
+        return _load_pretrained_model(self.model, self.device)[1]
+
+    def try_embed_chunk(self, chunk: str, *, vector_operation: VectorOperation | None = None) -> list[float]:
+        return self._micro_batcher.submit(chunk).result()
+
+    def try_embed_chunks(
+        self, chunks: list[str], *, vector_operation: VectorOperation | None = None
+    ) -> list[list[float]]:
+        return self._micro_batcher.submit_all(chunks)
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        torch = import_optional_dependency("torch")
+
+        inputs = self.pretrained_tokenizer(texts, padding=True, truncation=True, return_tensors="pt").to(self.device)
+
+        with torch.inference_mode():
+            token_embeddings = self.pretrained_model(**inputs).last_hidden_state
+
+        # Padding tokens are left out of the mean.
+        attention_mask = inputs["attention_mask"].unsqueeze(-1).to(token_embeddings.dtype)
+        embeddings = (token_embeddings * attention_mask).sum(dim=1) / attention_mask.sum(dim=1).clamp(min=1e-9)
+
+        if self.normalize:
+            embeddings = torch.nn.functional.normalize(embeddings, dim=1)
+
+        return embeddings.tolist()
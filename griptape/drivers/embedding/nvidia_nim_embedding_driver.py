@@ -13,11 +13,23 @@ class NvidiaNimEmbeddingDriver(OpenAiEmbeddingDriver):
     """Nvidia Embedding Driver. The API is OpenAI compatible, but requires an extra parameter 'input_type'."""
 
     def try_embed_chunk(self, chunk: str, *, vector_operation: VectorOperation | None = None, **kwargs) -> list[float]:
+        return (
+            self.client.embeddings.create(**self._params(chunk), extra_body=self._extra_body(vector_operation))
+            .data[0]
+            .embedding
+        )
+
+    def try_embed_chunks(
+        self, chunks: list[str], *, vector_operation: VectorOperation | None = None, **kwargs
+    ) -> list[list[float]]:
+        response = self.client.embeddings.create(**self._params(chunks), extra_body=self._extra_body(vector_operation))
+
+        return [data.embedding for data in response.data]
+
+    def _extra_body(self, vector_operation: VectorOperation | None) -> dict:
         if vector_operation not in get_args(VectorOperation):
             raise ValueError(f"invalid value for vector_operation, must be one of {get_args(VectorOperation)}")
 
-        extra_body = {
+        return {
             "input_type": "query" if vector_operation == "query" else "passage",
         }
-
-        return self.client.embeddings.create(**self._params(chunk), extra_body=extra_body).data[0].embedding
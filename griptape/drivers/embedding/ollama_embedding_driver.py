@@ -20,12 +20,14 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         model: Ollama embedding model name.
         host: Optional Ollama host.
         client: Ollama `Client`.
+        batch_size: Maximum number of chunks per request. Defaults to 64.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     host: str | None = field(default=None, kw_only=True, metadata={"serializable": True})
     api_key: str | None = field(default=None, kw_only=True, metadata={"serializable": False})
     headers: dict[str, str] | None = field(default=None, kw_only=True, metadata={"serializable": False})
+    batch_size: int = field(default=64, kw_only=True)
     _client: Client | None = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -38,4 +40,8 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         return import_optional_dependency("ollama").Client(**client_kwargs)
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        return list(self.client.embeddings(model=self.model, prompt=chunk)["embedding"])
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        # Ollama's `embed` endpoint returns normalized vectors, so single chunks use it too, to be scaled the same way.
+        return [list(embedding) for embedding in self.client.embed(model=self.model, input=chunks)["embeddings"]]
@@ -23,6 +23,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         api_key: API key to pass directly. Defaults to `OPENAI_API_KEY` environment variable.
         organization: OpenAI organization. Defaults to 'OPENAI_ORGANIZATION' environment variable.
         tokenizer: Optionally provide custom `OpenAiTokenizer`.
+        batch_size: Maximum number of chunks per request. Defaults to OpenAI's limit of 2048.
+        max_batch_tokens: Maximum number of tokens per request. Defaults to OpenAI's limit of 300,000.
         client: Optionally provide custom `openai.OpenAI` client.
         azure_deployment: An Azure OpenAi deployment id.
         azure_endpoint: An Azure OpenAi endpoint.
@@ -41,6 +43,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    batch_size: int = field(default=2048, kw_only=True)
+    max_batch_tokens: int | None = field(default=300_000, kw_only=True)
     _client: openai.OpenAI | None = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -55,5 +59,10 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+        return [data.embedding for data in self.client.embeddings.create(**self._params(chunks)).data]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
@@ -25,6 +25,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         tokenizer: Optionally provide custom `VoyageAiTokenizer`.
         client: Optionally provide custom VoyageAI `Client`.
         input_type: VoyageAI input type. Defaults to `document`.
+        batch_size: Maximum number of chunks per request. Defaults to 128.
+        max_batch_tokens: Maximum number of tokens per request. Defaults to 120,000.
     """
 
     DEFAULT_MODEL = "voyage-large-2"
@@ -36,6 +38,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    batch_size: int = field(default=128, kw_only=True)
+    max_batch_tokens: int | None = field(default=120_000, kw_only=True)
     _client: Client | None = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -50,4 +54,7 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         return self.client.multimodal_embed([[pil_image.open(BytesIO(artifact.value))]], model=self.model).embeddings[0]
 
     def try_embed_chunk(self, chunk: str, **kwargs) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk], **kwargs)[0]
+
+    def try_embed_chunks(self, chunks: list[str], **kwargs) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
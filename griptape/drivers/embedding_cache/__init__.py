@@ -0,0 +1,3 @@
+from .base_embedding_cache_driver import BaseEmbeddingCacheDriver
+
+__all__ = ["BaseEmbeddingCacheDriver"]
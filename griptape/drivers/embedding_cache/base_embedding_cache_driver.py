@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import array
+from abc import ABC, abstractmethod
+
+from attrs import define
+
+from griptape.mixins.serializable_mixin import SerializableMixin
+
+
+@define
+class BaseEmbeddingCacheDriver(SerializableMixin, ABC):
+    """Base class for Embedding Cache Drivers, which store embeddings by a content-addressed key."""
+
+    @abstractmethod
+    def load_embeddings(self, keys: list[str]) -> list[list[float] | None]:
+        """Loads the embeddings stored under `keys`.
+
+        Args:
+            keys: The keys to load.
+
+        Returns:
+            The embeddings, in the same order as `keys`, with `None` for keys that are not in the cache.
+        """
+        ...
+
+    @abstractmethod
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        """Stores embeddings by key, replacing any existing values.
+
+        Args:
+            embeddings: A mapping of key to embedding.
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    def _embedding_to_bytes(self, embedding: list[float]) -> bytes:
+        return array.array("d", embedding).tobytes()
+
+    def _bytes_to_embedding(self, value: bytes) -> list[float]:
+        return array.array("d", value).tolist()
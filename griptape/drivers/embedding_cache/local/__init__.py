@@ -0,0 +1,3 @@
+from griptape.drivers.embedding_cache.local_embedding_cache_driver import LocalEmbeddingCacheDriver
+
+__all__ = ["LocalEmbeddingCacheDriver"]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from attrs import Factory, define, field
+
+from griptape.drivers.embedding_cache import BaseEmbeddingCacheDriver
+
+
+@define(kw_only=True)
+class LocalEmbeddingCacheDriver(BaseEmbeddingCacheDriver):
+    """An in-memory Embedding Cache Driver that evicts the least recently used embeddings.
+
+    Attributes:
+        max_entries: The maximum number of embeddings to keep. If `None`, the cache is unbounded.
+    """
+
+    max_entries: int | None = field(default=10_000, metadata={"serializable": True})
+    _embeddings: OrderedDict[str, list[float]] = field(default=Factory(OrderedDict), init=False)
+    _lock: threading.Lock = field(default=Factory(threading.Lock), init=False)
+
+    def load_embeddings(self, keys: list[str]) -> list[list[float] | None]:
+        embeddings = []
+
+        with self._lock:
+            for key in keys:
+                embedding = self._embeddings.get(key)
+
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+
+                embeddings.append(embedding)
+
+        return embeddings
+
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._embeddings[key] = embedding
+                self._embeddings.move_to_end(key)
+
+            if self.max_entries is not None:
+                while len(self._embeddings) > self.max_entries:
+                    self._embeddings.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
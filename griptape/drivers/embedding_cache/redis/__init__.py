@@ -0,0 +1,3 @@
+from griptape.drivers.embedding_cache.redis_embedding_cache_driver import RedisEmbeddingCacheDriver
+
+__all__ = ["RedisEmbeddingCacheDriver"]
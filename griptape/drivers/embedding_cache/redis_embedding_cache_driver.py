@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from attrs import define, field
+
+from griptape.drivers.embedding_cache import BaseEmbeddingCacheDriver
+from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+@define(kw_only=True)
+class RedisEmbeddingCacheDriver(BaseEmbeddingCacheDriver):
+    """An Embedding Cache Driver for Redis.
+
+    Attributes:
+        host: The host of the Redis instance.
+        port: The port of the Redis instance.
+        db: The database of the Redis instance.
+        username: The username of the Redis instance.
+        password: The password of the Redis instance.
+        key_prefix: The prefix added to every cache key.
+        ttl: An optional expiry, in seconds, for stored embeddings.
+        client: An optional Redis client to use. Defaults to a new client using the host, port, db, username, and password attributes.
+    """
+
+    host: str = field(metadata={"serializable": True})
+    port: int = field(default=6379, metadata={"serializable": True})
+    db: int = field(default=0, metadata={"serializable": True})
+    username: str = field(default="default", metadata={"serializable": False})
+    password: str | None = field(default=None, metadata={"serializable": False})
+    key_prefix: str = field(default="griptape:embedding:", metadata={"serializable": True})
+    ttl: int | None = field(default=None, metadata={"serializable": True})
+    _client: Redis | None = field(default=None, alias="client", metadata={"serializable": False})
+
+    @lazy_property()
+    def client(self) -> Redis:
+        return import_optional_dependency("redis").Redis(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            username=self.username,
+            password=self.password,
+            decode_responses=False,
+        )
+
+    def load_embeddings(self, keys: list[str]) -> list[list[float] | None]:
+        if not keys:
+            return []
+
+        values = self.client.mget([self.key_prefix + key for key in keys])
+
+        return [None if value is None else self._bytes_to_embedding(value) for value in values]  # pyright: ignore[reportGeneralTypeIssues, reportArgumentType] https://github.com/redis/redis-py/issues/2399
+
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, embedding in embeddings.items():
+                pipeline.set(self.key_prefix + key, self._embedding_to_bytes(embedding), ex=self.ttl)
+
+            pipeline.execute()
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}*"))
+
+        if keys:
+            self.client.delete(*keys)
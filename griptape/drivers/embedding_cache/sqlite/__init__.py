@@ -0,0 +1,3 @@
+from griptape.drivers.embedding_cache.sqlite_embedding_cache_driver import SqliteEmbeddingCacheDriver
+
+__all__ = ["SqliteEmbeddingCacheDriver"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+from attrs import Factory, define, field
+
+from griptape.drivers.embedding_cache import BaseEmbeddingCacheDriver
+from griptape.utils.decorators import lazy_property
+
+
+@define(kw_only=True)
+class SqliteEmbeddingCacheDriver(BaseEmbeddingCacheDriver):
+    """An Embedding Cache Driver that persists embeddings to a local SQLite database file.
+
+    Attributes:
+        database_file: The path to the SQLite database file. Created if it does not exist.
+        table_name: The name of the table to store embeddings in.
+    """
+
+    # Older SQLite versions limit statements to 999 parameters.
+    MAX_KEYS_PER_QUERY = 500
+
+    database_file: str = field(metadata={"serializable": True})
+    table_name: str = field(default="griptape_embeddings", metadata={"serializable": True})
+    _connection: sqlite3.Connection | None = field(default=None, alias="connection", metadata={"serializable": False})
+    _lock: threading.Lock = field(default=Factory(threading.Lock), init=False)
+
+    @lazy_property()
+    def connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database_file, check_same_thread=False)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+        )
+        connection.commit()
+
+        return connection
+
+    def load_embeddings(self, keys: list[str]) -> list[list[float] | None]:
+        if not keys:
+            return []
+
+        rows = []
+
+        with self._lock:
+            for i in range(0, len(keys), self.MAX_KEYS_PER_QUERY):
+                keys_chunk = keys[i : i + self.MAX_KEYS_PER_QUERY]
+                rows.extend(
+                    self.connection.execute(
+                        f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({', '.join('?' * len(keys_chunk))})",  # noqa: S608
+                        keys_chunk,
+                    ).fetchall()
+                )
+
+        embeddings = {key: self._bytes_to_embedding(value) for key, value in rows}
+
+        return [embeddings.get(key) for key in keys]
+
+    def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        with self._lock:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding) VALUES (?, ?)",  # noqa: S608
+                [(key, self._embedding_to_bytes(embedding)) for key, embedding in embeddings.items()],
+            )
+            self.connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute(f"DELETE FROM {self.table_name}")  # noqa: S608
+            self.connection.commit()
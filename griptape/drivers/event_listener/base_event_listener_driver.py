@@ -1,49 +1,177 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from attrs import Factory, define, field
 
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
-from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
-from griptape.utils import with_contextvars
+from griptape.utils import QueueDispatcher
+from griptape.utils.deprecation import deprecation_warn
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent import futures
+
     from griptape.events import BaseEvent
 
 logger = logging.getLogger(__name__)
 
+# Drivers are unhashable, so they are keyed by id.
+_event_listener_drivers: weakref.WeakValueDictionary[int, BaseEventListenerDriver] = weakref.WeakValueDictionary()
+
+
+def _flush_event_listener_drivers() -> None:
+    for event_listener_driver in list(_event_listener_drivers.values()):
+        event_listener_driver.flush_events()
+
+
+atexit.register(_flush_event_listener_drivers)
+
+
+@define(frozen=True)
+class EventListenerDriverMetrics:
+    """A snapshot of an Event Listener Driver's publishing metrics.
+
+    Attributes:
+        queue_depth: Number of events that are waiting to be published.
+        published: Number of events that were published.
+        dropped: Number of events that were dropped because the queue was full.
+        failed: Number of events that could not be published after retrying.
+        late: Number of published events that took longer than `late_event_threshold` to publish.
+    """
+
+    queue_depth: int = field()
+    published: int = field()
+    dropped: int = field()
+    failed: int = field()
+    late: int = field()
+
 
 @define
-class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC):
+class BaseEventListenerDriver(ExponentialBackoffMixin, ABC):
+    """Publishes events from a background dispatcher thread, so publishing never waits on the network.
+
+    Attributes:
+        batched: Whether to publish events in batches.
+        batch_size: Maximum number of events in a batch.
+        flush_interval: Maximum number of seconds that a batched event waits for its batch to fill up.
+        max_queue_size: Maximum number of events that can wait to be published.
+        queue_full_policy: What to do with a new event when the queue is full. `block` waits for space in the queue,
+            `drop` discards the event.
+        late_event_threshold: Events that take longer than this many seconds to publish are counted as late.
+        flush_timeout: Maximum number of seconds that `flush_events` waits for queued events to be published.
+        create_futures_executor: Deprecated and unused, events are published by the dispatcher thread.
+        batch: Deprecated, events to publish when the driver is created. Use `publish_event` instead.
+    """
+
     batched: bool = field(default=True, kw_only=True)
     batch_size: int = field(default=10, kw_only=True)
+    flush_interval: float = field(default=1, kw_only=True)
+    max_queue_size: int = field(default=1000, kw_only=True)
+    queue_full_policy: Literal["block", "drop"] = field(default="block", kw_only=True)
+    late_event_threshold: float = field(default=10, kw_only=True)
+    flush_timeout: float | None = field(default=30, kw_only=True)
+    create_futures_executor: Callable[[], futures.Executor] | None = field(default=None, kw_only=True)
+    _initial_batch: list[dict] | None = field(default=None, kw_only=True, alias="batch")
+
+    _pending_events: list[dict] = field(factory=list, init=False)
+    _queue: queue.Queue[tuple[dict, float] | threading.Event] = field(
+        default=Factory(lambda self: queue.Queue(maxsize=self.max_queue_size), takes_self=True), init=False
+    )
+    _dispatcher: QueueDispatcher[tuple[dict, float] | threading.Event] = field(
+        default=Factory(
+            lambda self: QueueDispatcher(
+                self._queue,
+                self.__dispatch,
+                name=f"griptape-{type(self).__name__}-dispatcher",
+                copy_context=True,
+            ),
+            takes_self=True,
+        ),
+        init=False,
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _published_count: int = field(default=0, init=False)
+    _dropped_count: int = field(default=0, init=False)
+    _failed_count: int = field(default=0, init=False)
+    _late_count: int = field(default=0, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.create_futures_executor is not None:
+            deprecation_warn(
+                "`BaseEventListenerDriver.create_futures_executor` is deprecated and unused, events are published by a "
+                "dispatcher thread. This parameter will be removed in a future release."
+            )
 
-    _batch: list[dict] = field(default=Factory(list), kw_only=True)
+        if self._initial_batch is not None:
+            deprecation_warn(
+                "`BaseEventListenerDriver.batch` is deprecated as a parameter, use `publish_event` instead. This "
+                "parameter will be removed in a future release."
+            )
+
+            for event_payload in self._initial_batch:
+                self.publish_event(event_payload)
+            self._initial_batch = None
 
     @property
     def batch(self) -> list[dict]:
-        return self._batch
+        """Events that are waiting to be published."""
+        with self._lock:
+            return self._pending_events.copy()
+
+    @property
+    def metrics(self) -> EventListenerDriverMetrics:
+        with self._lock:
+            return EventListenerDriverMetrics(
+                queue_depth=len(self._pending_events),
+                published=self._published_count,
+                dropped=self._dropped_count,
+                failed=self._failed_count,
+                late=self._late_count,
+            )
 
     def publish_event(self, event: BaseEvent | dict) -> None:
+        """Queues an event to be published by the background dispatcher."""
         event_payload = event if isinstance(event, dict) else event.to_dict()
+        item = (event_payload, time.monotonic())
 
-        with self.create_futures_executor() as futures_executor:
-            if self.batched:
-                self._batch.append(event_payload)
-                if len(self.batch) >= self.batch_size:
-                    futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-                    self._batch = []
-            else:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload), event_payload)
+        with self._lock:
+            self._pending_events.append(event_payload)
+
+        if self.queue_full_policy == "drop":
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                with self._lock:
+                    self._pending_events.remove(event_payload)
+                    self._dropped_count += 1
+
+                logger.warning("Event queue is full, dropping event")
+
+                return
+        else:
+            self._queue.put(item)
+
+        self.__start_dispatcher()
 
     def flush_events(self) -> None:
-        if self.batch:
-            with self.create_futures_executor() as futures_executor:
-                futures_executor.submit(with_contextvars(self._safe_publish_event_payload_batch), self.batch)
-            self._batch = []
+        """Publishes every queued event, and waits for them to be published. Safe to call from any thread."""
+        if not self._dispatcher.is_running and self._queue.empty():
+            return
+
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        self.__start_dispatcher()
+
+        if not flushed.wait(self.flush_timeout):
+            logger.warning("Timed out after %s seconds waiting for events to be published", self.flush_timeout)
 
     @abstractmethod
     def try_publish_event_payload(self, event_payload: dict) -> None:
@@ -53,7 +181,7 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
         pass
 
-    def _safe_publish_event_payload(self, event_payload: dict) -> None:
+    def _safe_publish_event_payload(self, event_payload: dict) -> bool:
         try:
             for attempt in self.retrying():
                 with attempt:
@@ -61,10 +189,77 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC
         except Exception:
             logger.warning("Failed to publish event after %s attempts", self.max_attempts, exc_info=True)
 
-    def _safe_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
+            return False
+
+        return True
+
+    def _safe_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> bool:
         try:
             for attempt in self.retrying():
                 with attempt:
                     self.try_publish_event_payload_batch(event_payload_batch)
         except Exception:
             logger.warning("Failed to publish event batch after %s attempts", self.max_attempts, exc_info=True)
+
+            return False
+
+        return True
+
+    def __start_dispatcher(self) -> None:
+        if self._dispatcher.start():
+            _event_listener_drivers[id(self)] = self
+
+    def __dispatch(self) -> None:
+        event_payload_batch: list[dict] = []
+        queued_at: list[float] = []
+        batch_deadline: float | None = None
+
+        while True:
+            if batch_deadline is None:
+                item = self._dispatcher.get()
+
+                if item is None:
+                    return
+            else:
+                try:
+                    item = self._queue.get(timeout=max(0, batch_deadline - time.monotonic()))
+                except queue.Empty:
+                    item = None
+
+            if isinstance(item, tuple):
+                event_payload, enqueued_at = item
+
+                event_payload_batch.append(event_payload)
+                queued_at.append(enqueued_at)
+
+                if batch_deadline is None:
+                    batch_deadline = enqueued_at + self.flush_interval
+                if self.batched and len(queued_at) < self.batch_size and time.monotonic() < batch_deadline:
+                    continue
+
+            if event_payload_batch:
+                self.__publish_batch(event_payload_batch, queued_at)
+                event_payload_batch = []
+                queued_at = []
+                batch_deadline = None
+
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def __publish_batch(self, event_payload_batch: list[dict], queued_at: list[float]) -> None:
+        if self.batched:
+            published = self._safe_publish_event_payload_batch(event_payload_batch)
+        else:
+            published = self._safe_publish_event_payload(event_payload_batch[0])
+
+        now = time.monotonic()
+
+        with self._lock:
+            for event_payload in event_payload_batch:
+                self._pending_events.remove(event_payload)
+
+            if published:
+                self._published_count += len(event_payload_batch)
+                self._late_count += sum(now - t > self.late_event_threshold for t in queued_at)
+            else:
+                self._failed_count += len(event_payload_batch)
@@ -20,6 +20,7 @@ class GriptapeCloudEventListenerDriver(BaseEventListenerDriver):
         api_key: The API key to authenticate with Griptape Cloud.
         headers: The headers to use when making requests to Griptape Cloud. Defaults to include the Authorization header.
         structure_run_id: The ID of the Structure Run to publish events to. Defaults to the GT_CLOUD_STRUCTURE_RUN_ID environment variable.
+        requests_session: The session used to publish events, which keeps connections to Griptape Cloud alive between requests.
     """
 
     base_url: str = field(
@@ -32,6 +33,7 @@ class GriptapeCloudEventListenerDriver(BaseEventListenerDriver):
         kw_only=True,
     )
     structure_run_id: str | None = field(default=Factory(lambda: os.getenv("GT_CLOUD_STRUCTURE_RUN_ID")), kw_only=True)
+    requests_session: requests.Session = field(default=Factory(requests.Session), kw_only=True)
 
     @structure_run_id.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
     def validate_run_id(self, _: Attribute, structure_run_id: str | None) -> None:
@@ -76,7 +78,7 @@ class GriptapeCloudEventListenerDriver(BaseEventListenerDriver):
         }
 
     def _post_event(self, json: list[dict] | dict) -> None:
-        requests.post(
+        self.requests_session.post(
             url=griptape_cloud_url(self.base_url, f"api/structure-runs/{self.structure_run_id}/events"),
             json=json,
             headers=self.headers,
@@ -28,6 +28,13 @@ class BaseObservabilityDriver(ABC):
     def observe(self, call: Observable.Call) -> Any:
         pass
 
+    async def aobserve(self, call: Observable.Call) -> Any:
+        """Observes a call to a coroutine function.
+
+        Drivers that trace calls should override this, since `observe` can not wait for the coroutine to finish.
+        """
+        return await call()
+
     @abstractmethod
     def get_span_id(self) -> str | None:
         pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Literal
 
@@ -32,7 +33,7 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.rules.json_schema_rule import JsonSchemaRule
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     from griptape.tokenizers import BaseTokenizer
 
@@ -99,6 +100,27 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
                 return result
         raise Exception("prompt driver failed after all retry attempts")
 
+    @observable(tags=["PromptDriver.arun()"])
+    async def arun(self, prompt_input: PromptStack | BaseArtifact) -> Message:
+        """Asynchronous version of `run`, with the same retries and events."""
+        if isinstance(prompt_input, BaseArtifact):
+            prompt_stack = PromptStack.from_artifact(prompt_input)
+        else:
+            prompt_stack = prompt_input
+
+        async for attempt in self.aretrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                result = (
+                    await self.__aprocess_stream(prompt_stack) if self.stream else await self.atry_run(prompt_stack)
+                )
+
+                self.after_run(result)
+
+                return result
+        raise Exception("prompt driver failed after all retry attempts")
+
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model prompt_input.
 
@@ -133,6 +155,23 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
         pass
 
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        """Asynchronous version of `try_run`.
+
+        Drivers with an async client should override this. By default, `try_run` is run in a worker thread.
+        """
+        return await asyncio.to_thread(self.try_run, prompt_stack)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Asynchronous version of `try_stream`.
+
+        Drivers with an async client should override this. By default, `try_stream` is iterated in a worker thread.
+        """
+        message_deltas = await asyncio.to_thread(self.try_stream, prompt_stack)
+
+        while (message_delta := await asyncio.to_thread(next, message_deltas, None)) is not None:
+            yield message_delta
+
     def _init_structured_output(self, prompt_stack: PromptStack) -> None:
         from griptape.tools import StructuredOutputTool
 
@@ -171,32 +210,50 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # Aggregate all content deltas from the stream
         message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
-                elif isinstance(content, AudioDeltaMessageContent) and content.data is not None:
-                    EventBus.publish_event(AudioChunkEvent(data=content.data))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    EventBus.publish_event(
-                        ActionChunkEvent(
-                            partial_input=content.partial_input,
-                            tag=content.tag,
-                            name=content.name,
-                            path=content.path,
-                            index=content.index,
-                        ),
-                    )
+            usage += self.__process_message_delta(message_delta, delta_contents)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
 
+    async def __aprocess_stream(self, prompt_stack: PromptStack) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.atry_stream(prompt_stack):
+            usage += self.__process_message_delta(message_delta, delta_contents)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __process_message_delta(
+        self, message_delta: DeltaMessage, delta_contents: dict[int, list[BaseDeltaMessageContent]]
+    ) -> DeltaMessage.Usage:
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            # Chunk events are published per token, so they are only created if a listener handles them.
+            if isinstance(content, TextDeltaMessageContent):
+                if EventBus.has_event_listeners(TextChunkEvent):
+                    EventBus.publish_event(TextChunkEvent(token=content.text, index=content.index))
+            elif isinstance(content, AudioDeltaMessageContent) and content.data is not None:
+                if EventBus.has_event_listeners(AudioChunkEvent):
+                    EventBus.publish_event(AudioChunkEvent(data=content.data))
+            elif isinstance(content, ActionCallDeltaMessageContent) and EventBus.has_event_listeners(ActionChunkEvent):
+                EventBus.publish_event(
+                    ActionChunkEvent(
+                        partial_input=content.partial_input,
+                        tag=content.tag,
+                        name=content.name,
+                        path=content.path,
+                        index=content.index,
+                    ),
+                )
+
+        return message_delta.usage
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
@@ -1,34 +1,144 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent import futures
 from typing import TYPE_CHECKING
 
 from attrs import Attribute, Factory, define, field
 
 from griptape.artifacts import TextArtifact
-from griptape.common import DeltaMessage, Message, PromptStack, TextMessageContent, observable
+from griptape.common import (
+    DeltaMessage,
+    Message,
+    PromptStack,
+    TextDeltaMessageContent,
+    TextMessageContent,
+    observable,
+)
 from griptape.configs import Defaults
 from griptape.drivers.prompt import BasePromptDriver
 from griptape.tokenizers import HuggingFaceTokenizer
 from griptape.utils import import_optional_dependency
+from griptape.utils.contextvars_utils import with_contextvars
 from griptape.utils.decorators import lazy_property
+from griptape.utils.micro_batcher import MicroBatcher
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from transformers import TextIteratorStreamer
     from transformers.pipelines.text_generation import TextGenerationPipeline
 
     from griptape.drivers.prompt.base_prompt_driver import StructuredOutputStrategy
 
 logger = logging.getLogger(Defaults.logging_config.logger_name)
 
+# Pipelines are loaded once per process, and shared by every driver that loads and batches them the same way.
+_batched_pipelines: dict[tuple[str, str, int, float], _BatchedPipeline] = {}
+_batched_pipelines_lock = threading.Lock()
+
+
+def _batched_pipeline_key(
+    model: str, tokenizer: HuggingFaceTokenizer, max_batch_size: int, max_wait: float
+) -> tuple[str, str, int, float]:
+    return model, tokenizer.model, max_batch_size, max_wait
+
+
+def _load_batched_pipeline(
+    model: str, tokenizer: HuggingFaceTokenizer, max_batch_size: int, max_wait: float
+) -> _BatchedPipeline:
+    key = _batched_pipeline_key(model, tokenizer, max_batch_size, max_wait)
+
+    with _batched_pipelines_lock:
+        if key not in _batched_pipelines:
+            pipeline = import_optional_dependency("transformers").pipeline(
+                task="text-generation", model=model, tokenizer=tokenizer.tokenizer
+            )
+
+            _batched_pipelines[key] = _BatchedPipeline(pipeline, max_batch_size=max_batch_size, max_wait=max_wait)
+
+        return _batched_pipelines[key]
+
+
+@define(eq=False)
+class _BatchedPipeline:
+    """Generates prompts that are submitted concurrently in batches, one per set of generation params.
+
+    Streamed prompts aren't batched, but are generated one at a time with the batches, so that generation never overlaps.
+    """
+
+    pipeline: TextGenerationPipeline = field()
+    max_batch_size: int = field(kw_only=True)
+    max_wait: float = field(kw_only=True)
+    _micro_batcher: MicroBatcher[tuple[list[dict], dict], list | Exception] = field(
+        default=Factory(
+            lambda self: MicroBatcher(self._generate, max_batch_size=self.max_batch_size, max_wait=self.max_wait),
+            takes_self=True,
+        ),
+        init=False,
+    )
+    _generate_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def generate(self, messages: list[dict], params: dict) -> list:
+        result = self._micro_batcher.submit((messages, params)).result()
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def stream(self, messages: list[dict], params: dict, streamer: TextIteratorStreamer) -> list:
+        with self._generate_lock:
+            return self.pipeline(messages, streamer=streamer, **params)
+
+    def _generate(self, requests: list[tuple[list[dict], dict]]) -> list[list | Exception]:
+        groups: dict[str, list[int]] = {}
+        for i, (_, params) in enumerate(requests):
+            groups.setdefault(repr(sorted(params.items())), []).append(i)
+
+        results: list[list | Exception] = [[] for _ in requests]
+        for indexes in groups.values():
+            params = requests[indexes[0]][1]
+
+            # A failing group doesn't fail the requests of other groups.
+            try:
+                with self._generate_lock:
+                    if len(indexes) == 1:
+                        outputs = [self.pipeline(requests[indexes[0]][0], **params)]
+                    else:
+                        self.__prepare_padding()
+                        outputs = self.pipeline([requests[i][0] for i in indexes], batch_size=len(indexes), **params)
+            except Exception as e:
+                outputs = [e] * len(indexes)
+
+            for i, output in zip(indexes, outputs, strict=True):
+                results[i] = output
+
+        return results
+
+    def __prepare_padding(self) -> None:
+        tokenizer = self.pipeline.tokenizer
+
+        if tokenizer is not None:
+            # Decoder-only models generate after the last token, so prompts are padded on the left.
+            tokenizer.padding_side = "left"
+
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+
 
 @define
 class HuggingFacePipelinePromptDriver(BasePromptDriver):
     """Hugging Face Pipeline Prompt Driver.
 
+    Drivers with the same model, tokenizer model, batch size, and max batch wait share one pipeline. Prompts that are run concurrently, for example by the Tasks of a
+    Workflow, are coalesced into batches, so that prompts with the same generation params are generated together.
+
     Attributes:
         model: Hugging Face Hub model name.
+        batch_size: The maximum number of prompts in a batch.
+        max_batch_wait: The maximum number of seconds that a batch waits for more prompts.
+        pipeline: Custom Transformers text generation pipeline.
     """
 
     max_tokens: int = field(default=250, kw_only=True, metadata={"serializable": True})
@@ -43,9 +153,12 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
     structured_output_strategy: StructuredOutputStrategy = field(
         default="rule", kw_only=True, metadata={"serializable": True}
     )
+    batch_size: int = field(default=8, kw_only=True)
+    max_batch_wait: float = field(default=0.01, kw_only=True, metadata={"serializable": True})
     _pipeline: TextGenerationPipeline | None = field(
         default=None, kw_only=True, alias="pipeline", metadata={"serializable": False}
     )
+    _batched_pipeline: _BatchedPipeline | None = field(default=None, init=False)
 
     @structured_output_strategy.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
     def validate_structured_output_strategy(self, _: Attribute, value: str) -> str:
@@ -56,12 +169,7 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
 
     @lazy_property()
     def pipeline(self) -> TextGenerationPipeline:
-        return import_optional_dependency("transformers").pipeline(
-            task="text-generation",
-            model=self.model,
-            max_new_tokens=self.max_tokens,
-            tokenizer=self.tokenizer.tokenizer,
-        )
+        return _load_batched_pipeline(self.model, self.tokenizer, self.batch_size, self.max_batch_wait).pipeline
 
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
@@ -74,7 +182,7 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
             )
         )
 
-        result = self.pipeline(messages, **full_params)
+        result = self.__get_batched_pipeline().generate(messages, full_params)
         logger.debug(result)
 
         if isinstance(result, list):
@@ -94,7 +202,44 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
-        raise NotImplementedError("streaming is not supported")
+        messages = self._prompt_stack_to_messages(prompt_stack)
+        full_params = self._base_params(prompt_stack)
+        logger.debug(
+            (
+                messages,
+                full_params,
+            )
+        )
+
+        # Streamers only support a batch size of one, so streamed prompts aren't batched.
+        batched_pipeline = self.__get_batched_pipeline()
+        streamer = import_optional_dependency("transformers").TextIteratorStreamer(
+            self.tokenizer.tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        result: futures.Future = futures.Future()
+
+        def generate() -> None:
+            try:
+                result.set_result(batched_pipeline.stream(messages, full_params, streamer))
+            except Exception as e:
+                # Ends the stream, so that the error is raised instead of waiting for more text.
+                streamer.end()
+                result.set_exception(e)
+
+        threading.Thread(target=with_contextvars(generate), daemon=True).start()
+
+        generated_text = ""
+        for text in streamer:
+            if text:
+                generated_text += text
+                yield DeltaMessage(content=TextDeltaMessageContent(text))
+
+        logger.debug(result.result())
+
+        input_tokens = len(self.__prompt_stack_to_tokens(prompt_stack))
+        output_tokens = len(self.tokenizer.tokenizer.encode(generated_text))  # pyright: ignore[reportArgumentType]
+
+        yield DeltaMessage(usage=DeltaMessage.Usage(input_tokens=input_tokens, output_tokens=output_tokens))
 
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         return self.tokenizer.tokenizer.decode(self.__prompt_stack_to_tokens(prompt_stack))  # pyright: ignore[reportArgumentType]
@@ -115,6 +260,22 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
 
         return messages
 
+    def __get_batched_pipeline(self) -> _BatchedPipeline:
+        if self._batched_pipeline is None:
+            pipeline = self.pipeline
+            shared_pipeline = _batched_pipelines.get(
+                _batched_pipeline_key(self.model, self.tokenizer, self.batch_size, self.max_batch_wait)
+            )
+
+            if shared_pipeline is not None and shared_pipeline.pipeline is pipeline:
+                self._batched_pipeline = shared_pipeline
+            else:
+                self._batched_pipeline = _BatchedPipeline(
+                    pipeline, max_batch_size=self.batch_size, max_wait=self.max_batch_wait
+                )
+
+        return self._batched_pipeline
+
     def __prompt_stack_to_tokens(self, prompt_stack: PromptStack) -> list[int]:
         messages = self._prompt_stack_to_messages(prompt_stack)
         tokens = self.tokenizer.tokenizer.apply_chat_template(messages, add_generation_prompt=True, tokenize=True)
@@ -32,9 +32,9 @@ from griptape.utils.decorators import lazy_property
 logger = logging.getLogger(Defaults.logging_config.logger_name)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from ollama import ChatResponse, Client
+    from ollama import AsyncClient, ChatResponse, Client
 
     from griptape.tokenizers.base_tokenizer import BaseTokenizer
     from griptape.tools import BaseTool
@@ -49,6 +49,9 @@ class OllamaPromptDriver(BasePromptDriver):
         host: Optional Ollama host URL.
         api_key: Optional API key forwarded to ``ollama.Client`` (Authorization header).
         headers: Optional extra HTTP headers for auth reverse proxies.
+        client: Custom `ollama.Client`. If it is set without `async_client`, the async methods run it in a worker
+            thread.
+        async_client: Custom `ollama.AsyncClient`, used by the async methods.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
@@ -79,15 +82,23 @@ class OllamaPromptDriver(BasePromptDriver):
     )
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _client: Client | None = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncClient | None = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
+    _has_custom_sync_client: bool = field(default=False, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        # A custom client can have settings, like an HTTP client or credentials, that an async client built from the
+        # driver's attributes wouldn't, so the async methods run it in a worker thread instead.
+        self._has_custom_sync_client = self._client is not None and self._async_client is None
 
     @lazy_property()
     def client(self) -> Client:
-        client_kwargs: dict[str, Any] = {"host": self.host}
-        if self.headers is not None:
-            client_kwargs["headers"] = self.headers
-        if self.api_key is not None:
-            client_kwargs["api_key"] = self.api_key
-        return import_optional_dependency("ollama").Client(**client_kwargs)
+        return import_optional_dependency("ollama").Client(**self._client_kwargs())
+
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("ollama").AsyncClient(**self._client_kwargs())
 
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
@@ -118,6 +129,51 @@ class OllamaPromptDriver(BasePromptDriver):
                 tool_index += 1
             yield DeltaMessage(content=message_content)
 
+    @observable
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        if self._has_custom_sync_client:
+            return await super().atry_run(prompt_stack)
+
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        response = await self.async_client.chat(**params)
+        logger.debug(response.model_dump())
+
+        return Message(
+            content=self.__to_prompt_stack_message_content(response),
+            role=Message.ASSISTANT_ROLE,
+        )
+
+    @observable
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        if self._has_custom_sync_client:
+            async for message_delta in super().atry_stream(prompt_stack):
+                yield message_delta
+            return
+
+        params = {**self._base_params(prompt_stack), "stream": True}
+        logger.debug(params)
+        stream: AsyncIterator = await self.async_client.chat(**params)
+
+        tool_index = 0
+        async for chunk in stream:
+            logger.debug(chunk)
+            message_content = self.__to_prompt_stack_delta_message_content(chunk)
+            # See try_stream for why the Tool call index is tracked here.
+            if isinstance(message_content, ActionCallDeltaMessageContent):
+                message_content.index = tool_index
+                tool_index += 1
+            yield DeltaMessage(content=message_content)
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        client_kwargs: dict[str, Any] = {"host": self.host}
+        if self.headers is not None:
+            client_kwargs["headers"] = self.headers
+        if self.api_key is not None:
+            client_kwargs["api_key"] = self.api_key
+
+        return client_kwargs
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         messages = self._prompt_stack_to_messages(prompt_stack)
 
@@ -35,7 +35,7 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     import openai
     from openai import Stream
@@ -59,7 +59,9 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         base_url: An optional OpenAi API URL.
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
-        client: An `openai.OpenAI` client.
+        client: An `openai.OpenAI` client. If it is set without `async_client`, the async methods run it in a worker
+            thread.
+        async_client: An `openai.AsyncOpenAI` client, used by the async methods.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -102,6 +104,15 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         default=Factory(lambda: {"voice": "alloy", "format": "pcm16"}), kw_only=True, metadata={"serializable": True}
     )
     _client: openai.OpenAI | None = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: openai.AsyncOpenAI | None = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
+    _has_custom_sync_client: bool = field(default=False, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        # A custom client can have settings, like an HTTP client or credentials, that an async client built from the
+        # driver's attributes wouldn't, so the async methods run it in a worker thread instead.
+        self._has_custom_sync_client = self._client is not None and self._async_client is None
 
     def _default_ignored_exception_types(self) -> tuple[type[Exception], ...]:
         """Lazily import openai and return default exception types.
@@ -128,6 +139,15 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             organization=self.organization,
         )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncOpenAI:
+        openai = import_optional_dependency("openai")
+        return openai.AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            organization=self.organization,
+        )
+
     @property
     def supports_stop_sequences(self) -> bool:
         return not (self.model.startswith("o") or self.model.startswith("gpt-5"))
@@ -161,6 +181,33 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
         return self._to_delta_message_stream(result)
 
+    @observable
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        if self._has_custom_sync_client:
+            return await super().atry_run(prompt_stack)
+
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        result = await self.async_client.chat.completions.create(**params)
+
+        logger.debug(result.model_dump())
+        return self._to_message(result)
+
+    @observable
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        if self._has_custom_sync_client:
+            async for message_delta in super().atry_stream(prompt_stack):
+                yield message_delta
+            return
+
+        params = self._base_params(prompt_stack)
+        logger.debug({"stream": True, **params})
+        result = await self.async_client.chat.completions.create(**params, stream=True)
+
+        async for message in result:
+            for delta_message in self._to_delta_messages(message):
+                yield delta_message
+
     def _to_message(self, result: ChatCompletion) -> Message:
         if len(result.choices) == 1:
             choice_message = result.choices[0].message
@@ -180,21 +227,24 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
     def _to_delta_message_stream(self, result: Stream[ChatCompletionChunk]) -> Iterator[DeltaMessage]:
         for message in result:
-            if message.usage is not None:
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(
-                        input_tokens=message.usage.prompt_tokens,
-                        output_tokens=message.usage.completion_tokens,
-                    ),
-                )
-            if message.choices:
-                choice = message.choices[0]
-                delta = choice.delta
+            yield from self._to_delta_messages(message)
+
+    def _to_delta_messages(self, message: ChatCompletionChunk) -> Iterator[DeltaMessage]:
+        if message.usage is not None:
+            yield DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=message.usage.prompt_tokens,
+                    output_tokens=message.usage.completion_tokens,
+                ),
+            )
+        if message.choices:
+            choice = message.choices[0]
+            delta = choice.delta
 
-                content = self.__to_prompt_stack_delta_message_content(delta)
+            content = self.__to_prompt_stack_delta_message_content(delta)
 
-                if content is not None:
-                    yield DeltaMessage(content=content)
+            if content is not None:
+                yield DeltaMessage(content=content)
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = {
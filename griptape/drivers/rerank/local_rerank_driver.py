@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class LocalRerankDriver(BaseRerankDriver, FuturesExecutorMixin):
+    FUTURES_EXECUTOR_POOL = "rerank"
+
     calculate_relatedness: Callable = field(
         default=Factory(lambda self: self._default_cosine_similarity, takes_self=True)
     )
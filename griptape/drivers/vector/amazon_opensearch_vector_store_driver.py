@@ -58,3 +58,9 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
         return response["_id"]
+
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        if self.service == "aoss":
+            # OpenSearch Serverless generates document ids itself.
+            return {"index": {"_index": self.index_name}}
+        return super()._bulk_index_action(vector_id)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import uuid
 import warnings
 from abc import ABC, abstractmethod
@@ -20,9 +21,12 @@ if TYPE_CHECKING:
 @define
 class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     DEFAULT_QUERY_COUNT = 5
+    FUTURES_EXECUTOR_POOL = "vector_store"
 
     @define
     class Entry(SerializableMixin):
+        COMPILED_SERIALIZATION = True
+
         id: str = field(metadata={"serializable": True})
         vector: list[float] | None = field(default=None, metadata={"serializable": True})
         score: float | None = field(default=None, metadata={"serializable": True})
@@ -108,28 +112,86 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta: dict | None = None,
         **kwargs,
     ):
-        with self.create_futures_executor() as futures_executor:
-            if isinstance(artifacts, list):
-                return utils.execute_futures_list(
-                    [
-                        futures_executor.submit(with_contextvars(self.upsert), a, namespace=None, meta=meta, **kwargs)
-                        for a in artifacts
-                    ],
-                )
-            futures_dict = {}
+        if type(self).upsert is not BaseVectorStoreDriver.upsert:
+            # Drivers with a custom `upsert` can't be batched through `upsert_vectors`.
+            return self._upsert_collection_individually(artifacts, meta=meta, **kwargs)
 
-            for namespace, artifact_list in artifacts.items():
-                for a in artifact_list:
-                    if not futures_dict.get(namespace):
-                        futures_dict[namespace] = []
+        batch_size = max(self.embedding_driver.batch_size, 1)
 
-                    futures_dict[namespace].append(
-                        futures_executor.submit(
-                            with_contextvars(self.upsert), a, namespace=namespace, meta=meta, **kwargs
+        with self.create_futures_executor() as futures_executor:
+            if isinstance(artifacts, list):
+                return list(
+                    itertools.chain.from_iterable(
+                        utils.execute_futures_list(
+                            [
+                                futures_executor.submit(
+                                    with_contextvars(self.upsert_batch),
+                                    artifacts[i : i + batch_size],
+                                    namespace=None,
+                                    meta=meta,
+                                    **kwargs,
+                                )
+                                for i in range(0, len(artifacts), batch_size)
+                            ]
                         )
                     )
+                )
 
-            return utils.execute_futures_list_dict(futures_dict)
+            futures_dict = {
+                namespace: [
+                    futures_executor.submit(
+                        with_contextvars(self.upsert_batch),
+                        artifact_list[i : i + batch_size],
+                        namespace=namespace,
+                        meta=meta,
+                        **kwargs,
+                    )
+                    for i in range(0, len(artifact_list), batch_size)
+                ]
+                for namespace, artifact_list in artifacts.items()
+                if artifact_list
+            }
+
+            return {
+                namespace: list(itertools.chain.from_iterable(ids))
+                for namespace, ids in utils.execute_futures_list_dict(futures_dict).items()
+            }
+
+    def upsert_batch(
+        self,
+        values: list[str | TextArtifact | ImageArtifact] | list[TextArtifact] | list[ImageArtifact],
+        *,
+        namespace: str | None = None,
+        meta: dict | None = None,
+        **kwargs,
+    ) -> list[str]:
+        """Embeds multiple values with a single batch embedding call and upserts them with `upsert_vectors`.
+
+        Args:
+            values: The values to upsert.
+            namespace: An optional namespace for the values.
+            meta: Optional metadata added to every value.
+            kwargs: Additional keyword arguments passed to `upsert_vectors`.
+
+        Returns:
+            The vector ids, in the same order as `values`.
+        """
+        artifacts = [TextArtifact(value) if isinstance(value, str) else value for value in values]
+        vectors = self.embedding_driver.embed_batch(artifacts, vector_operation="upsert")
+
+        entries = [
+            BaseVectorStoreDriver.Entry(
+                id=self._get_default_vector_id(
+                    artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+                ),
+                vector=vector,
+                meta={**(meta or {}), "artifact": artifact.to_json()},
+                namespace=namespace,
+            )
+            for artifact, vector in zip(artifacts, vectors, strict=True)
+        ]
+
+        return self.upsert_vectors(entries, **kwargs)
 
     def upsert(
         self,
@@ -154,6 +216,26 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
 
         return self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
 
+    def upsert_vectors(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors.
+
+        Drivers whose store supports bulk writes should override this method, the default implementation calls
+        `upsert_vector` for each entry.
+
+        Args:
+            entries: The entries to upsert. `Entry.score` is ignored.
+            kwargs: Additional keyword arguments passed to each write.
+
+        Returns:
+            The vector ids, in the same order as `entries`.
+        """
+        return [
+            self.upsert_vector(
+                entry.vector or [], vector_id=entry.id, namespace=entry.namespace, meta=entry.meta, **kwargs
+            )
+            for entry in entries
+        ]
+
     def does_entry_exist(self, vector_id: str, *, namespace: str | None = None) -> bool:
         try:
             return self.load_entry(vector_id, namespace=namespace) is not None
@@ -222,5 +304,38 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             ) from e
         return self.query_vector(vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
 
+    def _upsert_collection_individually(
+        self,
+        artifacts: list[TextArtifact]
+        | list[ImageArtifact]
+        | dict[str, list[TextArtifact]]
+        | dict[str, list[ImageArtifact]],
+        *,
+        meta: dict | None = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        with self.create_futures_executor() as futures_executor:
+            if isinstance(artifacts, list):
+                return utils.execute_futures_list(
+                    [
+                        futures_executor.submit(with_contextvars(self.upsert), a, namespace=None, meta=meta, **kwargs)
+                        for a in artifacts
+                    ],
+                )
+            futures_dict = {}
+
+            for namespace, artifact_list in artifacts.items():
+                for a in artifact_list:
+                    if not futures_dict.get(namespace):
+                        futures_dict[namespace] = []
+
+                    futures_dict[namespace].append(
+                        futures_executor.submit(
+                            with_contextvars(self.upsert), a, namespace=namespace, meta=meta, **kwargs
+                        )
+                    )
+
+            return utils.execute_futures_list_dict(futures_dict)
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
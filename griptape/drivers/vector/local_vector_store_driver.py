@@ -4,7 +4,7 @@ import json
 import operator
 import os
 import threading
-from typing import TYPE_CHECKING, NoReturn, TextIO
+from typing import TYPE_CHECKING, Literal, NoReturn, TextIO
 
 from attrs import Factory, define, field
 
@@ -13,16 +13,113 @@ from griptape.drivers.vector import BaseVectorStoreDriver
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import BinaryIO
+
+    import numpy as np
+
+
+@define
+class _NamespaceMatrixIndex:
+    """Contiguous float32 matrix of L2-normalized vectors for a single namespace.
+
+    Rows are preallocated in doubling chunks so that appends are amortized O(1). `sequences` records the
+    insertion order of each row across all namespaces and is used to break score ties.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    keys: list[str] = field(factory=list)
+    positions: dict[str, int] = field(factory=dict)
+    matrix: np.ndarray | None = field(default=None)
+    sequences: np.ndarray | None = field(default=None)
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+    @property
+    def rows(self) -> np.ndarray:
+        import numpy as np
+
+        return self.matrix[: self.size] if self.matrix is not None else np.empty((0, 0), dtype=np.float32)
+
+    @property
+    def row_sequences(self) -> np.ndarray:
+        import numpy as np
+
+        return self.sequences[: self.size] if self.sequences is not None else np.empty(0, dtype=np.int64)
+
+    def upsert(self, key: str, vector: list[float], sequence: int) -> None:
+        import numpy as np
+
+        row = _normalize(np.asarray(vector, dtype=np.float32))
+
+        if self.matrix is None or self.sequences is None:
+            self.matrix = np.empty((self.INITIAL_CAPACITY, row.shape[0]), dtype=np.float32)
+            self.sequences = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        elif row.shape[0] != self.matrix.shape[1]:
+            raise ValueError(f"Vector dimension {row.shape[0]} does not match index dimension {self.matrix.shape[1]}.")
+
+        position = self.positions.get(key)
+
+        if position is None:
+            position = self.size
+
+            if position == self.matrix.shape[0]:
+                self.matrix = np.concatenate([self.matrix, np.empty_like(self.matrix)])
+                self.sequences = np.concatenate([self.sequences, np.empty_like(self.sequences)])
+
+            self.keys.append(key)
+            self.positions[key] = position
+            self.sequences[position] = sequence
+
+        self.matrix[position] = row
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    from numpy.linalg import norm
+
+    vector_norm = norm(vector)
+
+    return vector / vector_norm if vector_norm > 0 else vector
 
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """Vector Store Driver that keeps entries in memory and optionally persists them to a local file.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id.
+        persist_file: Optional path of the file entries are persisted to.
+        persist_format: On-disk format of `persist_file`. `json` rewrites a single JSON document on every upsert.
+            `log` appends one JSON line per upsert and periodically compacts the file. Existing `json` files are
+            migrated to the `log` format when loaded with `persist_format="log"`.
+        persist_vectors_file: Optional path of a raw float32 sidecar file that vectors are appended to when
+            `persist_format` is `log`. Vectors are stored with float32 precision when set. Compaction alternates
+            between this path and the same path with a `.1` suffix; the log file's header names the current one.
+        compaction_ratio: Compact the `log` file once it holds this many records per live entry.
+        calculate_relatedness: Function used to score an entry's vector against a query vector.
+        use_matrix_index: Whether queries using the default cosine similarity run against a vectorized matrix index.
+    """
+
+    LOG_FORMAT_HEADER = {"format": "griptape-local-vector-store-log", "version": 1}
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
     persist_file: str | None = field(default=None)
+    persist_format: Literal["json", "log"] = field(default="json")
+    persist_vectors_file: str | None = field(default=None)
+    compaction_ratio: float = field(default=2.0)
     calculate_relatedness: Callable = field(
         default=Factory(lambda self: self._default_cosine_similarity, takes_self=True)
     )
     thread_lock: threading.Lock = field(default=Factory(threading.Lock))
+    use_matrix_index: bool = field(default=True)
+    _matrix_indexes: dict[str | None, _NamespaceMatrixIndex] | None = field(default=None, init=False)
+    _matrix_indexed_entries: dict[str, BaseVectorStoreDriver.Entry] | None = field(default=None, init=False)
+    _matrix_index_sequence: int = field(default=0, init=False)
+    _persisted_record_count: int = field(default=0, init=False)
+    _log_file_is_torn: bool = field(default=False, init=False)
+    _vectors_file: str | None = field(default=None, init=False)
 
     @staticmethod
     def _default_cosine_similarity(x: list[float], y: list[float]) -> float:
@@ -39,6 +136,10 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
+            if self.persist_format == "log":
+                self.__load_or_create_log_file(self.persist_file)
+                return
+
             if not os.path.isfile(self.persist_file):
                 with open(self.persist_file, "w") as file:
                     self.__save_entries_to_file(file)
@@ -55,6 +156,66 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
 
             return {k: BaseVectorStoreDriver.Entry.from_dict(v) for k, v in data.items()}
 
+    def load_entries_from_log_file(self, log_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
+        """Replays an append-only log file, keeping the latest record for each key.
+
+        Records are turned into `Entry`s directly rather than through `Entry.from_dict` to keep startup fast.
+        Torn records, e.g. from an interrupted write, are ignored, and the log file is rewritten without them when
+        loaded by the driver.
+        """
+        entries = {}
+        record_count = 0
+
+        with self.thread_lock:
+            header_line = log_file.readline()
+            header = self.__parse_log_file_header(header_line)
+
+            if header is None:
+                raise ValueError(f"Unsupported log file header: {header_line.strip()}")
+
+            self._vectors_file = self.__resolve_vectors_file(header.get("vectors_file"))
+            vectors = self.__load_vectors_file()
+            self._log_file_is_torn = False
+
+            for line in log_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self._log_file_is_torn = True
+                    continue
+
+                if not line.endswith("\n"):
+                    self._log_file_is_torn = True
+
+                if "vector_offset" in record:
+                    if vectors is None:
+                        raise ValueError("persist_vectors_file is required to load vectors stored in a sidecar file.")
+
+                    offset = record["vector_offset"]
+                    vector = vectors[offset : offset + record["vector_length"]].tolist()
+                else:
+                    vector = record.get("vector")
+
+                entries[record["key"]] = BaseVectorStoreDriver.Entry(
+                    id=record["id"],
+                    vector=vector,
+                    meta=record.get("meta"),
+                    namespace=record.get("namespace"),
+                )
+                record_count += 1
+
+            self._persisted_record_count = record_count
+
+        return entries
+
+    def compact(self) -> None:
+        """Rewrites the `log` persist file so that it only holds the latest record for each entry."""
+        if self.persist_file is None or self.persist_format != "log":
+            return
+
+        with self.thread_lock:
+            self.__write_log_file(self.persist_file, self.entries)
+
     def upsert_vector(
         self,
         vector: list[float],
@@ -66,21 +227,47 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         vector_id = vector_id or utils.str_to_hash(str(vector))
 
+        return self.upsert_vectors([self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace)])[0]
+
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        vector_ids = []
+        keys = []
+
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            for entry in entries:
+                vector = entry.vector or []
+                vector_id = entry.id or utils.str_to_hash(str(vector))
+                key = self.__namespaced_vector_id(vector_id, namespace=entry.namespace)
 
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
+                self.entries[key] = self.Entry(
+                    id=vector_id,
+                    vector=vector,
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                )
+
+                if self._matrix_indexes is not None:
+                    try:
+                        self._matrix_indexes.setdefault(entry.namespace, _NamespaceMatrixIndex()).upsert(
+                            key, vector, self._matrix_index_sequence
+                        )
+                        self._matrix_index_sequence += 1
+                    except ValueError:
+                        # Mixed dimensions can't live in one matrix; drop the index and rebuild it on the next query.
+                        self._matrix_indexes = None
+
+                vector_ids.append(vector_id)
+                keys.append(key)
+
+            if self.persist_file is not None and self.persist_format == "log":
+                self.__append_to_log_file(self.persist_file, keys)
+
+        if self.persist_file is not None and self.persist_format == "json":
+            # Rewrites all entries on every write; use `persist_format="log"` for incremental persistence.
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
-        return vector_id
+        return vector_ids
 
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry | None:
         return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
@@ -97,6 +284,9 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         include_vectors: bool = False,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
+        if self.use_matrix_index and self.calculate_relatedness is LocalVectorStoreDriver._default_cosine_similarity:
+            return self._query_matrix_index(vector, count=count, namespace=namespace, include_vectors=include_vectors)
+
         entries = {k: v for k, v in self.entries.items() if v.namespace == namespace} if namespace else self.entries
 
         entries_and_relatednesses = [
@@ -105,28 +295,219 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
 
         entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
 
-        result = [
+        return [
             BaseVectorStoreDriver.Entry(
-                id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta, namespace=er[0].namespace
+                id=entry.id,
+                vector=entry.vector if include_vectors else [],
+                score=score,
+                meta=entry.meta,
+                namespace=entry.namespace,
             )
-            for er in entries_and_relatednesses
-        ][:count]
-
-        if include_vectors:
-            return result
-        return [
-            BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-            for r in result
+            for entry, score in entries_and_relatednesses[:count]
         ]
 
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
 
+    def _query_matrix_index(
+        self,
+        vector: list[float],
+        *,
+        count: int | None,
+        namespace: str | None,
+        include_vectors: bool,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        import numpy as np
+
+        indexes = self._get_matrix_indexes()
+        selected = [
+            index
+            for index_namespace, index in indexes.items()
+            if (not namespace or index_namespace == namespace) and index.size > 0
+        ]
+
+        if not selected:
+            return []
+
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        scores = np.concatenate([index.rows @ query for index in selected])
+        sequences = np.concatenate([index.row_sequences for index in selected])
+        keys = [key for index in selected for key in index.keys]
+
+        # Break score ties by insertion order so results match a stable sort over `self.entries`.
+        if count is not None and 0 < count < len(scores):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+            top = candidates[np.lexsort((sequences[candidates], -scores[candidates]))]
+        else:
+            top = np.lexsort((sequences, -scores))[:count]
+
+        result = []
+        for position in top:
+            entry = self.entries[keys[position]]
+            result.append(
+                BaseVectorStoreDriver.Entry(
+                    id=entry.id,
+                    vector=entry.vector if include_vectors else [],
+                    score=float(scores[position]),
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                )
+            )
+
+        return result
+
+    def _get_matrix_indexes(self) -> dict[str | None, _NamespaceMatrixIndex]:
+        with self.thread_lock:
+            if (
+                self._matrix_indexes is None
+                or self._matrix_indexed_entries is not self.entries
+                or sum(index.size for index in self._matrix_indexes.values()) != len(self.entries)
+            ):
+                indexes = {}
+
+                for sequence, (key, entry) in enumerate(self.entries.items()):
+                    indexes.setdefault(entry.namespace, _NamespaceMatrixIndex()).upsert(
+                        key, entry.vector or [], sequence
+                    )
+
+                self._matrix_indexes = indexes
+                self._matrix_indexed_entries = self.entries
+                self._matrix_index_sequence = len(self.entries)
+
+            return self._matrix_indexes
+
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
             serialized_data = {k: v.to_dict() for k, v in self.entries.items()}
 
             json.dump(serialized_data, json_file)
 
+    def __load_or_create_log_file(self, persist_file: str) -> None:
+        if os.path.isfile(persist_file) and os.path.getsize(persist_file) > 0:
+            with open(persist_file) as file:
+                is_log_file = self.__parse_log_file_header(file.readline()) is not None
+                file.seek(0)
+
+                if is_log_file:
+                    self.entries = self.load_entries_from_log_file(file)
+
+                    if not self._log_file_is_torn:
+                        return
+                else:
+                    # Migrate a file written with the `json` format.
+                    self.entries = self.load_entries_from_file(file)
+
+        # Also rewrites torn log files, so that later appends aren't lost.
+        with self.thread_lock:
+            self.__write_log_file(persist_file, self.entries)
+
+    def __parse_log_file_header(self, line: str) -> dict | None:
+        try:
+            header = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+        if isinstance(header, dict) and all(header.get(k) == v for k, v in self.LOG_FORMAT_HEADER.items()):
+            return header
+        return None
+
+    def __resolve_vectors_file(self, name: str | None) -> str | None:
+        if self.persist_vectors_file is None or name is None:
+            return self.persist_vectors_file
+
+        return os.path.join(os.path.dirname(self.persist_vectors_file), name)
+
+    def __load_vectors_file(self) -> np.ndarray | None:
+        import numpy as np
+
+        if self._vectors_file is None:
+            return None
+        if not os.path.isfile(self._vectors_file):
+            return np.empty(0, dtype=np.float32)
+
+        return np.fromfile(self._vectors_file, dtype=np.float32)
+
+    def __append_to_log_file(self, persist_file: str, keys: list[str]) -> None:
+        with open(persist_file, "ab+") as log_file:
+            # Start on a new line even if a previous write was interrupted in the middle of a record.
+            if log_file.seek(0, os.SEEK_END) > 0:
+                log_file.seek(-1, os.SEEK_END)
+
+                if log_file.read(1) != b"\n":
+                    log_file.write(b"\n")
+
+            if self._vectors_file is None:
+                records = [self.__to_log_record(key, self.entries[key]) for key in keys]
+            else:
+                with open(self._vectors_file, "ab") as vectors_file:
+                    records = [self.__to_log_record(key, self.entries[key], vectors_file) for key in keys]
+
+            log_file.write("".join(records).encode())
+
+        self._persisted_record_count += len(keys)
+
+        if self._persisted_record_count > self.compaction_ratio * len(self.entries):
+            self.__write_log_file(persist_file, self.entries)
+
+    def __write_log_file(self, persist_file: str, entries: dict[str, BaseVectorStoreDriver.Entry]) -> None:
+        # The log file is written to a temporary file and replaced last, and vectors are written to the sidecar file
+        # that the current log file doesn't reference, so an interrupted compaction leaves the previous files intact.
+        tmp_persist_file = f"{persist_file}.tmp"
+        previous_vectors_file = self._vectors_file
+        vectors_file_path = self.__next_vectors_file()
+        header = dict(self.LOG_FORMAT_HEADER)
+
+        if vectors_file_path is not None:
+            header["vectors_file"] = os.path.basename(vectors_file_path)
+
+        with open(tmp_persist_file, "w") as log_file:
+            log_file.write(json.dumps(header) + "\n")
+
+            if vectors_file_path is None:
+                log_file.writelines(self.__to_log_record(key, entry) for key, entry in entries.items())
+            else:
+                with open(vectors_file_path, "wb") as vectors_file:
+                    log_file.writelines(
+                        self.__to_log_record(key, entry, vectors_file) for key, entry in entries.items()
+                    )
+
+        os.replace(tmp_persist_file, persist_file)
+
+        self._vectors_file = vectors_file_path
+        self._persisted_record_count = len(entries)
+
+        if previous_vectors_file not in (None, vectors_file_path) and os.path.isfile(previous_vectors_file):
+            os.remove(previous_vectors_file)
+
+    def __next_vectors_file(self) -> str | None:
+        if self.persist_vectors_file is None:
+            return None
+        if self._vectors_file == self.persist_vectors_file:
+            return f"{self.persist_vectors_file}.1"
+        return self.persist_vectors_file
+
+    def __to_log_record(
+        self, key: str, entry: BaseVectorStoreDriver.Entry, vectors_file: BinaryIO | None = None
+    ) -> str:
+        record: dict = {"key": key, "id": entry.id, "meta": entry.meta, "namespace": entry.namespace}
+
+        if vectors_file is None:
+            record["vector"] = entry.vector
+        else:
+            import numpy as np
+
+            vector = np.asarray(entry.vector or [], dtype=np.float32)
+            position = vectors_file.seek(0, os.SEEK_END)
+
+            # Realign after a vector that an interrupted write left partially written.
+            if position % vector.itemsize:
+                position += vectors_file.write(bytes(vector.itemsize - position % vector.itemsize))
+
+            record["vector_offset"] = position // vector.itemsize
+            record["vector_length"] = len(vector)
+            vectors_file.write(vector.tobytes())
+
+        return json.dumps(record) + "\n"
+
     def __namespaced_vector_id(self, vector_id: str, *, namespace: str | None) -> str:
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
@@ -74,6 +74,32 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors in the collection with a single `bulk_write`."""
+        pymongo = import_optional_dependency("pymongo")
+        bson = import_optional_dependency("bson")
+
+        if not entries:
+            return []
+
+        vector_ids = []
+        operations = []
+        for entry in entries:
+            doc = {self.vector_path: entry.vector, "namespace": entry.namespace, "meta": entry.meta}
+
+            if entry.id is None:
+                # Generate the id client-side so it can be returned without reading back the inserted documents.
+                object_id = bson.ObjectId()
+                operations.append(pymongo.InsertOne({"_id": object_id, **doc}))
+                vector_ids.append(str(object_id))
+            else:
+                operations.append(pymongo.ReplaceOne({"_id": entry.id}, doc, upsert=True))
+                vector_ids.append(entry.id)
+
+        self.get_collection().bulk_write(operations, ordered=True)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry | None:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -68,6 +68,28 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors in OpenSearch with a single `_bulk` request."""
+        if not entries:
+            return []
+
+        body = []
+        for entry in entries:
+            vector = entry.vector or []
+            doc = {"vector": vector, "namespace": entry.namespace, "metadata": entry.meta}
+            doc.update(kwargs)
+
+            body.append(self._bulk_index_action(entry.id or utils.str_to_hash(str(vector))))
+            body.append(doc)
+
+        response = self.client.bulk(body=body)
+
+        if response.get("errors"):
+            errors = [item["index"]["error"] for item in response["items"] if "error" in item["index"]]
+            raise RuntimeError(f"Failed to upsert vectors: {errors}")
+
+        return [item["index"]["_id"] for item in response["items"]]
+
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry | None:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -163,5 +185,8 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        return {"index": {"_index": self.index_name, "_id": vector_id}}
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -94,6 +94,40 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(obj.id)
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors with a single multi-row `INSERT ... ON CONFLICT` statement."""
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        vector_ids = [uuid.UUID(entry.id) if entry.id else uuid.uuid4() for entry in entries]
+
+        if not entries:
+            return []
+
+        # Postgres rejects an `ON CONFLICT DO UPDATE` that touches the same row twice, so keep the last write per id.
+        rows = {
+            vector_id: {
+                "id": vector_id,
+                "vector": entry.vector,
+                "namespace": entry.namespace,
+                "meta": entry.meta,
+                **kwargs,
+            }
+            for vector_id, entry in zip(vector_ids, entries, strict=True)
+        }
+
+        statement = sqlalchemy_dialects_postgresql.insert(self._model).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in next(iter(rows.values())) if column != "id"},
+        )
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            session.execute(statement)
+            session.commit()
+
+        return [str(vector_id) for vector_id in vector_ids]
+
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -170,6 +170,35 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def upsert_vectors(
+        self, entries: list[BaseVectorStoreDriver.Entry], *, content: str | None = None, **kwargs
+    ) -> list[str]:
+        """Upsert multiple vectors into the Qdrant collection with a single batch request.
+
+        Parameters:
+            entries (list[BaseVectorStoreDriver.Entry]): The entries to be upserted.
+            content (Optional[str]): The text content to be included in the payload of each entry.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        vector_ids = [entry.id or str(uuid.uuid5(uuid.NAMESPACE_DNS, str(entry.vector))) for entry in entries]
+
+        if not entries:
+            return vector_ids
+
+        points = import_optional_dependency("qdrant_client.http.models").Batch(
+            ids=vector_ids,
+            vectors=[entry.vector for entry in entries],
+            payloads=[
+                {**(entry.meta or {}), self.content_payload_key: content} if content else entry.meta or {}
+                for entry in entries
+            ],
+        )
+
+        self.client.upsert(collection_name=self.collection_name, points=points)
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry | None:
         """Load a vector entry from the Qdrant collection based on its ID.
 
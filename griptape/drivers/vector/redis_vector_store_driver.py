@@ -61,25 +61,31 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         If a vector with the given vector ID already exists, it is updated; otherwise, a new vector is inserted.
         Metadata associated with the vector can also be provided.
         """
-        import numpy as np
-
         vector_id = vector_id or str_to_hash(str(vector))
         key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(key, mapping=self._generate_mapping(vector, namespace, meta))
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates multiple vectors in Redis using a single pipeline round trip."""
+        vector_ids = []
 
-        self.client.hset(key, mapping=mapping)
+        with self.client.pipeline(transaction=False) as pipeline:
+            for entry in entries:
+                vector = entry.vector or []
+                vector_id = entry.id or str_to_hash(str(vector))
 
-        return vector_id
+                pipeline.hset(
+                    self._generate_key(vector_id, entry.namespace),
+                    mapping=self._generate_mapping(vector, entry.namespace, entry.meta),
+                )
+                vector_ids.append(vector_id)
+
+            pipeline.execute()
+
+        return vector_ids
 
     def load_entry(self, vector_id: str, *, namespace: str | None = None) -> BaseVectorStoreDriver.Entry | None:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -167,6 +173,22 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _generate_mapping(self, vector: list[float], namespace: str | None, meta: dict | None) -> dict:
+        """Generates the Redis hash mapping for a vector."""
+        import numpy as np
+
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _get_doc_prefix(self, namespace: str | None = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
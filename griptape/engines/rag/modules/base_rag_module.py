@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class BaseRagModule(FuturesExecutorMixin, ABC):
+    FUTURES_EXECUTOR_POOL = "rag"
+
     name: str = field(
         default=Factory(lambda self: f"{self.__class__.__name__}-{uuid.uuid4().hex}", takes_self=True), kw_only=True
     )
@@ -29,24 +29,7 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
 
     def run(self, context: RagContext) -> BaseArtifact:
         query = context.query
-        tokenizer = self.prompt_driver.tokenizer
-        included_chunks = []
-        system_prompt = self.generate_system_template(context, included_chunks)
-
-        for artifact in context.text_chunks:
-            included_chunks.append(artifact)
-
-            system_prompt = self.generate_system_template(context, included_chunks)
-            message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query)),
-            )
-
-            if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                included_chunks.pop()
-
-                system_prompt = self.generate_system_template(context, included_chunks)
-
-                break
+        system_prompt = self._fit_text_chunks(context)
 
         output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
 
@@ -64,3 +47,87 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
             params["metadata"] = J2("engines/rag/modules/response/metadata/system.j2").render(metadata=self.metadata)
 
         return J2("engines/rag/modules/response/prompt/system.j2").render(**params)
+
+    def _fit_text_chunks(self, context: RagContext) -> str:
+        """Render the system prompt with as many of the leading text chunks as fit in the prompt.
+
+        Each chunk is tokenized once to estimate how many chunks fit next to the template, so the full prompt only
+        needs to be rendered and tokenized to confirm the estimate, or to binary search when it was off.
+
+        Returns:
+            The system prompt with the text chunks that fit.
+        """
+        tokenizer = self.prompt_driver.tokenizer
+        text_chunks = context.text_chunks
+        system_prompts: dict[int, str] = {}
+        prompt_token_counts: dict[int, int] = {}
+
+        def count_prompt_tokens(chunk_count: int) -> int:
+            if chunk_count not in prompt_token_counts:
+                system_prompts[chunk_count] = self.generate_system_template(context, text_chunks[:chunk_count])
+                prompt_token_counts[chunk_count] = tokenizer.count_tokens(
+                    self.prompt_driver.prompt_stack_to_string(
+                        self.generate_prompt_stack(system_prompts[chunk_count], context.query)
+                    ),
+                )
+
+            return prompt_token_counts[chunk_count]
+
+        def fits(chunk_count: int) -> bool:
+            # No chunks always fit.
+            return chunk_count == 0 or count_prompt_tokens(chunk_count) + self.answer_token_offset < (
+                tokenizer.max_input_tokens
+            )
+
+        estimate = self._estimate_text_chunks_to_fit(context)
+
+        if fits(estimate):
+            if estimate == len(text_chunks) or not fits(estimate + 1):
+                low = high = estimate
+            else:
+                low, high = estimate + 1, len(text_chunks)
+        else:
+            low, high = 0, estimate - 1
+
+        while low < high:
+            mid = (low + high + 1) // 2
+            if fits(mid):
+                low = mid
+            else:
+                high = mid - 1
+
+        if low not in system_prompts:
+            system_prompts[low] = self.generate_system_template(context, text_chunks[:low])
+
+        return system_prompts[low]
+
+    def _estimate_text_chunks_to_fit(self, context: RagContext) -> int:
+        tokenizer = self.prompt_driver.tokenizer
+        text_chunks = context.text_chunks
+
+        if not text_chunks:
+            return 0
+
+        # The template's own tokens, and the tokens it adds around each chunk, are measured with empty chunks.
+        empty_chunk = TextArtifact("")
+        one_chunk_tokens, two_chunk_tokens = (
+            tokenizer.count_tokens(
+                self.prompt_driver.prompt_stack_to_string(
+                    self.generate_prompt_stack(
+                        self.generate_system_template(context, [empty_chunk] * chunk_count), context.query
+                    )
+                ),
+            )
+            for chunk_count in (1, 2)
+        )
+        chunk_overhead_tokens = two_chunk_tokens - one_chunk_tokens
+        tokens_left = tokenizer.max_input_tokens - self.answer_token_offset - (one_chunk_tokens - chunk_overhead_tokens)
+        estimate = 0
+
+        for chunk_tokens in tokenizer.count_tokens_batch([chunk.to_text() for chunk in text_chunks]):
+            tokens_left -= chunk_tokens + chunk_overhead_tokens
+            if tokens_left <= 0:
+                break
+            estimate += 1
+
+        return estimate
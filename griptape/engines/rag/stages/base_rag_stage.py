@@ -10,6 +10,8 @@ from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 
 @define(kw_only=True)
 class BaseRagStage(FuturesExecutorMixin, ABC):
+    FUTURES_EXECUTOR_POOL = "rag"
+
     @abstractmethod
     def run(self, context: RagContext) -> RagContext:
         pass
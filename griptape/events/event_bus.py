@@ -3,7 +3,7 @@ from __future__ import annotations
 from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
-from attrs import define
+from attrs import define, field
 
 from griptape.mixins.singleton_mixin import SingletonMixin
 
@@ -15,6 +15,27 @@ if TYPE_CHECKING:
 # Also, in-place modifications do not trigger the context var's `set` method
 # so we must reassign the context var with the new value when adding or removing event listeners.
 _event_listeners: ContextVar[list[EventListener] | None] = ContextVar("event_listeners", default=None)
+_event_routes: ContextVar[_EventRoutes | None] = ContextVar("event_routes", default=None)
+
+# Incremented when a listener's event types change, which doesn't replace the list of event listeners.
+_event_routes_version = 0
+
+
+@define
+class _EventRoutes:
+    """The event listeners that handle each event type, for one list of event listeners."""
+
+    event_listeners: list[EventListener] = field()
+    event_listeners_count: int = field()
+    version: int = field()
+    event_listeners_by_type: dict[type[BaseEvent], list[EventListener]] = field(factory=dict)
+
+    def is_valid_for(self, event_listeners: list[EventListener]) -> bool:
+        return (
+            self.event_listeners is event_listeners
+            and self.event_listeners_count == len(event_listeners)
+            and self.version == _event_routes_version
+        )
 
 
 @define
@@ -48,9 +69,45 @@ class _EventBus(SingletonMixin):
         if event_listener in self.event_listeners:
             self.event_listeners = [listener for listener in self.event_listeners if listener != event_listener]
 
+    def get_event_listeners(self, event_type: type[BaseEvent]) -> list[EventListener]:
+        """Gets the event listeners that handle an event type.
+
+        The result is cached per event type until event listeners are added or removed.
+        """
+        event_listeners = self.event_listeners
+        event_routes = _event_routes.get()
+
+        if event_routes is None or not event_routes.is_valid_for(event_listeners):
+            event_routes = _EventRoutes(event_listeners, len(event_listeners), _event_routes_version)
+            _event_routes.set(event_routes)
+
+        routed_event_listeners = event_routes.event_listeners_by_type.get(event_type)
+
+        if routed_event_listeners is None:
+            routed_event_listeners = [
+                event_listener for event_listener in event_listeners if event_listener.handles_event_type(event_type)
+            ]
+            event_routes.event_listeners_by_type[event_type] = routed_event_listeners
+
+        return routed_event_listeners
+
+    def has_event_listeners(self, event_type: type[BaseEvent]) -> bool:
+        """Checks whether any event listener handles an event type, so that publishers can skip creating the event."""
+        return bool(self.get_event_listeners(event_type))
+
     def publish_event(self, event: BaseEvent, *, flush: bool = False) -> None:
-        for event_listener in self.event_listeners:
-            event_listener.publish_event(event, flush=flush)
+        for event_listener in self.get_event_listeners(type(event)):
+            event_listener.handle_event(event)
+
+        if flush:
+            for event_listener in self.event_listeners:
+                event_listener.flush_events()
+
+    def invalidate_event_routes(self) -> None:
+        """Clears the cached event listeners per event type, for example after an event listener's types change."""
+        global _event_routes_version  # noqa: PLW0603
+
+        _event_routes_version += 1
 
     def clear_event_listeners(self) -> None:
         self.event_listeners = []
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Generic, TypeVar
 
-from attrs import define, field
+from attrs import Attribute, define, field
 
 from .base_event import BaseEvent
 
@@ -17,6 +17,14 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=BaseEvent)
 
 
+def _invalidate_event_routes(_: EventListener, __: Attribute, event_types: list[type[T]] | None) -> list | None:
+    from griptape.events import EventBus
+
+    EventBus.invalidate_event_routes()
+
+    return event_types
+
+
 @define
 class EventListener(Generic[T]):
     """An event listener that listens for events and handles them.
@@ -31,7 +39,7 @@ class EventListener(Generic[T]):
     """
 
     on_event: Callable[[T], BaseEvent | dict | None] | None = field(default=None)
-    event_types: list[type[T]] | None = field(default=None, kw_only=True)
+    event_types: list[type[T]] | None = field(default=None, kw_only=True, on_setattr=_invalidate_event_routes)
     event_listener_driver: BaseEventListenerDriver | None = field(default=None, kw_only=True)
 
     def __enter__(self) -> Self:
@@ -46,16 +54,27 @@ class EventListener(Generic[T]):
 
         EventBus.remove_event_listener(self)
 
-    def publish_event(self, event: T, *, flush: bool = False) -> None:
+    def handles_event_type(self, event_type: type[BaseEvent]) -> bool:
         event_types = self.event_types
 
-        if event_types is None or any(isinstance(event, event_type) for event_type in event_types):
-            handled_event = event
-            if self.on_event is not None:
-                handled_event = self.on_event(event)
+        return event_types is None or issubclass(event_type, tuple(event_types))
+
+    def publish_event(self, event: T, *, flush: bool = False) -> None:
+        if self.handles_event_type(type(event)):
+            self.handle_event(event)
+
+        if flush:
+            self.flush_events()
+
+    def handle_event(self, event: T) -> None:
+        """Handles an event without checking its type."""
+        handled_event = event
+        if self.on_event is not None:
+            handled_event = self.on_event(event)
 
-            if self.event_listener_driver is not None and handled_event is not None:
-                self.event_listener_driver.publish_event(handled_event)
+        if self.event_listener_driver is not None and handled_event is not None:
+            self.event_listener_driver.publish_event(handled_event)
 
-        if self.event_listener_driver is not None and flush:
+    def flush_events(self) -> None:
+        if self.event_listener_driver is not None:
             self.event_listener_driver.flush_events()
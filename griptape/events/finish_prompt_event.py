@@ -7,6 +7,8 @@ from griptape.events.base_prompt_event import BasePromptEvent
 
 @define
 class FinishPromptEvent(BasePromptEvent):
+    COMPILED_SERIALIZATION = True
+
     result: str = field(kw_only=True, metadata={"serializable": True})
     input_token_count: float | None = field(kw_only=True, metadata={"serializable": True})
     output_token_count: float | None = field(kw_only=True, metadata={"serializable": True})
@@ -5,6 +5,8 @@ from griptape.events.base_chunk_event import BaseChunkEvent
 
 @define
 class TextChunkEvent(BaseChunkEvent):
+    COMPILED_SERIALIZATION = True
+
     token: str = field(kw_only=True, metadata={"serializable": True})
 
     def __str__(self) -> str:
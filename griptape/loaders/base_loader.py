@@ -29,6 +29,8 @@ class BaseLoader(FuturesExecutorMixin, ABC, Generic[S, F, A]):
         reference: The optional `Reference` to set on the Artifact.
     """
 
+    FUTURES_EXECUTOR_POOL = "loaders"
+
     reference: Reference | None = field(default=None, kw_only=True)
 
     def load(self, source: S) -> A:
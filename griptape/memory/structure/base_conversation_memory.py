@@ -26,6 +26,8 @@ class BaseConversationMemory(SerializableMixin, ABC):
     autoload: bool = field(default=True, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: int | None = field(default=None, kw_only=True, metadata={"serializable": True})
+    _run_token_counts: dict[str, int] = field(factory=dict, init=False, eq=False, repr=False)
+    _run_token_counts_prompt_driver: BasePromptDriver | None = field(default=None, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
@@ -44,7 +46,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
     def after_add_run(self) -> None:
         if self.max_runs:
             while len(self.runs) > self.max_runs:
-                self.runs.pop(0)
+                self._run_token_counts.pop(self.runs.pop(0).id, None)
         self.conversation_memory_driver.store(self.runs, self.meta)
 
     @abstractmethod
@@ -79,30 +81,7 @@ class BaseConversationMemory(SerializableMixin, ABC):
         num_runs_to_fit_in_prompt = len(self.runs)
 
         if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
-
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+            num_runs_to_fit_in_prompt = self._count_runs_to_fit_in_prompt(prompt_driver, prompt_stack)
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
@@ -112,3 +91,71 @@ class BaseConversationMemory(SerializableMixin, ABC):
                 prompt_stack.messages[index:index] = memory_inputs
 
         return prompt_stack
+
+    def _count_runs_to_fit_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        """Find the largest number of most recent runs that fit into the Prompt Stack without exceeding the token limit.
+
+        Rendering and tokenizing the whole Prompt Stack is expensive, so the cached token counts of the individual runs
+        are used to estimate the number of runs that fit. The estimate is then checked against the rendered
+        Prompt Stack and corrected with a binary search if it was off.
+        """
+        num_runs = len(self.runs)
+
+        def fits(last_n: int) -> bool:
+            # Where we insert into the Prompt Stack doesn't matter here since we only care about the total token count.
+            temp_stack = PromptStack(messages=[*prompt_stack.messages, *self.to_prompt_stack(last_n).messages])
+
+            return prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack)) > 0
+
+        estimate = self._estimate_runs_to_fit_in_prompt(prompt_driver, prompt_stack)
+
+        # No runs always fit, so only estimates above zero need checking.
+        if estimate == 0 or fits(estimate):
+            if estimate == num_runs or not fits(estimate + 1):
+                return estimate
+            low, high = estimate + 1, num_runs
+        else:
+            low, high = 0, estimate - 1
+
+        while low < high:
+            mid = (low + high + 1) // 2
+            if fits(mid):
+                low = mid
+            else:
+                high = mid - 1
+
+        return low
+
+    def _estimate_runs_to_fit_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        tokenizer = prompt_driver.tokenizer
+        tokens_left = tokenizer.max_input_tokens - tokenizer.count_tokens(
+            prompt_driver.prompt_stack_to_string(prompt_stack)
+        )
+        empty_stack_tokens = tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(PromptStack()))
+        estimate = 0
+
+        for run in reversed(self.runs):
+            tokens_left -= self._count_run_tokens(prompt_driver, run, empty_stack_tokens)
+            if tokens_left <= 0:
+                break
+            estimate += 1
+
+        return estimate
+
+    def _count_run_tokens(self, prompt_driver: BasePromptDriver, run: Run, empty_stack_tokens: int) -> int:
+        if prompt_driver is not self._run_token_counts_prompt_driver:
+            self._run_token_counts.clear()
+            self._run_token_counts_prompt_driver = prompt_driver
+
+        if run.id not in self._run_token_counts:
+            run_stack = PromptStack()
+            run_stack.add_user_message(run.input)
+            run_stack.add_assistant_message(run.output)
+
+            # Only count the tokens the run adds on top of the Prompt Stack's own formatting.
+            self._run_token_counts[run.id] = (
+                prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(run_stack))
+                - empty_stack_tokens
+            )
+
+        return self._run_token_counts[run.id]
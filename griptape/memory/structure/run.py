@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class Run(SerializableMixin):
+    COMPILED_SERIALIZATION = True
+
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), metadata={"serializable": True})
     meta: dict | None = field(default=None, metadata={"serializable": True})
     input: BaseArtifact = field(metadata={"serializable": True})
@@ -39,10 +39,9 @@ class ActionsSubtaskOriginMixin:
 
         for tool in tools:
             for activity_schema in tool.activity_schemas():
-                action_schema = activity_schema.schema
                 tag_key = Literal("tag", description="Unique tag name for action execution.")
-
-                action_schema[tag_key] = str
+                # Activity schemas are cached by the tool, so they are copied instead of modified.
+                action_schema = {**activity_schema.schema, tag_key: str}
 
                 action_schemas.append(action_schema)
 
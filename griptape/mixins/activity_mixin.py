@@ -1,30 +1,69 @@
 from __future__ import annotations
 
+import functools
 import inspect
 from collections.abc import Callable
-from copy import deepcopy
+from copy import copy, deepcopy
+from typing import Any, TypeVar
 
-from attrs import Attribute, define, field
+from attrs import Attribute, define, field, setters
 from jinja2 import Template
 from pydantic import BaseModel, ValidationError
 from schema import Schema, SchemaError
 
 from griptape.utils.json_schema_utils import build_strict_schema
 
+T = TypeVar("T")
+
+ACTIVITY_DESCRIPTION_TEMPLATE_CACHE_SIZE = 512
+
+
+@functools.cache
+def _class_activity_names(cls: type) -> tuple[str, ...]:
+    # Later classes in the MRO override earlier ones, like attribute lookup does.
+    is_activity_by_name = {}
+
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            is_activity_by_name[name] = getattr(value, "is_activity", False)
+
+    return tuple(sorted(name for name, is_activity in is_activity_by_name.items() if is_activity))
+
+
+@functools.lru_cache(maxsize=ACTIVITY_DESCRIPTION_TEMPLATE_CACHE_SIZE)
+def _activity_description_template(description: str) -> Template:
+    return Template(description)
+
+
+def _clear_activity_schema_cache(instance: ActivityMixin, _: Attribute, value: T) -> T:
+    instance._activity_schema_cache.clear()
+
+    return value
+
 
 @define(slots=False)
 class ActivityMixin:
     """Provides Tool Activity management functionality to Tools.
 
+    Activity methods are found once per class. Activity schemas, and the JSON schemas generated from them, are cached
+    per instance until `allowlist`, `denylist`, or `extra_schema_properties` are set.
+
     Attributes:
         allowlist: List of Tool Activities to include in the Tool schema.
         denylist: List of Tool Activities to remove from the Tool schema.
         extra_schema_properties: Mapping of Activity name and extra properties to include in the activity's schema.
     """
 
-    allowlist: list[str] | None = field(default=None, kw_only=True)
-    denylist: list[str] | None = field(default=None, kw_only=True)
-    extra_schema_properties: dict[str, dict] | None = field(default=None, kw_only=True)
+    allowlist: list[str] | None = field(
+        default=None, kw_only=True, on_setattr=setters.pipe(setters.validate, _clear_activity_schema_cache)
+    )
+    denylist: list[str] | None = field(
+        default=None, kw_only=True, on_setattr=setters.pipe(setters.validate, _clear_activity_schema_cache)
+    )
+    extra_schema_properties: dict[str, dict] | None = field(
+        default=None, kw_only=True, on_setattr=_clear_activity_schema_cache
+    )
+    _activity_schema_cache: dict[tuple, tuple[Any, Any]] = field(factory=dict, init=False, repr=False, eq=False)
 
     @allowlist.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
     def validate_allowlist(self, _: Attribute, allowlist: list[str] | None) -> None:
@@ -50,19 +89,21 @@ class ActivityMixin:
         self.allowlist = []
         self.denylist = None
 
-    # This method has to remain a method and can't be decorated with @property because
-    # of the max depth recursion issue in `inspect.getmembers`.
     def activities(self) -> list[Callable]:
-        methods = []
-
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            allowlist_condition = self.allowlist is None or name in self.allowlist
-            denylist_condition = self.denylist is None or name not in self.denylist
-
-            if getattr(method, "is_activity", False) and allowlist_condition and denylist_condition:
-                methods.append(method)
-
-        return methods
+        activity_names = set(_class_activity_names(type(self)))
+        # Activities can also be added to instances at runtime, like in `MCPTool`.
+        activity_names.update(
+            name
+            for name, value in vars(self).items()
+            if inspect.ismethod(value) and getattr(value, "is_activity", False)
+        )
+
+        return [
+            getattr(self, name)
+            for name in sorted(activity_names)
+            if (self.allowlist is None or name in self.allowlist)
+            and (self.denylist is None or name not in self.denylist)
+        ]
 
     def find_activity(self, name: str) -> Callable | None:
         for activity in self.activities():
@@ -79,7 +120,7 @@ class ActivityMixin:
     def activity_description(self, activity: Callable) -> str:
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        return Template(getattr(activity, "config")["description"]).render({"_self": self})
+        return _activity_description_template(getattr(activity, "config")["description"]).render({"_self": self})
 
     def activity_schema(self, activity: Callable) -> Schema | type[BaseModel] | None:
         if activity is None or not getattr(activity, "is_activity", False):
@@ -87,31 +128,41 @@ class ActivityMixin:
         if getattr(activity, "config")["schema"] is not None:
             config_schema = getattr(activity, "config")["schema"]
             if isinstance(config_schema, Schema):
-                # Need to deepcopy to avoid modifying the original schema
-                config_schema = deepcopy(getattr(activity, "config")["schema"])
-            elif isinstance(config_schema, Callable) and not isinstance(config_schema, type):
+                return self._cached_activity_schema(
+                    ("activity_schema", self.activity_name(activity)),
+                    config_schema,
+                    lambda: self.__extend_activity_schema(activity, deepcopy(config_schema)),
+                )
+            if isinstance(config_schema, Callable) and not isinstance(config_schema, type):
                 config_schema = config_schema(self)
-            activity_name = self.activity_name(activity)
 
-            if isinstance(config_schema, Schema) and (
-                self.extra_schema_properties is not None and activity_name in self.extra_schema_properties
-            ):
-                config_schema.schema.update(self.extra_schema_properties[activity_name])
+                if isinstance(config_schema, Schema):
+                    # Callable schemas return new objects, so the result is reused if its contents are unchanged.
+                    callable_schema = config_schema
+
+                    return self._cached_activity_schema(
+                        ("activity_schema", self.activity_name(activity)),
+                        (callable_schema.description, callable_schema.ignore_extra_keys, copy(callable_schema.schema)),
+                        lambda: self.__extend_activity_schema(activity, callable_schema),
+                    )
 
-            return config_schema
+            return self.__extend_activity_schema(activity, config_schema)
         return None
 
     def to_activity_json_schema(self, activity: Callable, schema_id: str) -> dict:
-        schema = self.activity_schema(activity)
-        if schema is None:
-            schema = Schema({})
+        """Converts an activity's schema to a JSON schema.
 
-        if isinstance(schema, Schema):
-            json_schema = schema.json_schema(schema_id)
-        else:
-            json_schema = build_strict_schema(schema.model_json_schema(), schema_id)
+        The JSON schema is cached until the activity's schema changes. Only a shallow copy is returned, so nested values
+        must not be modified.
+        """
+        schema = self.activity_schema(activity)
+        json_schema = self._cached_activity_schema(
+            ("json_schema", self.activity_name(activity), schema_id),
+            schema,
+            lambda: self.__build_json_schema(schema, schema_id),
+        )
 
-        return json_schema
+        return {**json_schema}
 
     def validate_activity_schema(self, activity_schema: Schema | type[BaseModel], params: dict) -> None:
         try:
@@ -122,6 +173,33 @@ class ActivityMixin:
         except (SchemaError, ValidationError) as e:
             raise ValueError(e) from e
 
+    def _cached_activity_schema(self, key: tuple, source: Any, build: Callable[[], T]) -> T:
+        """Returns the value cached under `key` if it was built from an equal `source`, otherwise builds and caches it."""
+        cached = self._activity_schema_cache.get(key)
+
+        if cached is None or cached[0] != source:
+            cached = self._activity_schema_cache[key] = (source, build())
+
+        return cached[1]
+
+    def __extend_activity_schema(self, activity: Callable, schema: T) -> T:
+        activity_name = self.activity_name(activity)
+
+        if isinstance(schema, Schema) and (
+            self.extra_schema_properties is not None and activity_name in self.extra_schema_properties
+        ):
+            schema.schema.update(self.extra_schema_properties[activity_name])
+
+        return schema
+
+    def __build_json_schema(self, schema: Schema | type[BaseModel] | None, schema_id: str) -> dict:
+        if schema is None:
+            schema = Schema({})
+
+        if isinstance(schema, Schema):
+            return schema.json_schema(schema_id)
+        return build_strict_schema(schema.model_json_schema(), schema_id)
+
     def _validate_tool_activity(self, activity_name: str) -> None:
         tool = self.__class__
 
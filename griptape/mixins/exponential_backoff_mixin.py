@@ -5,7 +5,14 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 from attrs import define, field
-from tenacity import Retrying, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,10 +27,17 @@ class ExponentialBackoffMixin(ABC):
     ignored_exception_types: tuple[type[Exception], ...] = field(factory=tuple, kw_only=True)
 
     def retrying(self) -> Retrying:
-        return Retrying(
-            wait=wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay),
-            retry=retry_if_not_exception_type(self.ignored_exception_types),
-            stop=stop_after_attempt(self.max_attempts),
-            reraise=True,
-            after=self.after_hook,
-        )
+        return Retrying(**self.__retrying_kwargs())
+
+    def aretrying(self) -> AsyncRetrying:
+        return AsyncRetrying(**self.__retrying_kwargs())
+
+    def __retrying_kwargs(self) -> dict:
+        return {
+            "wait": wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay),
+            # Only Exceptions are retried, so that cancellation and interrupts aren't swallowed.
+            "retry": retry_if_exception_type(Exception) & retry_if_not_exception_type(self.ignored_exception_types),
+            "stop": stop_after_attempt(self.max_attempts),
+            "reraise": True,
+            "after": self.after_hook,
+        }
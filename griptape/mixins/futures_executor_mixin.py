@@ -2,19 +2,29 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC
-from concurrent import futures
+from concurrent import futures  # noqa: TC003 - Schemas resolve the field annotations at runtime
 from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
 
+from griptape.utils.executor_registry import ExecutorRegistry
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 
 @define(slots=False, kw_only=True)
 class FuturesExecutorMixin(ABC):
+    """Runs work concurrently with executors from `create_futures_executor`.
+
+    By default, executors submit to the `ExecutorRegistry` pool named by `FUTURES_EXECUTOR_POOL`, so concurrency is
+    bounded per pool across the whole process. Pass `create_futures_executor` to use a different executor.
+    """
+
+    FUTURES_EXECUTOR_POOL = "default"
+
     create_futures_executor: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: futures.ThreadPoolExecutor),
+        default=Factory(lambda self: ExecutorRegistry.executor_factory(self.FUTURES_EXECUTOR_POOL), takes_self=True),
     )
 
     _futures_executor: futures.Executor = field(
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 from attrs import Factory, define, field
 
 from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.compiled_serializer import CompiledSerializer
 
 if TYPE_CHECKING:
     from marshmallow import Schema
@@ -32,6 +33,10 @@ setattr(JSONEncoder, "default", _default)
 
 @define(slots=False)
 class SerializableMixin(Generic[T]):
+    # Whether `to_dict` and `to_json` use `CompiledSerializer` instead of marshmallow when no overrides are passed.
+    # Enable it on classes that are serialized in high volumes; the output is the same either way.
+    COMPILED_SERIALIZATION = False
+
     type: str = field(
         default=Factory(lambda self: self.__class__.__name__, takes_self=True),
         kw_only=True,
@@ -116,6 +121,9 @@ class SerializableMixin(Generic[T]):
         types_overrides: dict[str, type] | None = None,
         serializable_overrides: dict[str, bool] | None = None,
     ) -> str:
+        if self.COMPILED_SERIALIZATION and types_overrides is None and serializable_overrides is None:
+            return CompiledSerializer.dumps(self)
+
         return json.dumps(self.to_dict(types_overrides=types_overrides, serializable_overrides=serializable_overrides))
 
     def to_dict(
@@ -124,6 +132,9 @@ class SerializableMixin(Generic[T]):
         types_overrides: dict[str, type] | None = None,
         serializable_overrides: dict[str, bool] | None = None,
     ) -> dict:
+        if self.COMPILED_SERIALIZATION and types_overrides is None and serializable_overrides is None:
+            return CompiledSerializer.dump(self)
+
         schema = BaseSchema.from_attrs_cls(
             self.__class__, types_overrides=types_overrides, serializable_overrides=serializable_overrides
         )
@@ -8,5 +8,7 @@ from .union_field import Union
 
 from .pydantic_model_field import PydanticModel
 
+from .compiled_serializer import CompiledSerializer
 
-__all__ = ["BaseSchema", "Bytes", "PolymorphicSchema", "PydanticModel", "Union"]
+
+__all__ = ["BaseSchema", "Bytes", "CompiledSerializer", "PolymorphicSchema", "PydanticModel", "Union"]
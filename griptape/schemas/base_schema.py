@@ -27,6 +27,9 @@ class BaseSchema(Schema):
         BaseModel: PydanticModel,
     }
 
+    # Generated Schema classes, keyed by the Schema class, attrs class, and overrides they were generated with.
+    _schema_cache: dict[tuple, type] = {}
+
     @classmethod
     def from_attrs_cls(
         cls,
@@ -37,11 +40,38 @@ class BaseSchema(Schema):
     ) -> type:
         """Generate a Schema from an attrs class.
 
+        Generated Schemas are cached, so a Schema is only generated once for each attrs class and set of overrides.
+
         Args:
             attrs_cls: An attrs class.
             types_overrides: A dictionary of types to override when resolving types.
             serializable_overrides: A dictionary of field names to whether they are serializable.
         """
+        cache_key = (
+            cls,
+            attrs_cls,
+            frozenset((types_overrides or {}).items()),
+            frozenset((serializable_overrides or {}).items()),
+        )
+
+        if (schema_class := cls._schema_cache.get(cache_key)) is None:
+            schema_class = cls._schema_cache.setdefault(
+                cache_key,
+                cls._generate_from_attrs_cls(
+                    attrs_cls, types_overrides=types_overrides, serializable_overrides=serializable_overrides
+                ),
+            )
+
+        return schema_class
+
+    @classmethod
+    def _generate_from_attrs_cls(
+        cls,
+        attrs_cls: type,
+        *,
+        types_overrides: dict[str, type] | None = None,
+        serializable_overrides: dict[str, bool] | None = None,
+    ) -> type:
         from marshmallow import post_load
 
         if serializable_overrides is None:
@@ -243,6 +273,7 @@ class BaseSchema(Schema):
         from griptape.drivers.assistant import BaseAssistantDriver
         from griptape.drivers.audio_transcription import BaseAudioTranscriptionDriver
         from griptape.drivers.embedding import BaseEmbeddingDriver
+        from griptape.drivers.embedding_cache import BaseEmbeddingCacheDriver
         from griptape.drivers.file_manager import BaseFileManagerDriver
         from griptape.drivers.image_generation import BaseImageGenerationDriver, BaseMultiModelImageGenerationDriver
         from griptape.drivers.image_generation_model import BaseImageGenerationModelDriver
@@ -281,6 +312,7 @@ class BaseSchema(Schema):
                 "Any": Any,
                 "BasePromptDriver": BasePromptDriver,
                 "BaseEmbeddingDriver": BaseEmbeddingDriver,
+                "BaseEmbeddingCacheDriver": BaseEmbeddingCacheDriver,
                 "BaseVectorStoreDriver": BaseVectorStoreDriver,
                 "BaseTextToSpeechDriver": BaseTextToSpeechDriver,
                 "BaseAudioTranscriptionDriver": BaseAudioTranscriptionDriver,
@@ -338,11 +370,21 @@ class BaseSchema(Schema):
                 "Anthropic": import_optional_dependency("anthropic").Anthropic
                 if is_dependency_installed("anthropic")
                 else Any,
+                "AsyncAnthropic": import_optional_dependency("anthropic").AsyncAnthropic
+                if is_dependency_installed("anthropic")
+                else Any,
+                "AsyncClient": import_optional_dependency("ollama").AsyncClient
+                if is_dependency_installed("ollama")
+                else Any,
                 "BedrockRuntimeClient": import_optional_dependency("mypy_boto3_bedrock_runtime").BedrockRuntimeClient
                 if is_dependency_installed("mypy_boto3_bedrock_runtime")
                 else Any,
                 "voyageai": import_optional_dependency("voyageai") if is_dependency_installed("voyageai") else Any,
                 "openai": import_optional_dependency("openai") if is_dependency_installed("openai") else Any,
+                # Only used by fields that aren't serialized, and importing them would import torch.
+                "PreTrainedModel": Any,
+                "PreTrainedTokenizerBase": Any,
+                "TextGenerationPipeline": Any,
                 "Schema": Schema,
                 "BaseModel": BaseModel,
                 **types_override,
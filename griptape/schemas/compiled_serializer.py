@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import functools
+import json
+from abc import ABC
+from typing import TYPE_CHECKING, Any, TypeVar, get_args
+
+import attrs
+from marshmallow import fields
+
+from griptape.schemas.base_schema import BaseSchema
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class CompiledSerializer:
+    """Serializes attrs classes to the same dicts as their generated Schemas, without going through marshmallow.
+
+    A dump function is generated once per attrs class from the same field metadata (`serializable`,
+    `serialization_key`) and type resolution that `BaseSchema.from_attrs_cls` uses. Field types with a trivial
+    marshmallow representation (strings, numbers, booleans, dicts, lists, and nested attrs classes) are converted
+    inline; every other field type is serialized with its marshmallow Field, so the output always matches
+    `BaseSchema.from_attrs_cls(attrs_cls)().dump(obj)`.
+    """
+
+    # Generated dump functions, keyed by the attrs class they serialize.
+    _dump_functions: dict[type, Callable[[Any], dict]] = {}
+
+    @classmethod
+    def dump(cls, obj: Any) -> dict:
+        """Serialize an attrs object to a dict.
+
+        Args:
+            obj: An instance of an attrs class.
+        """
+        return cls.get_dump_function(obj.__class__)(obj)
+
+    @classmethod
+    def dumps(cls, obj: Any) -> str:
+        """Serialize an attrs object to a JSON string, using orjson or msgspec when either is installed.
+
+        Args:
+            obj: An instance of an attrs class.
+        """
+        return _get_json_dumps_function()(cls.dump(obj))
+
+    @classmethod
+    def get_dump_function(cls, attrs_cls: type) -> Callable[[Any], dict]:
+        """Get the dump function for an attrs class, generating it the first time the class is serialized.
+
+        Args:
+            attrs_cls: An attrs class.
+        """
+        if (dump_function := cls._dump_functions.get(attrs_cls)) is None:
+            dump_function = cls._dump_functions.setdefault(attrs_cls, cls._generate_dump_function(attrs_cls))
+
+        return dump_function
+
+    @classmethod
+    def _generate_dump_function(cls, attrs_cls: type) -> Callable[[Any], dict]:
+        BaseSchema._resolve_types(attrs_cls)
+
+        namespace: dict[str, Any] = {}
+        items = []
+        for index, field in enumerate(attrs.fields(attrs_cls)):
+            field_key = field.alias or field.name
+            if not field.metadata.get("serializable", False):
+                continue
+
+            source = field.metadata.get("serialization_key") or field_key
+            value = f"obj.{source}" if source.isidentifier() else f"getattr(obj, {source!r})"
+            converter = cls._get_converter_for_type(field.type)
+
+            if converter is _raw:
+                items.append(f"{field_key!r}: {value}")
+            else:
+                namespace[f"convert_{index}"] = converter
+                items.append(f"{field_key!r}: convert_{index}({value})")
+
+        source_code = f"def dump(obj):\n    return {{{', '.join(items)}}}\n"
+        exec(compile(source_code, f"<{attrs_cls.__qualname__} compiled serializer>", "exec"), namespace)  # noqa: S102
+
+        return namespace["dump"]
+
+    @classmethod
+    def _get_converter_for_type(cls, field_type: type) -> Callable[[Any], Any]:  # noqa: C901
+        """Generate a converter for a field type, mirroring `BaseSchema._get_field_for_type`.
+
+        Args:
+            field_type: A field type.
+        """
+        field_class, args, _ = BaseSchema._get_field_type_info(field_type)
+
+        if field_class is None:
+            return _none
+
+        if isinstance(field_class, TypeVar):
+            field_class = field_class.__bound__
+            if field_class is None:
+                return _raw
+
+        if BaseSchema._is_union(field_type):
+            return cls._get_converter_for_union(field_type)
+        if attrs.has(field_class):
+            if ABC in field_class.__bases__:
+                return _dump_polymorphic
+            return functools.partial(_dump_nested, field_class)
+        if BaseSchema._is_enum(field_type):
+            return _to_str
+        if BaseSchema._is_list_sequence(field_class):
+            if args:
+                return functools.partial(_dump_list, cls._get_converter_for_type(args[0]))
+            raise ValueError(f"Missing type for list field: {field_type}")
+
+        marshmallow_field_class = BaseSchema.DATACLASS_TYPE_MAPPING.get(field_class, fields.Raw)
+        if marshmallow_field_class in _CONVERTERS:
+            return _CONVERTERS[marshmallow_field_class]
+
+        return functools.partial(_dump_field, marshmallow_field_class())
+
+    @classmethod
+    def _get_converter_for_union(cls, union_type: type) -> Callable[[Any], Any]:
+        converters = [cls._get_converter_for_type(arg) for arg in get_args(union_type) if arg is not type(None)]
+        if not converters:
+            raise ValueError(f"Unsupported UnionType field: {union_type}")
+
+        if len(converters) == 1:
+            return converters[0]
+
+        return functools.partial(_dump_union, converters)
+
+
+@functools.cache
+def _get_json_dumps_function() -> Callable[[Any], str]:
+    from griptape.utils import import_optional_dependency, is_dependency_installed
+
+    if is_dependency_installed("orjson"):
+        orjson = import_optional_dependency("orjson")
+
+        def encode(data: Any) -> bytes:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+        errors: tuple[type[Exception], ...] = (orjson.JSONEncodeError,)
+    elif is_dependency_installed("msgspec"):
+        msgspec = import_optional_dependency("msgspec")
+        encode = msgspec.json.Encoder(enc_hook=_json_default).encode
+        errors = (msgspec.EncodeError, TypeError, ValueError, OverflowError)
+    else:
+        return json.dumps
+
+    def dumps(data: Any) -> str:
+        try:
+            return encode(data).decode()
+        except errors:
+            # Values that only the standard library can encode, like integers that do not fit in 64 bits.
+            return json.dumps(data)
+
+    return dumps
+
+
+def _json_default(obj: Any) -> Any:
+    """Encodes the same values as the patched `JSONEncoder.default` in `griptape.mixins.serializable_mixin`."""
+    from pydantic import BaseModel
+
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if hasattr(obj.__class__, "to_dict"):
+        return obj.to_dict()
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _raw(value: Any) -> Any:
+    return value
+
+
+def _none(_: Any) -> None:
+    return None
+
+
+def _to_str(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+
+    return str(value)
+
+
+def _to_int(value: Any) -> int | None:
+    return None if value is None else int(value)
+
+
+def _to_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def _to_bool(value: Any) -> bool | None:
+    if value is None:
+        return None
+
+    try:
+        if value in fields.Boolean.truthy:
+            return True
+        if value in fields.Boolean.falsy:
+            return False
+    except TypeError:
+        pass
+
+    return bool(value)
+
+
+def _to_dict(value: Any) -> dict | None:
+    return None if value is None else dict(value)
+
+
+def _dump_nested(attrs_cls: type, value: Any) -> dict | None:
+    # Nested Schemas are generated for the field's type, so only its fields are dumped, even for subclasses.
+    return None if value is None else CompiledSerializer.get_dump_function(attrs_cls)(value)
+
+
+def _dump_polymorphic(value: Any) -> dict | None:
+    if value is None:
+        return None
+
+    result = CompiledSerializer.dump(value)
+    result["type"] = value.__class__.__name__
+
+    return result
+
+
+def _dump_list(converter: Callable[[Any], Any], value: Any) -> list | None:
+    return None if value is None else [converter(item) for item in value]
+
+
+def _dump_union(converters: list[Callable[[Any], Any]], value: Any) -> Any:
+    errors = []
+    for converter in converters:
+        try:
+            return converter(value)
+        except (TypeError, ValueError) as e:
+            errors.append(e)
+
+    raise ValueError(f"All serializers raised exceptions: {errors}")
+
+
+def _dump_field(field: fields.Field, value: Any) -> Any:
+    return field._serialize(value, None, None)
+
+
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    fields.Raw: _raw,
+    fields.String: _to_str,
+    fields.Integer: _to_int,
+    fields.Float: _to_float,
+    fields.Boolean: _to_bool,
+    fields.Dict: _to_dict,
+}
@@ -74,6 +74,7 @@ class Agent(Structure):
 
     def add_task(self, task: BaseTask) -> BaseTask:
         self._tasks.clear()
+        self._reset_task_index()
 
         task.preprocess(self)
 
@@ -92,6 +93,12 @@ class Agent(Structure):
 
         return self
 
+    @observable
+    async def try_arun(self, *args) -> Agent:
+        await self.task.arun()
+
+        return self
+
     def _init_task(self) -> None:
         if self.stream is None:
             with validators.disabled():
@@ -45,6 +45,7 @@ class Pipeline(Structure):
 
         parent_index = self.tasks.index(parent_task)
         self._tasks.insert(parent_index + 1, task)
+        self._reset_task_index()
 
         return task
 
@@ -54,6 +55,17 @@ class Pipeline(Structure):
 
         return self
 
+    @observable
+    async def try_arun(self, *args) -> Pipeline:
+        task = self.input_task
+
+        while task is not None:
+            if isinstance(await task.arun(), ErrorArtifact) and self.fail_fast:
+                break
+            task = next(iter(task.children), None)
+
+        return self
+
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
 
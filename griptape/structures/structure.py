@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
 import uuid
 from abc import ABC, abstractmethod
 from queue import Queue
@@ -21,7 +24,7 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils.contextvars_utils import with_contextvars
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     from griptape.artifacts import BaseArtifact
     from griptape.memory.structure import BaseConversationMemory
@@ -50,10 +53,16 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     fail_fast: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _execution_args: tuple = ()
     _event_queue: Queue[BaseEvent] = field(default=Factory(Queue), init=False)
+    _indexed_tasks: list[BaseTask | list[BaseTask]] | None = field(default=None, init=False, eq=False, repr=False)
+    _indexed_tasks_count: int = field(default=0, init=False, eq=False, repr=False)
+    _flattened_tasks: list[BaseTask] = field(factory=list, init=False, eq=False, repr=False)
+    _tasks_by_id: dict[str, BaseTask] = field(factory=dict, init=False, eq=False, repr=False)
+    _task_index_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
         tasks = self._tasks.copy()
         self._tasks.clear()
+        self._reset_task_index()
         self.add_tasks(*tasks)
 
     def __add__(self, other: BaseTask | list[BaseTask | list[BaseTask]]) -> list[BaseTask]:
@@ -61,14 +70,8 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def tasks(self) -> list[BaseTask]:
-        tasks = []
-
-        for task in self._tasks:
-            if isinstance(task, list):
-                tasks.extend(task)
-            else:
-                tasks.append(task)
-        return tasks
+        with self._task_index_lock:
+            return self.__index_tasks().copy()
 
     @property
     def execution_args(self) -> tuple:
@@ -76,11 +79,15 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
 
     @property
     def input_task(self) -> BaseTask | None:
-        return self.tasks[0] if self.tasks else None
+        tasks = self._index_tasks()
+
+        return tasks[0] if tasks else None
 
     @property
     def output_task(self) -> BaseTask | None:
-        return self.tasks[-1] if self.tasks else None
+        tasks = self._index_tasks()
+
+        return tasks[-1] if tasks else None
 
     @property
     def output(self) -> BaseArtifact:
@@ -110,10 +117,10 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
         raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def try_find_task(self, task_id: str) -> BaseTask | None:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        with self._task_index_lock:
+            self.__index_tasks()
+
+            return self._tasks_by_id.get(task_id)
 
     def add_tasks(self, *tasks: BaseTask | list[BaseTask]) -> list[BaseTask]:
         added_tasks = []
@@ -127,6 +134,43 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
     def context(self, task: BaseTask) -> dict[str, Any]:
         return {"args": self.execution_args, "structure": self}
 
+    def _index_tasks(self) -> list[BaseTask]:
+        """Flatten the Structure's Tasks and index them by id, only processing Tasks appended since the last call.
+
+        Tasks appended to the end of `_tasks` are picked up automatically. Any other change to `_tasks`, such as
+        inserting or removing Tasks, must be followed by a call to `_reset_task_index()`. The index is updated under a
+        lock, since Tasks of a Workflow look up other Tasks from worker threads.
+
+        Returns:
+            The flattened Tasks. Callers must not modify this list.
+        """
+        with self._task_index_lock:
+            return self.__index_tasks()
+
+    def _reset_task_index(self) -> None:
+        with self._task_index_lock:
+            self.__clear_task_index()
+
+    def __index_tasks(self) -> list[BaseTask]:
+        if self._indexed_tasks is not self._tasks or self._indexed_tasks_count > len(self._tasks):
+            self.__clear_task_index()
+            self._indexed_tasks = self._tasks
+
+        for task in self._tasks[self._indexed_tasks_count :]:
+            for flattened_task in task if isinstance(task, list) else [task]:
+                self._flattened_tasks.append(flattened_task)
+                # Keep the first Task with a given id, like a linear search would.
+                self._tasks_by_id.setdefault(flattened_task.id, flattened_task)
+        self._indexed_tasks_count = len(self._tasks)
+
+        return self._flattened_tasks
+
+    def __clear_task_index(self) -> None:
+        self._indexed_tasks = None
+        self._indexed_tasks_count = 0
+        self._flattened_tasks = []
+        self._tasks_by_id = {}
+
     def resolve_relationships(self) -> None:
         task_by_id = {}
         for task in self.tasks:
@@ -226,6 +270,59 @@ class Structure(RuleMixin, SerializableMixin, RunnableMixin["Structure"], ABC):
                     yield event
             t.join()
 
+    @observable
+    async def arun(self, *args) -> Structure:
+        """Asynchronous version of `run`, with the same events and memory updates."""
+        self.before_run(args)
+
+        result = await self.try_arun(*args)
+
+        # Finishing a run can block, for example when Event Listeners flush their events, so it's run off the event loop.
+        await asyncio.to_thread(self.after_run)
+
+        return result
+
+    async def arun_stream(self, *args, event_types: list[type[BaseEvent]] | None = None) -> AsyncIterator[BaseEvent]:
+        """Asynchronous version of `run_stream`, which runs the Structure as an asyncio task instead of a thread.
+
+        If the stream is closed before the run finishes, for example by breaking out of an `async for` loop, the run is
+        cancelled.
+        """
+        if event_types is None:
+            event_types = [BaseEvent]
+        elif FinishStructureRunEvent not in event_types:
+            event_types = [*event_types, FinishStructureRunEvent]
+
+        loop = asyncio.get_running_loop()
+        event_queue: asyncio.Queue[BaseEvent | None] = asyncio.Queue()
+
+        def put_event(event: BaseEvent) -> None:
+            # Events can be published from worker threads, so they are handed to the event loop thread-safely.
+            loop.call_soon_threadsafe(event_queue.put_nowait, event)
+
+        with EventListener(put_event, event_types=event_types):
+            run_task = asyncio.create_task(self.arun(*args))
+            run_task.add_done_callback(lambda _: event_queue.put_nowait(None))
+
+            try:
+                while (event := await event_queue.get()) is not None:
+                    if isinstance(event, FinishStructureRunEvent) and event.structure_id == self.id:
+                        break
+                    yield event
+            except BaseException:
+                run_task.cancel()
+
+                with contextlib.suppress(Exception, asyncio.CancelledError):
+                    await run_task
+
+                raise
+
+            await run_task
+
     @abstractmethod
     def try_run(self, *args) -> Structure:
         pass
+
+    async def try_arun(self, *args) -> Structure:
+        """Asynchronous version of `try_run`. By default, `try_run` is run in a worker thread."""
+        return await asyncio.to_thread(self.try_run, *args)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from concurrent import futures
 from graphlib import TopologicalSorter
 from typing import TYPE_CHECKING, Any
@@ -13,12 +14,16 @@ from griptape.structures import Structure
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from griptape.artifacts import BaseArtifact
     from griptape.tasks import BaseTask
 
 
 @define
 class Workflow(Structure, FuturesExecutorMixin):
+    FUTURES_EXECUTOR_POOL = "workflows"
+
     @property
     def input_task(self) -> BaseTask | None:
         return self.order_tasks()[0] if self.tasks else None
@@ -96,6 +101,7 @@ class Workflow(Structure, FuturesExecutorMixin):
 
         # Insert the new task once, just after the last parent task
         self._tasks.insert(last_parent_index + 1, task)
+        self._reset_task_index()
 
         return task
 
@@ -104,23 +110,20 @@ class Workflow(Structure, FuturesExecutorMixin):
         exit_loop = False
 
         with self.create_futures_executor() as futures_executor:
+            # Tasks added while the Workflow is running are picked up by rebuilding the graph.
             while not self.is_finished() and not exit_loop:
-                futures_list = {}
-                ordered_tasks = self.order_tasks()
+                exit_loop = self.__run_ready_tasks(futures_executor)
 
-                for task in ordered_tasks:
-                    if task.can_run():
-                        future = futures_executor.submit(with_contextvars(task.run))
-                        futures_list[future] = task
+            return self
 
-                # Wait for all tasks to complete
-                for future in futures.as_completed(futures_list):
-                    if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                        exit_loop = True
+    @observable
+    async def try_arun(self, *args) -> Workflow:
+        exit_loop = False
 
-                        break
+        while not self.is_finished() and not exit_loop:
+            exit_loop = await self.__arun_ready_tasks()
 
-            return self
+        return self
 
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
@@ -138,20 +141,121 @@ class Workflow(Structure, FuturesExecutorMixin):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
-
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
 
+    def __run_ready_tasks(self, futures_executor: futures.Executor) -> bool:
+        """Run the Workflow's Tasks, submitting each Task as soon as its last parent is done.
+
+        Returns:
+            Whether the run was stopped early because a Task failed and `fail_fast` is enabled.
+        """
+        futures_to_tasks: dict[futures.Future, BaseTask] = {}
+
+        def submit(task: BaseTask) -> None:
+            futures_to_tasks[futures_executor.submit(with_contextvars(task.run))] = task
+
+        complete = self.__schedule_tasks(submit)
+
+        while futures_to_tasks:
+            finished, _ = futures.wait(futures_to_tasks, return_when=futures.FIRST_COMPLETED)
+
+            for future in finished:
+                task = futures_to_tasks.pop(future)
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    return True
+
+                complete(task)
+
+        return False
+
+    async def __arun_ready_tasks(self) -> bool:
+        """Asynchronous version of `__run_ready_tasks`, running each Task as an asyncio task.
+
+        Returns:
+            Whether the run was stopped early because a Task failed and `fail_fast` is enabled.
+        """
+        asyncio_tasks: dict[asyncio.Task, BaseTask] = {}
+
+        def submit(task: BaseTask) -> None:
+            asyncio_tasks[asyncio.create_task(task.arun())] = task
+
+        complete = self.__schedule_tasks(submit)
+
+        try:
+            while asyncio_tasks:
+                finished, _ = await asyncio.wait(asyncio_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for asyncio_task in finished:
+                    task = asyncio_tasks.pop(asyncio_task)
+
+                    if isinstance(asyncio_task.result(), ErrorArtifact) and self.fail_fast:
+                        return True
+
+                    complete(task)
+        finally:
+            # Like the futures executor in `try_run`, wait for running Tasks before returning.
+            if asyncio_tasks:
+                await asyncio.wait(asyncio_tasks)
+
+        return False
+
+    def __schedule_tasks(self, submit: Callable[[BaseTask], None]) -> Callable[[BaseTask], None]:  # noqa: C901
+        """Submit the Workflow's Tasks that have no parents left to wait on.
+
+        Args:
+            submit: Called with each Task that is ready to run.
+
+        Returns:
+            A function to call when a submitted Task is done, which submits the children that are now ready.
+        """
+        tasks = {task.id: task for task in self.tasks}
+        children: dict[str, list[BaseTask]] = {task_id: [] for task_id in tasks}
+        parents_left = dict.fromkeys(tasks, 0)
+
+        for task in tasks.values():
+            for parent_id in task.parent_ids:
+                if parent_id in children:
+                    children[parent_id].append(task)
+                    parents_left[task.id] += 1
+
+        # Tasks that are finished or skipped, and whose children no longer wait on them.
+        done_ids: set[str] = set()
+
+        def schedule(task: BaseTask) -> None:
+            if task.id in done_ids:
+                return
+            if task.can_run():
+                submit(task)
+            elif task.is_skipped() or task.is_finished():
+                complete(task)
+
+        def complete(task: BaseTask) -> None:
+            done_ids.add(task.id)
+
+            for child in children[task.id]:
+                parents_left[child.id] -= 1
+
+                # Children skipped by a BranchTask are done without waiting on their other parents.
+                if parents_left[child.id] == 0 or child.is_skipped():
+                    schedule(child)
+
+        for task in tasks.values():
+            if parents_left[task.id] == 0:
+                schedule(task)
+
+        return complete
+
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
             # Link the new task to the child task
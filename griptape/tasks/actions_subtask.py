@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -116,19 +117,23 @@ class ActionsSubtask(BaseSubtask[ListArtifact | ErrorArtifact]):
     def try_run(self) -> ListArtifact | ErrorArtifact:
         try:
             if any(isinstance(a.output, ErrorArtifact) for a in self.actions):
-                errors = [a.output.value for a in self.actions if isinstance(a.output, ErrorArtifact)]
-
-                self.output = ErrorArtifact("\n\n".join(errors))
+                self.output = self.__actions_error()
             else:
-                results = self.run_actions(self.actions)
+                self.output = self.__actions_output(self.run_actions(self.actions))
+        except Exception as e:
+            logger.debug("Subtask %s\n%s", self.id, e)
 
-                actions_output = []
-                for result in results:
-                    tag, output = result
-                    output.name = f"{tag} output"
+            self.output = ErrorArtifact(str(e), exception=e)
+        if self.output is not None:
+            return self.output
+        return ErrorArtifact("no tool output")
 
-                    actions_output.append(output)
-                self.output = ListArtifact(actions_output)
+    async def try_arun(self) -> ListArtifact | ErrorArtifact:
+        try:
+            if any(isinstance(a.output, ErrorArtifact) for a in self.actions):
+                self.output = self.__actions_error()
+            else:
+                self.output = self.__actions_output(await self.arun_actions(self.actions))
         except Exception as e:
             logger.debug("Subtask %s\n%s", self.id, e)
 
@@ -143,6 +148,10 @@ class ActionsSubtask(BaseSubtask[ListArtifact | ErrorArtifact]):
                 [futures_executor.submit(with_contextvars(self.run_action), a) for a in actions]
             )
 
+    async def arun_actions(self, actions: list[ToolAction]) -> list[tuple[str, BaseArtifact]]:
+        """Asynchronous version of `run_actions`, running each action in a worker thread concurrently."""
+        return list(await asyncio.gather(*[asyncio.to_thread(self.run_action, a) for a in actions]))
+
     def run_action(self, action: ToolAction) -> tuple[str, BaseArtifact]:
         if action.tool is not None:
             if action.path is not None:
@@ -263,6 +272,21 @@ class ActionsSubtask(BaseSubtask[ListArtifact | ErrorArtifact]):
             return ListArtifact([self._process_task_input(elem) for elem in task_input])
         raise ValueError(f"Invalid input type: {type(task_input)} ")
 
+    def __actions_error(self) -> ErrorArtifact:
+        errors = [a.output.value for a in self.actions if isinstance(a.output, ErrorArtifact)]
+
+        return ErrorArtifact("\n\n".join(errors))
+
+    def __actions_output(self, results: list[tuple[str, BaseArtifact]]) -> ListArtifact:
+        actions_output = []
+        for result in results:
+            tag, output = result
+            output.name = f"{tag} output"
+
+            actions_output.append(output)
+
+        return ListArtifact(actions_output)
+
     def __init_from_prompt(self, value: str) -> None:
         thought_matches = re.findall(self.THOUGHT_PATTERN, value, re.MULTILINE)
         actions_matches = re.findall(self.ACTIONS_PATTERN, value, re.DOTALL)
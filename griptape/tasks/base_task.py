@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -28,6 +29,8 @@ T = TypeVar("T", bound=BaseArtifact)
 
 @define
 class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"], ABC, Generic[T]):
+    FUTURES_EXECUTOR_POOL = "tasks"
+
     class State(Enum):
         PENDING = 1
         RUNNING = 2
@@ -187,6 +190,27 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
 
         return self.output
 
+    async def arun(self, *args) -> T:
+        """Asynchronous version of `run`, with the same events and error handling."""
+        try:
+            self._execution_args = args
+
+            self.state = BaseTask.State.RUNNING
+
+            self.before_run()
+
+            self.output = await self.try_arun()
+
+            self.after_run()
+        except Exception as e:
+            logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = cast("T", ErrorArtifact(str(e), exception=e))
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def after_run(self) -> None:
         super().after_run()
         if self.structure is not None:
@@ -226,6 +250,14 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, RunnableMixin["BaseTask"
     def try_run(self) -> T:
         pass
 
+    async def try_arun(self) -> T:
+        """Asynchronous version of `try_run`.
+
+        Tasks that can do their work without blocking should override this. By default, `try_run` is run in a worker
+        thread.
+        """
+        return await asyncio.to_thread(self.try_run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         # Need to deep copy so that the serialized context doesn't contain non-serializable data
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, TypeVar
 
 from attrs import NOTHING, Attribute, Factory, NothingType, define, field
 from pydantic import BaseModel
@@ -20,7 +23,7 @@ from griptape.artifacts import (
     ModelArtifact,
     TextArtifact,
 )
-from griptape.common import PromptStack
+from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.memory.structure import Run
 from griptape.mixins.actions_subtask_origin_mixin import ActionsSubtaskOriginMixin
@@ -38,6 +41,43 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(Defaults.logging_config.logger_name)
 
+T = TypeVar("T")
+
+
+@define
+class _PromptStackCache:
+    """Parts of a `PromptTask`'s prompt stack that are reused between the prompts of a run.
+
+    Attributes:
+        system_template: The rendered system template.
+        meta_memory_count: Number of meta memory entries that `system_template` was rendered with. Off-prompt Tools add
+            entries while the task runs, so the template is rendered again when it changes.
+        input: The processed task input.
+        subtask_messages: Messages of finished subtasks, in order, with the subtask that added them.
+    """
+
+    system_template: str | None = field(default=None)
+    meta_memory_count: int = field(default=0)
+    input: BaseArtifact | None = field(default=None)
+    subtask_messages: list[tuple[BaseSubtask, list[Message]]] = field(factory=list)
+
+
+@define(frozen=True)
+class _SubtaskRunnerCall:
+    """A call to one of a `PromptTask`'s `subtask_runners`, as a step of its run."""
+
+    subtask_runner: Callable[[BaseArtifact], BaseArtifact] = field()
+    subtask_input: BaseArtifact = field()
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    # A prompt stack to prompt the Prompt Driver with, a subtask to run, or a subtask runner to call.
+    _Step = PromptStack | BaseSubtask | _SubtaskRunnerCall
+    # Steps are sent the output of running them, and return the output of the run.
+    _Steps = Generator[_Step, BaseArtifact, T]
+
 
 @define
 class PromptTask(
@@ -85,6 +125,7 @@ class PromptTask(
         ),
         kw_only=True,
     )
+    _prompt_stack_cache: _PromptStackCache | None = field(default=None, init=False)
 
     @property
     def rulesets(self) -> list:
@@ -124,20 +165,42 @@ class PromptTask(
 
     @property
     def prompt_stack(self) -> PromptStack:
+        """The prompt stack for the next prompt.
+
+        While the task runs, the input and messages of finished subtasks are built once and reused, so that only the
+        latest subtask is added again for each prompt. The system template is reused until meta memory entries are
+        added.
+        """
         stack = PromptStack(tools=self.tools, output_schema=self.output_schema)
         memory = self.conversation_memory
+        cache = self._prompt_stack_cache
+
+        if cache is None:
+            system_template = self.generate_system_template(self)
+            task_input = self.input
+        else:
+            meta_memory_count = len(self.meta_memories)
+
+            if cache.system_template is None or cache.meta_memory_count != meta_memory_count:
+                cache.system_template = self.generate_system_template(self)
+                cache.meta_memory_count = meta_memory_count
+            if cache.input is None:
+                cache.input = self.input
+            system_template = cache.system_template
+            task_input = cache.input
 
-        system_template = self.generate_system_template(self)
         if system_template:
             stack.add_system_message(system_template)
 
-        stack.add_user_message(self.input)
+        stack.add_user_message(task_input)
 
         if self.output:
             stack.add_assistant_message(self.output.to_text())
-        else:
+        elif cache is None:
             for s in self.subtasks:
                 s.add_to_prompt_stack(stack)
+        else:
+            self.__add_subtasks_to_prompt_stack(stack, cache)
 
         if memory is not None:
             # inserting at index 1 to place memory right after system prompt
@@ -206,19 +269,12 @@ class PromptTask(
             conversation_memory.add_run(run)
 
     def try_run(self) -> ListArtifact | TextArtifact | AudioArtifact | GenericArtifact | JsonArtifact | ErrorArtifact:
-        self.subtasks.clear()
-        if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
-            self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
-
-        output = self.prompt_driver.run(self.prompt_stack).to_artifact(
-            meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
-        )
-        for subtask_runner in self.subtask_runners:
-            output = subtask_runner(output)
+        return self.__run_steps(self.__try_run_steps())
 
-        if isinstance(output, (ListArtifact, TextArtifact, AudioArtifact, JsonArtifact, ModelArtifact, ErrorArtifact)):
-            return output
-        raise ValueError(f"Unsupported output type: {type(output)}")
+    async def try_arun(
+        self,
+    ) -> ListArtifact | TextArtifact | AudioArtifact | GenericArtifact | JsonArtifact | ErrorArtifact:
+        return await self.__arun_steps(self.__try_run_steps())
 
     def preprocess(self, structure: Structure) -> BaseTask:
         super().preprocess(structure)
@@ -298,6 +354,52 @@ class PromptTask(
         raise ValueError(f"Memory with name {memory_name} not found.")
 
     def default_run_actions_subtasks(self, subtask_input: BaseArtifact) -> BaseArtifact:
+        return self.__run_steps(self.__actions_subtasks_steps(subtask_input))
+
+    def default_run_output_schema_validation_subtasks(self, subtask_input: BaseArtifact) -> BaseArtifact:
+        return self.__run_steps(self.__output_schema_validation_subtasks_steps(subtask_input))
+
+    async def _arun_subtask_runner(
+        self, subtask_runner: Callable[[BaseArtifact], BaseArtifact], subtask_input: BaseArtifact
+    ) -> BaseArtifact:
+        # The default runners have async versions; custom runners can be async, or are run in a worker thread.
+        if subtask_runner == self.default_run_actions_subtasks:
+            return await self.__arun_steps(self.__actions_subtasks_steps(subtask_input))
+        if subtask_runner == self.default_run_output_schema_validation_subtasks:
+            return await self.__arun_steps(self.__output_schema_validation_subtasks_steps(subtask_input))
+        if inspect.iscoroutinefunction(subtask_runner):
+            return await subtask_runner(subtask_input)
+        return await asyncio.to_thread(subtask_runner, subtask_input)
+
+    @contextmanager
+    def _caching_prompt_stack(self) -> Iterator[None]:
+        self._prompt_stack_cache = _PromptStackCache()
+
+        try:
+            yield
+        finally:
+            self._prompt_stack_cache = None
+
+    # The steps of a run are written once, as generators that yield the prompt stacks, subtasks, and subtask runner calls
+    # to run, and are run by `__run_steps` or `__arun_steps`, so that `try_run` and `try_arun` work the same way.
+
+    def __try_run_steps(
+        self,
+    ) -> _Steps[ListArtifact | TextArtifact | AudioArtifact | GenericArtifact | JsonArtifact | ErrorArtifact]:
+        self.subtasks.clear()
+        if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
+            self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
+
+        with self._caching_prompt_stack():
+            output = yield self.prompt_stack
+            for subtask_runner in self.subtask_runners:
+                output = yield _SubtaskRunnerCall(subtask_runner, output)
+
+        if isinstance(output, (ListArtifact, TextArtifact, AudioArtifact, JsonArtifact, ModelArtifact, ErrorArtifact)):
+            return output
+        raise ValueError(f"Unsupported output type: {type(output)}")
+
+    def __actions_subtasks_steps(self, subtask_input: BaseArtifact) -> _Steps[BaseArtifact]:
         if not self.tools:
             return subtask_input
         subtask = self.add_subtask(
@@ -314,17 +416,15 @@ class PromptTask(
             if len(self.subtasks) >= self.max_subtasks:
                 subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
             else:
-                subtask.run()
+                yield subtask
 
                 if self.reflect_on_tool_use:
-                    output = self.prompt_driver.run(self.prompt_stack).to_artifact(
-                        meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
-                    )
+                    output = yield self.prompt_stack
                     subtask = self.add_subtask(ActionsSubtask(output))
 
         return subtask.output
 
-    def default_run_output_schema_validation_subtasks(self, subtask_input: BaseArtifact) -> BaseArtifact:
+    def __output_schema_validation_subtasks_steps(self, subtask_input: BaseArtifact) -> _Steps[BaseArtifact]:
         if self.output_schema is None:
             return subtask_input
         subtask = self.add_subtask(OutputSchemaValidationSubtask(subtask_input, output_schema=self.output_schema))
@@ -333,16 +433,73 @@ class PromptTask(
             if len(self.subtasks) >= self.max_subtasks:
                 subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
             else:
-                subtask.run()
+                yield subtask
 
-                output = subtask.output
-                output = self.prompt_driver.run(self.prompt_stack).to_artifact(
-                    meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
-                )
+                output = yield self.prompt_stack
                 subtask = self.add_subtask(OutputSchemaValidationSubtask(output, output_schema=self.output_schema))
 
         return subtask.output
 
+    def __run_steps(self, steps: _Steps[T]) -> T:
+        # Closing the generator on errors exits its `with` blocks.
+        with closing(steps):
+            try:
+                step = next(steps)
+                while True:
+                    step = steps.send(self.__run_step(step))
+            except StopIteration as e:
+                return e.value
+
+    async def __arun_steps(self, steps: _Steps[T]) -> T:
+        with closing(steps):
+            try:
+                step = next(steps)
+                while True:
+                    step = steps.send(await self.__arun_step(step))
+            except StopIteration as e:
+                return e.value
+
+    def __run_step(self, step: _Step) -> BaseArtifact:
+        if isinstance(step, PromptStack):
+            return self.prompt_driver.run(step).to_artifact(
+                meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
+            )
+        if isinstance(step, BaseSubtask):
+            return step.run()
+        return step.subtask_runner(step.subtask_input)
+
+    async def __arun_step(self, step: _Step) -> BaseArtifact:
+        if isinstance(step, PromptStack):
+            return (await self.prompt_driver.arun(step)).to_artifact(
+                meta={"is_react_prompt": not self.prompt_driver.use_native_tools}
+            )
+        if isinstance(step, BaseSubtask):
+            return await step.arun()
+        return await self._arun_subtask_runner(step.subtask_runner, step.subtask_input)
+
+    def __add_subtasks_to_prompt_stack(self, stack: PromptStack, cache: _PromptStackCache) -> None:
+        # A subtask is only followed by another one once it's finished, so only the last subtask's messages can change.
+        finished_subtasks = self.subtasks[:-1]
+        cached_count = 0
+
+        for (cached_subtask, _), subtask in zip(cache.subtask_messages, finished_subtasks, strict=False):
+            if cached_subtask is not subtask:
+                break
+            cached_count += 1
+
+        del cache.subtask_messages[cached_count:]
+
+        for subtask in finished_subtasks[cached_count:]:
+            subtask_stack = PromptStack(tools=stack.tools, output_schema=stack.output_schema)
+            subtask.add_to_prompt_stack(subtask_stack)
+            cache.subtask_messages.append((subtask, subtask_stack.messages))
+
+        for _, messages in cache.subtask_messages:
+            stack.messages.extend(messages)
+
+        for subtask in self.subtasks[-1:]:
+            subtask.add_to_prompt_stack(stack)
+
     def _process_task_input(
         self,
         task_input: str | tuple | list | BaseArtifact | Callable[[BaseTask], BaseArtifact],
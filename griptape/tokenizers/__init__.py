@@ -1,4 +1,5 @@
 from griptape.tokenizers.base_tokenizer import BaseTokenizer
+from griptape.tokenizers.base_remote_tokenizer import BaseRemoteTokenizer
 from griptape.tokenizers.openai_tokenizer import OpenAiTokenizer
 from griptape.tokenizers.cohere_tokenizer import CohereTokenizer
 from griptape.tokenizers.huggingface_tokenizer import HuggingFaceTokenizer
@@ -14,6 +15,7 @@ from griptape.tokenizers.grok_tokenizer import GrokTokenizer
 __all__ = [
     "AmazonBedrockTokenizer",
     "AnthropicTokenizer",
+    "BaseRemoteTokenizer",
     "BaseTokenizer",
     "CohereTokenizer",
     "DummyTokenizer",
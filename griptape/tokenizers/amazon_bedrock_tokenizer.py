@@ -7,6 +7,9 @@ from griptape.tokenizers.base_tokenizer import BaseTokenizer
 
 @define()
 class AmazonBedrockTokenizer(BaseTokenizer):
+    # Counting is cheaper than hashing the text for the cache.
+    DEFAULT_TOKEN_COUNT_CACHE_SIZE = 0
+
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {
         "anthropic.claude-opus-4": 200000,
         "anthropic.claude-sonnet-4": 200000,
@@ -56,5 +59,5 @@ class AmazonBedrockTokenizer(BaseTokenizer):
     model: str = field(kw_only=True)
     characters_per_token: int = field(default=4, kw_only=True)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return (len(text) + self.characters_per_token - 1) // self.characters_per_token
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
 
-from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers import BaseRemoteTokenizer
 from griptape.utils import import_optional_dependency
 
 if TYPE_CHECKING:
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 
 @define()
-class AnthropicTokenizer(BaseTokenizer):
+class AnthropicTokenizer(BaseRemoteTokenizer):
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {
         "claude-opus-4": 200000,
         "claude-sonnet-4": 200000,
@@ -35,11 +35,18 @@ class AnthropicTokenizer(BaseTokenizer):
     )
 
     def count_tokens(self, text: str | list[BetaMessageParam]) -> int:
+        # TODO: Refactor all Tokenizers to support Prompt Stack as an input.
+        if isinstance(text, str):
+            return super().count_tokens(text)
+
+        return self._count_message_tokens(text)
+
+    def try_count_remote_tokens(self, text: str) -> int:
         types = import_optional_dependency("anthropic.types.beta")
 
-        # TODO: Refactor all Tokenizers to support Prompt Stack as an input.
-        messages = [types.BetaMessageParam(role="user", content=text)] if isinstance(text, str) else text
+        return self._count_message_tokens([types.BetaMessageParam(role="user", content=text)])
 
+    def _count_message_tokens(self, messages: list[BetaMessageParam]) -> int:
         usage = self.client.beta.messages.count_tokens(
             model=self.model,
             messages=messages,
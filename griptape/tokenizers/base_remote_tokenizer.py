@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import math
+import re
+from abc import ABC, abstractmethod
+from typing import Literal
+
+from attrs import define, field
+
+from griptape.tokenizers import BaseTokenizer
+
+# Each match is one of: an ASCII word, a number, whitespace, a run of non-ASCII characters, or any other character.
+_TOKEN_ESTIMATE_PATTERN = re.compile(r"([A-Za-z]+)|([0-9]+)|(\s+)|([^\x00-\x7f]+)|(.)", re.DOTALL)
+_WORD, _NUMBER, _WHITESPACE, _NON_ASCII = 1, 2, 3, 4
+
+
+@define()
+class BaseRemoteTokenizer(BaseTokenizer, ABC):
+    """Base class for Tokenizers that count tokens with the provider's API.
+
+    Counting every text remotely can take hundreds of requests when chunking a single document, so these Tokenizers
+    can estimate token counts locally instead.
+
+    Attributes:
+        token_count_mode: How tokens are counted. `remote` counts every text with the provider's API. `estimate` counts
+            tokens locally, without network requests. `hybrid` counts tokens locally like `estimate`, but uses the
+            provider's API for texts whose estimate is too close to a token limit to tell which side of it they are on.
+        token_estimate_margin: Fraction that estimates are increased by, so that they are rarely lower than the real
+            token count. It is also used as the expected error of estimates in `hybrid` mode.
+    """
+
+    # Estimates assume that common words are single tokens, and split longer words into tokens of this many characters.
+    CHARACTERS_PER_WORD_TOKEN = 6
+    DIGITS_PER_TOKEN = 1
+    NON_ASCII_CHARACTERS_PER_TOKEN = 1
+
+    token_count_mode: Literal["remote", "estimate", "hybrid"] = field(default="remote", kw_only=True)
+    token_estimate_margin: float = field(default=0.1, kw_only=True)
+
+    def try_count_tokens(self, text: str) -> int:
+        if self.token_count_mode == "remote":
+            return self.try_count_remote_tokens(text)
+        return self.estimate_tokens(text)
+
+    @abstractmethod
+    def try_count_remote_tokens(self, text: str) -> int:
+        """Counts the tokens of a text with the provider's API."""
+        ...
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimates the tokens of a text without network requests, including `token_estimate_margin`."""
+        estimate = 0
+
+        for match in _TOKEN_ESTIMATE_PATTERN.finditer(text):
+            length = match.end() - match.start()
+
+            if match.lastindex == _WORD:
+                estimate += math.ceil(length / self.CHARACTERS_PER_WORD_TOKEN)
+            elif match.lastindex == _NUMBER:
+                estimate += math.ceil(length / self.DIGITS_PER_TOKEN)
+            elif match.lastindex == _WHITESPACE:
+                # Single spaces are part of the next word's token.
+                estimate += 0 if match.group() == " " else 1
+            elif match.lastindex == _NON_ASCII:
+                estimate += math.ceil(length / self.NON_ASCII_CHARACTERS_PER_TOKEN)
+            else:
+                estimate += 1
+
+        return math.ceil(estimate * (1 + self.token_estimate_margin))
+
+    def count_tokens_for_limit(self, text: str, max_tokens: int) -> int:
+        token_count = self.count_tokens(text)
+
+        if self.token_count_mode == "hybrid" and self.__is_near_limit(token_count, max_tokens):
+            return self.try_count_remote_tokens(text)
+        return token_count
+
+    def __is_near_limit(self, estimate: int, max_tokens: int) -> bool:
+        # Estimates include the margin, so the real count is expected to be between the estimate without the margin
+        # decreased by the margin, and the estimate itself. Rounding down makes up for estimates being rounded up.
+        lowest_count = math.floor(estimate * (1 - self.token_estimate_margin) / (1 + self.token_estimate_margin))
+
+        return lowest_count <= max_tokens < estimate
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
 
 from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils.decorators import lazy_property
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 @define()
 class BaseTokenizer(ABC, SerializableMixin):
+    """Base Tokenizer.
+
+    Attributes:
+        model: The name of the model whose tokens are counted.
+        stop_sequences: Sequences at which generation stops.
+        token_count_cache_size: The maximum number of token counts to keep in an LRU cache keyed by a hash of the text.
+            Set to 0 to disable caching.
+        token_count_cache_hits: The number of token counts served from the cache.
+        token_count_cache_misses: The number of token counts computed by the tokenizer.
+    """
+
     DEFAULT_MAX_INPUT_TOKENS = 4096
     DEFAULT_MAX_OUTPUT_TOKENS = 1000
+    DEFAULT_TOKEN_COUNT_CACHE_SIZE = 2048
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {}
     MODEL_PREFIXES_TO_MAX_OUTPUT_TOKENS = {}
 
@@ -24,6 +43,26 @@ class BaseTokenizer(ABC, SerializableMixin):
     _max_output_tokens: int | None = field(
         kw_only=True, default=None, alias="max_output_tokens", metadata={"serializable": True}
     )
+    token_count_cache_size: int = field(
+        default=Factory(lambda self: self.DEFAULT_TOKEN_COUNT_CACHE_SIZE, takes_self=True), kw_only=True
+    )
+    token_count_cache_hits: int = field(default=0, init=False, eq=False, repr=False)
+    token_count_cache_misses: int = field(default=0, init=False, eq=False, repr=False)
+    _token_count_cache: OrderedDict[bytes, int] = field(default=Factory(OrderedDict), init=False, eq=False, repr=False)
+    _token_count_cache_lock: threading.Lock = field(default=Factory(threading.Lock), init=False, eq=False, repr=False)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Tokenizers that override `count_tokens` instead of `try_count_tokens` count tokens without the cache.
+        if cls.count_tokens is not BaseTokenizer.count_tokens and getattr(
+            cls.try_count_tokens, "__isabstractmethod__", False
+        ):
+
+            def try_count_tokens(self: BaseTokenizer, text: str) -> int:
+                return self.count_tokens(text)
+
+            cls.try_count_tokens = try_count_tokens
 
     @lazy_property()
     def max_input_tokens(self) -> int:
@@ -43,22 +82,92 @@ class BaseTokenizer(ABC, SerializableMixin):
                 self.max_output_tokens = self._default_max_output_tokens()
 
     def count_input_tokens_left(self, text: str) -> int:
-        diff = self.max_input_tokens - self.count_tokens(text)
+        diff = self.max_input_tokens - self.count_tokens_for_limit(text, self.max_input_tokens)
 
         if diff > 0:
             return diff
         return 0
 
     def count_output_tokens_left(self, text: str) -> int:
-        diff = self.max_output_tokens - self.count_tokens(text)
+        diff = self.max_output_tokens - self.count_tokens_for_limit(text, self.max_output_tokens)
 
         if diff > 0:
             return diff
         return 0
 
-    @abstractmethod
+    @property
+    def token_count_cache_hit_rate(self) -> float:
+        lookups = self.token_count_cache_hits + self.token_count_cache_misses
+
+        return self.token_count_cache_hits / lookups if lookups else 0.0
+
     def count_tokens(self, text: str) -> int:
-        pass
+        return self.count_tokens_batch([text])[0]
+
+    def count_tokens_for_limit(self, text: str, max_tokens: int) -> int:
+        """Counts the tokens of a text that is about to be compared to a token limit.
+
+        Tokenizers that estimate token counts can count texts that are close to the limit exactly.
+
+        Args:
+            text: The text to count tokens for.
+            max_tokens: The token limit that the count is compared to.
+        """
+        return self.count_tokens(text)
+
+    def count_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Counts the tokens of multiple texts, only passing texts that are not in the cache to the tokenizer.
+
+        Args:
+            texts: The texts to count tokens for.
+
+        Returns:
+            The token counts, in the same order as `texts`.
+        """
+        if self.token_count_cache_size <= 0:
+            return self.try_count_tokens_batch(list(texts))
+
+        keys = [hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest() for text in texts]
+
+        with self._token_count_cache_lock:
+            counts = {key: self._token_count_cache.get(key) for key in keys}
+            for key, count in counts.items():
+                if count is not None:
+                    self._token_count_cache.move_to_end(key)
+
+        # Identical texts are only counted once.
+        misses = {key: text for key, text in zip(keys, texts, strict=True) if counts[key] is None}
+
+        if misses:
+            counts.update(zip(misses.keys(), self.try_count_tokens_batch(list(misses.values())), strict=True))
+
+        with self._token_count_cache_lock:
+            for key in misses:
+                self._token_count_cache[key] = counts[key]  # pyright: ignore[reportArgumentType] Every miss is counted by now
+            while len(self._token_count_cache) > self.token_count_cache_size:
+                self._token_count_cache.popitem(last=False)
+
+            self.token_count_cache_misses += len(misses)
+            self.token_count_cache_hits += len(texts) - len(misses)
+
+        return [counts[key] for key in keys]  # pyright: ignore[reportReturnType] Every key is counted by now
+
+    def clear_token_count_cache(self) -> None:
+        with self._token_count_cache_lock:
+            self._token_count_cache.clear()
+
+    @abstractmethod
+    def try_count_tokens(self, text: str) -> int:
+        """Counts the tokens of a text without using the cache."""
+        ...
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of multiple texts without using the cache.
+
+        Tokenizers whose backend can count many texts in a single call should override this method, the default
+        implementation counts the texts one at a time.
+        """
+        return [self.try_count_tokens(text) for text in texts]
 
     def _default_max_input_tokens(self) -> int:
         tokens = next(
@@ -8,9 +8,11 @@ from griptape.tokenizers import BaseTokenizer
 
 @define
 class DummyTokenizer(BaseTokenizer):
+    DEFAULT_TOKEN_COUNT_CACHE_SIZE = 0
+
     model: str | None = field(default=None, kw_only=True)
     _max_input_tokens: int = field(init=False, default=0, kw_only=True, alias="max_input_tokens")
     _max_output_tokens: int = field(init=False, default=0, kw_only=True, alias="max_output_tokens")
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         raise DummyError(__class__.__name__, "count_tokens")
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from attrs import define, field
 
-from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers import BaseRemoteTokenizer
 from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 
 @define()
-class GoogleTokenizer(BaseTokenizer):
+class GoogleTokenizer(BaseRemoteTokenizer):
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {"gemini-1.5-pro": 2097152, "gemini": 1048576}
     MODEL_PREFIXES_TO_MAX_OUTPUT_TOKENS = {"gemini": 8192}
 
@@ -27,4 +27,11 @@ class GoogleTokenizer(BaseTokenizer):
         return genai.Client(api_key=self.api_key)
 
     def count_tokens(self, text: str) -> int:
+        # Prompt Stacks and message lists are passed through as-is and are not cached.
+        if isinstance(text, str):
+            return super().count_tokens(text)
+
+        return self.try_count_remote_tokens(text)
+
+    def try_count_remote_tokens(self, text: str) -> int:
         return self.client.models.count_tokens(model=self.model, contents=text).total_tokens or 0
@@ -26,7 +26,7 @@ class GrokTokenizer(BaseTokenizer):
         default=Factory(lambda self: {"Authorization": f"Bearer {self.api_key}"}, takes_self=True), kw_only=True
     )
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         response = requests.post(
             urljoin(self.base_url, "/v1/tokenize-text"),
             headers=self.headers,
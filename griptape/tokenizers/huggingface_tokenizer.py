@@ -27,5 +27,8 @@ class HuggingFaceTokenizer(BaseTokenizer):
     )
     _max_output_tokens: int = field(default=4096, kw_only=True, alias="max_output_tokens")
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return len(self.tokenizer.encode(text))  # pyright: ignore[reportArgumentType]
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [len(input_ids) for input_ids in self.tokenizer(texts)["input_ids"]]  # pyright: ignore[reportArgumentType]
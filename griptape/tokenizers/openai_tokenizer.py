@@ -148,4 +148,10 @@ class OpenAiTokenizer(BaseTokenizer):
             num_tokens += 3
 
             return num_tokens
+        return super().count_tokens(text)
+
+    def try_count_tokens(self, text: str) -> int:
         return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts, allowed_special=set(self.stop_sequences))]
@@ -7,8 +7,11 @@ from griptape.tokenizers import BaseTokenizer
 
 @define()
 class SimpleTokenizer(BaseTokenizer):
+    # Counting is cheaper than hashing the text for the cache.
+    DEFAULT_TOKEN_COUNT_CACHE_SIZE = 0
+
     model: str | None = field(init=False, default=None, kw_only=True)
     characters_per_token: int = field(kw_only=True)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return (len(text) + self.characters_per_token - 1) // self.characters_per_token
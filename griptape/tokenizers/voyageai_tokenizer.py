@@ -31,5 +31,5 @@ class VoyageAiTokenizer(BaseTokenizer):
         kw_only=True,
     )
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return self.client.count_tokens([text], model=self.model)
@@ -106,30 +106,31 @@ class BaseTool(ActivityMixin, SerializableMixin, RunnableMixin["BaseTool"], ABC)
     # This method has to remain a method and can't be decorated with @property because
     # of the max depth recursion issue in `self.activities`.
     def schema(self) -> dict:
-        full_schema = Schema(Or(*self.activity_schemas()), description=f"{self.name} action schema.")
+        activity_schemas = self.activity_schemas()
+
+        full_schema = self._cached_activity_schema(
+            ("schema",),
+            (self.name, *activity_schemas),
+            lambda: Schema(Or(*activity_schemas), description=f"{self.name} action schema.").json_schema(
+                f"{self.name} ToolAction Schema"
+            ),
+        )
 
-        return full_schema.json_schema(f"{self.name} ToolAction Schema")
+        return {**full_schema}
 
     def activity_schemas(self) -> list[Schema]:
-        schemas = []
-
-        for activity in self.activities():
-            schema_dict: dict[Literal | schema.Optional, Any] = {
-                Literal("name"): self.name,
-                Literal("path", description=self.activity_description(activity)): self.activity_name(activity),
-            }
-
-            activity_schema = self.activity_schema(activity)
-            # If no schema is defined, we just make `input` optional instead of omitting it.
-            # This works better with lower-end models that may accidentally pass in an empty dict.
-            if activity_schema is None:
-                schema_dict[schema.Optional("input")] = {}
-            else:
-                schema_dict[Literal("input")] = activity_schema
-
-            schemas.append(Schema(schema_dict))
-
-        return schemas
+        activities = [
+            (self.activity_name(activity), self.activity_description(activity), self.activity_schema(activity))
+            for activity in self.activities()
+        ]
+
+        return list(
+            self._cached_activity_schema(
+                ("activity_schemas",),
+                (self.name, *activities),
+                lambda: tuple(self.__build_activity_schema(*activity) for activity in activities),
+            )
+        )
 
     def run(self, activity: Callable, subtask: ActionsSubtask, action: ToolAction) -> BaseArtifact:
         try:
@@ -247,6 +248,21 @@ class BaseTool(ActivityMixin, SerializableMixin, RunnableMixin["BaseTool"], ABC)
 
         return f"{tool_name}_{activity_name}"
 
+    def __build_activity_schema(self, activity_name: str, description: str, activity_schema: Any) -> Schema:
+        schema_dict: dict[Literal | schema.Optional, Any] = {
+            Literal("name"): self.name,
+            Literal("path", description=description): activity_name,
+        }
+
+        # If no schema is defined, we just make `input` optional instead of omitting it.
+        # This works better with lower-end models that may accidentally pass in an empty dict.
+        if activity_schema is None:
+            schema_dict[schema.Optional("input")] = {}
+        else:
+            schema_dict[Literal("input")] = activity_schema
+
+        return Schema(schema_dict)
+
     def are_requirements_met(self, requirements_path: str) -> bool:
         requirements = Path(requirements_path).read_text().splitlines()
 
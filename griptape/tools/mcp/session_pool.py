@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import functools
+import logging
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import Factory, define, field
+
+from .sessions import create_session
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine, Hashable
+    from contextlib import AbstractAsyncContextManager
+
+    from mcp import ClientSession  # pyright: ignore[reportAttributeAccessIssue]
+
+    from .sessions import Connection
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_thread: threading.Thread | None = None
+_event_loop_lock = threading.Lock()
+_session_pools: weakref.WeakSet[McpSessionPool] = weakref.WeakSet()
+# Pools that are shared by every user of a connection, with the number of users that haven't released them.
+_shared_session_pools: dict[Hashable, tuple[McpSessionPool, int]] = {}
+_shared_session_pools_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns the event loop that all MCP sessions run on, starting its background thread on first use."""
+    global _event_loop, _event_loop_thread  # noqa: PLW0603
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            _event_loop_thread = threading.Thread(
+                target=_event_loop.run_forever, name="griptape-mcp-event-loop", daemon=True
+            )
+            _event_loop_thread.start()
+            atexit.register(_shutdown_event_loop)
+
+        return _event_loop
+
+
+def acquire_session_pool(connection: Connection) -> McpSessionPool:
+    """Returns the session pool that is shared by every user of a connection, opening it on first use.
+
+    Every call must be matched by a call to `release_session_pool`, which closes the pool once it has no users.
+
+    Args:
+        connection: The MCP server connection info.
+
+    Returns:
+        The shared session pool.
+    """
+    key = _connection_key(connection)
+
+    with _shared_session_pools_lock:
+        session_pool, user_count = _shared_session_pools.get(key, (None, 0))
+
+        if session_pool is None:
+            # The pool's sessions must not reference its users, so that users that aren't closed can be released when
+            # they're garbage collected.
+            session_pool = McpSessionPool(functools.partial(create_session, connection))
+
+        _shared_session_pools[key] = (session_pool, user_count + 1)
+
+        return session_pool
+
+
+def release_session_pool(session_pool: McpSessionPool) -> bool:
+    """Releases a session pool that was returned by `acquire_session_pool`, closing it if it has no other users.
+
+    Args:
+        session_pool: The session pool to release.
+
+    Returns:
+        Whether the session pool is shared. Pools that aren't shared are left open.
+    """
+    with _shared_session_pools_lock:
+        key = next((key for key, (pool, _) in _shared_session_pools.items() if pool is session_pool), None)
+
+        if key is None:
+            return False
+
+        user_count = _shared_session_pools[key][1] - 1
+
+        if user_count > 0:
+            _shared_session_pools[key] = (session_pool, user_count)
+        else:
+            del _shared_session_pools[key]
+
+    if user_count == 0:
+        session_pool.close()
+
+    return True
+
+
+def release_session_pool_soon(session_pool: McpSessionPool) -> None:
+    """Releases a session pool like `release_session_pool`, but on the MCP event loop thread, without waiting.
+
+    Safe to call from finalizers, which can run on any thread, at any time.
+
+    Args:
+        session_pool: The session pool to release.
+    """
+    get_event_loop().call_soon_threadsafe(release_session_pool, session_pool)
+
+
+def _connection_key(value: Any) -> Hashable:
+    # Connections are dicts that can contain lists, dicts, and objects such as HTTP client factories.
+    if isinstance(value, dict):
+        return tuple(sorted((key, _connection_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_connection_key(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+
+    return value
+
+
+def _shutdown_event_loop() -> None:
+    global _event_loop, _event_loop_thread  # noqa: PLW0603
+
+    for session_pool in list(_session_pools):
+        session_pool.close()
+
+    with _event_loop_lock:
+        if _event_loop is not None and _event_loop_thread is not None:
+            _event_loop.call_soon_threadsafe(_event_loop.stop)
+            _event_loop_thread.join()
+            _event_loop.close()
+
+        _event_loop = None
+        _event_loop_thread = None
+
+
+@define
+class _PooledSession:
+    session: ClientSession = field()
+    owner_task: asyncio.Task = field()
+    close_event: asyncio.Event = field()
+    last_used: float = field(default=Factory(time.monotonic))
+
+    @property
+    def is_connected(self) -> bool:
+        return not self.owner_task.done()
+
+
+@define(eq=False)
+class McpSessionPool:
+    """A pool of initialized MCP sessions to a single server that are reused across tool calls.
+
+    All sessions run on a single background event loop thread that is shared by every pool, so synchronous callers
+    can run coroutines with `run` from any thread, and concurrent callers run their coroutines concurrently.
+
+    Attributes:
+        session_factory: Creates an async context manager that opens a new, uninitialized session.
+        max_sessions: Maximum number of sessions to open at once. Callers wait for a free session beyond this.
+        health_check_interval: Idle sessions are pinged before they are reused if they have not been used for this
+            many seconds. Sessions that fail the health check are closed and replaced.
+        health_check_timeout: Seconds to wait for a health check ping before a session is considered broken.
+    """
+
+    session_factory: Callable[[], AbstractAsyncContextManager[ClientSession]] = field()
+    max_sessions: int = field(default=4, kw_only=True)
+    health_check_interval: float = field(default=30, kw_only=True)
+    health_check_timeout: float = field(default=5, kw_only=True)
+    _idle_sessions: list[_PooledSession] = field(factory=list, init=False)
+    _session_count: int = field(default=0, init=False)
+    _condition: asyncio.Condition = field(factory=asyncio.Condition, init=False)
+    _closed: bool = field(default=False, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        _session_pools.add(self)
+
+    @property
+    def session_count(self) -> int:
+        return self._session_count
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the background event loop and blocks until it completes.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+        """
+        event_loop = get_event_loop()
+
+        if threading.current_thread() is _event_loop_thread:
+            coroutine.close()
+
+            raise RuntimeError("McpSessionPool.run cannot be called from the MCP event loop thread.")
+
+        return asyncio.run_coroutine_threadsafe(coroutine, event_loop).result()
+
+    async def call(self, fn: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """Calls a function with a pooled session, opening a new session if none are free.
+
+        If the session's connection is lost during the call, the session is replaced and the call is retried once.
+
+        Args:
+            fn: An async function to call with an initialized session.
+
+        Returns:
+            The result of the function.
+        """
+        pooled_session = await self._acquire()
+
+        try:
+            return await fn(pooled_session.session)
+        except Exception:
+            if pooled_session.is_connected:
+                raise
+
+            logger.debug("MCP session disconnected during a call, reconnecting")
+        finally:
+            await self._release(pooled_session)
+
+        pooled_session = await self._acquire()
+
+        try:
+            return await fn(pooled_session.session)
+        finally:
+            await self._release(pooled_session)
+
+    def close(self) -> None:
+        """Closes all sessions. Sessions that are in use are closed when they are released."""
+        if self._closed:
+            return
+
+        self._closed = True
+
+        if _event_loop is None:
+            return
+        if threading.current_thread() is _event_loop_thread:
+            _event_loop.create_task(self._close_idle_sessions())
+        else:
+            asyncio.run_coroutine_threadsafe(self._close_idle_sessions(), _event_loop).result()
+
+    async def _acquire(self) -> _PooledSession:
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("McpSessionPool is closed.")
+
+                if self._idle_sessions:
+                    pooled_session = self._idle_sessions.pop()
+                    break
+
+                if self._session_count < self.max_sessions:
+                    self._session_count += 1
+                    pooled_session = None
+                    break
+
+                await self._condition.wait()
+
+        if pooled_session is None:
+            try:
+                return await self._open_session()
+            except BaseException:
+                async with self._condition:
+                    self._session_count -= 1
+                    self._condition.notify()
+
+                raise
+
+        if await self._check_health(pooled_session):
+            return pooled_session
+
+        await self._discard(pooled_session)
+
+        return await self._acquire()
+
+    async def _release(self, pooled_session: _PooledSession) -> None:
+        if self._closed or not pooled_session.is_connected:
+            await self._discard(pooled_session)
+        else:
+            pooled_session.last_used = time.monotonic()
+
+            async with self._condition:
+                self._idle_sessions.append(pooled_session)
+                self._condition.notify()
+
+    async def _discard(self, pooled_session: _PooledSession) -> None:
+        pooled_session.close_event.set()
+
+        with contextlib.suppress(BaseException):
+            await pooled_session.owner_task
+
+        async with self._condition:
+            self._session_count -= 1
+            self._condition.notify()
+
+    async def _check_health(self, pooled_session: _PooledSession) -> bool:
+        if not pooled_session.is_connected:
+            return False
+        if time.monotonic() - pooled_session.last_used < self.health_check_interval:
+            return True
+
+        try:
+            await asyncio.wait_for(pooled_session.session.send_ping(), self.health_check_timeout)
+        except Exception:
+            logger.debug("MCP session failed its health check, reconnecting")
+
+            return False
+
+        return True
+
+    async def _open_session(self) -> _PooledSession:
+        # The session's context manager has to be entered and exited by the same task, so each session is owned by a
+        # task that keeps it open until the session is discarded.
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        close_event = asyncio.Event()
+
+        async def own_session() -> None:
+            try:
+                async with self.session_factory() as session:
+                    await session.initialize()
+                    ready.set_result(session)
+
+                    await close_event.wait()
+            except asyncio.CancelledError:
+                ready.cancel()
+
+                raise
+            except BaseException as e:
+                if ready.done():
+                    logger.debug("MCP session closed with an error: %s", e)
+                else:
+                    ready.set_exception(e)
+
+        owner_task = asyncio.create_task(own_session())
+
+        return _PooledSession(session=await ready, owner_task=owner_task, close_event=close_event)
+
+    async def _close_idle_sessions(self) -> None:
+        async with self._condition:
+            idle_sessions = self._idle_sessions
+            self._idle_sessions = []
+            self._condition.notify_all()
+
+        for pooled_session in idle_sessions:
+            await self._discard(pooled_session)
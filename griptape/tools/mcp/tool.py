@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import re
-import threading
+import weakref
 from types import MethodType
 from typing import TYPE_CHECKING, Any
 
-from attrs import define, field
+from attrs import Factory, define, field
 from json_schema_to_pydantic import create_model
 from schema import Or
 
@@ -22,13 +21,13 @@ from griptape.artifacts import (
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
 
-from .sessions import Connection, create_session
+from .session_pool import McpSessionPool, acquire_session_pool, release_session_pool, release_session_pool_soon
+from .sessions import Connection  # noqa: TC001 - Schemas resolve the field annotations at runtime
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from contextlib import _AsyncGeneratorContextManager
 
-    from mcp import ClientSession, types  # pyright: ignore[reportAttributeAccessIssue]
+    from mcp import types  # pyright: ignore[reportAttributeAccessIssue]
 
 
 ANY_TYPE = Or(str, int, float, bool, list, dict)
@@ -126,36 +125,44 @@ def _exc_iter(exc) -> Any:  # noqa: ANN001
 class MCPTool(BaseTool):
     """MCP activities through a tool.
 
+    Sessions to the MCP server are initialized once and reused across activity calls, so stdio servers are only
+    spawned once. Tools with the same connection share their sessions. Parallel actions each use their own session,
+    up to `session_pool.max_sessions`. The shared sessions are closed once every tool that uses them is closed or
+    garbage collected.
+
     Attributes:
         connection: The MCP server connection info.
+        session_pool: The pool of sessions to the MCP server. Defaults to the pool shared by tools with the same
+            connection. Custom pools are only closed by `close`.
     """
 
     connection: Connection = field(kw_only=True)
+    session_pool: McpSessionPool = field(
+        default=Factory(lambda self: acquire_session_pool(self.connection), takes_self=True), kw_only=True
+    )
+    _session_pool_finalizer: weakref.finalize = field(init=False)
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
-        try:
-            asyncio.get_running_loop()
-            # Event loop is running, use a separate thread with its own loop
-            thread = threading.Thread(target=lambda: asyncio.run(self._init_activities()))
-            thread.start()
-            thread.join()  # Block until initialization completes
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run directly
-            asyncio.run(self._init_activities())
+
+        self._session_pool_finalizer = weakref.finalize(self, release_session_pool_soon, self.session_pool)
+        # Sessions are closed by the MCP event loop's own shutdown when the process exits.
+        self._session_pool_finalizer.atexit = False
+
+        self.session_pool.run(self._init_activities())
+
+    def close(self) -> None:
+        """Closes the tool's sessions to the MCP server, unless they are shared with other tools that aren't closed."""
+        if self._session_pool_finalizer.detach() is not None and not release_session_pool(self.session_pool):
+            self.session_pool.close()
 
     async def _init_activities(self) -> None:
-        async with self._get_session() as session:
-            await session.initialize()
-            tools_response = await session.list_tools()
+        tools_response = await self.session_pool.call(lambda session: session.list_tools())
 
         for tool in tools_response.tools:
             activity_handler = self._create_activity_handler(tool)
             setattr(self, self._sanitize_activity_name(tool.name), MethodType(activity_handler, self))
 
-    def _get_session(self) -> _AsyncGeneratorContextManager[ClientSession, None]:
-        return create_session(self.connection)
-
     def to_activity_json_schema(self, activity: Callable, schema_id: str) -> dict:
         """Override to post-process JSON schema and add items to bare arrays.
 
@@ -190,17 +197,7 @@ class MCPTool(BaseTool):
             }
         )
         def activity_handler(self: MCPTool, values: dict) -> Any:
-            try:
-                asyncio.get_running_loop()
-                # We're in an async context, need to handle this differently
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self._run_activity(tool.name, values))
-                    return future.result()
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                return asyncio.run(self._run_activity(tool.name, values))
+            return self.session_pool.run(self._run_activity(tool.name, values))
 
         return activity_handler
 
@@ -209,9 +206,7 @@ class MCPTool(BaseTool):
         from exceptiongroup import BaseExceptionGroup  # type: ignore[reportMissingImports]
 
         try:
-            async with self._get_session() as session:
-                await session.initialize()
-                tool_result = await session.call_tool(activity_name, params)
+            tool_result = await self.session_pool.call(lambda session: session.call_tool(activity_name, params))
             return self._convert_call_tool_result_to_artifact(tool_result)
         except BaseExceptionGroup as e:
             exception_message = "".join(f"\n{str(exc)}" for exc in _exc_iter(e))
@@ -6,6 +6,9 @@ from .python_runner import PythonRunner
 from .command_runner import CommandRunner
 from .chat import Chat
 from .futures import execute_futures_dict, execute_futures_list, execute_futures_list_dict
+from .executor_registry import ExecutorPool, ExecutorPoolMetrics, ExecutorRegistry, PooledExecutor
+from .micro_batcher import MicroBatcher
+from .queue_dispatcher import QueueDispatcher
 from .token_counter import TokenCounter
 from .dict_utils import (
     remove_null_values_in_dict_recursively,
@@ -36,9 +39,15 @@ __all__ = [
     "Chat",
     "CommandRunner",
     "Conversation",
+    "ExecutorPool",
+    "ExecutorPoolMetrics",
+    "ExecutorRegistry",
     "GriptapeCloudStructure",
     "ManifestValidator",
+    "MicroBatcher",
+    "PooledExecutor",
     "PythonRunner",
+    "QueueDispatcher",
     "Stream",
     "StructureVisualizer",
     "TokenCounter",
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, TypeVar
+
+from attrs import define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import ParamSpec
+
+    P = ParamSpec("P")
+
+T = TypeVar("T")
+
+# Set in each worker thread to the pool that owns it, to detect nested submits.
+_worker_state = threading.local()
+
+
+@define(frozen=True)
+class ExecutorPoolMetrics:
+    """A snapshot of an `ExecutorPool`'s metrics.
+
+    Attributes:
+        name: Name of the pool.
+        max_workers: Maximum number of worker threads.
+        queue_depth: Number of submitted calls that are waiting for a worker.
+        active_workers: Number of calls that are running on a worker.
+        submitted: Total number of submitted calls.
+        completed: Total number of finished calls.
+        inline_runs: Number of calls that were run in the submitting worker thread because the pool was saturated.
+        total_wait_time: Total seconds that calls waited for a worker.
+        max_wait_time: Longest time in seconds that a call waited for a worker.
+    """
+
+    name: str = field()
+    max_workers: int = field()
+    queue_depth: int = field()
+    active_workers: int = field()
+    submitted: int = field()
+    completed: int = field()
+    inline_runs: int = field()
+    total_wait_time: float = field()
+    max_wait_time: float = field()
+
+    @property
+    def average_wait_time(self) -> float:
+        started = self.completed + self.active_workers
+
+        return self.total_wait_time / started if started else 0.0
+
+
+@define(eq=False)
+class ExecutorPool:
+    """A named, bounded pool of worker threads that is shared by every caller in the process.
+
+    Callers use the pool through `PooledExecutor`s, which are cheap to create and can be used in a `with` block like a
+    `ThreadPoolExecutor`, without creating or shutting down threads.
+
+    A call that is submitted from a worker of any pool while every worker of this pool is busy runs in the submitting
+    thread instead of being queued, so nested uses of pools, such as a Workflow that runs inside another Workflow's
+    task, cannot deadlock waiting on each other.
+
+    Attributes:
+        name: Name of the pool, used for its thread names and metrics.
+        max_workers: Maximum number of worker threads.
+    """
+
+    name: str = field()
+    max_workers: int = field()
+    _thread_pool_executor: futures.ThreadPoolExecutor | None = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _queue_depth: int = field(default=0, init=False)
+    _active_workers: int = field(default=0, init=False)
+    _submitted: int = field(default=0, init=False)
+    _completed: int = field(default=0, init=False)
+    _inline_runs: int = field(default=0, init=False)
+    _total_wait_time: float = field(default=0.0, init=False)
+    _max_wait_time: float = field(default=0.0, init=False)
+
+    @property
+    def metrics(self) -> ExecutorPoolMetrics:
+        with self._lock:
+            return ExecutorPoolMetrics(
+                name=self.name,
+                max_workers=self.max_workers,
+                queue_depth=self._queue_depth,
+                active_workers=self._active_workers,
+                submitted=self._submitted,
+                completed=self._completed,
+                inline_runs=self._inline_runs,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def executor(self) -> PooledExecutor:
+        """Creates an executor that submits to this pool."""
+        return PooledExecutor(self)
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> futures.Future[T]:
+        """Submits a call to the pool.
+
+        Args:
+            fn: The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            A Future for the result of the call.
+        """
+        with self._lock:
+            self._submitted += 1
+
+            if (
+                getattr(_worker_state, "pool", None) is not None
+                and self._active_workers + self._queue_depth >= self.max_workers
+            ):
+                self._inline_runs += 1
+                future = None
+            else:
+                self._queue_depth += 1
+                future = self.__get_thread_pool_executor().submit(self.__run, time.perf_counter(), fn, *args, **kwargs)
+
+        if future is None:
+            return self.__run_inline(fn, *args, **kwargs)
+
+        future.add_done_callback(self.__on_future_done)
+
+        return future
+
+    def resize(self, max_workers: int) -> None:
+        """Changes the maximum number of worker threads.
+
+        Calls that were already submitted finish on the previous workers.
+
+        Args:
+            max_workers: The new maximum number of worker threads.
+        """
+        with self._lock:
+            self.max_workers = max_workers
+            thread_pool_executor = self._thread_pool_executor
+            self._thread_pool_executor = None
+
+        if thread_pool_executor is not None:
+            thread_pool_executor.shutdown(wait=False)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shuts down the pool's worker threads. They are started again by the next submitted call.
+
+        Args:
+            wait: Whether to wait for submitted calls to finish.
+        """
+        with self._lock:
+            thread_pool_executor = self._thread_pool_executor
+            self._thread_pool_executor = None
+
+        if thread_pool_executor is not None:
+            thread_pool_executor.shutdown(wait=wait)
+
+    def __get_thread_pool_executor(self) -> futures.ThreadPoolExecutor:
+        if self._thread_pool_executor is None:
+            self._thread_pool_executor = futures.ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"griptape-{self.name}",
+                initializer=self.__init_worker,
+            )
+
+        return self._thread_pool_executor
+
+    def __init_worker(self) -> None:
+        _worker_state.pool = self
+
+    def __run(self, submitted_at: float, fn: Callable[..., T], *args, **kwargs) -> T:
+        wait_time = time.perf_counter() - submitted_at
+
+        with self._lock:
+            self._queue_depth -= 1
+            self._active_workers += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active_workers -= 1
+                self._completed += 1
+
+    def __on_future_done(self, future: futures.Future) -> None:
+        # Cancelled calls never reach a worker.
+        if future.cancelled():
+            with self._lock:
+                self._queue_depth -= 1
+
+    def __run_inline(self, fn: Callable[..., T], *args, **kwargs) -> futures.Future[T]:
+        future: futures.Future[T] = futures.Future()
+        future.set_running_or_notify_cancel()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._completed += 1
+
+        return future
+
+
+class PooledExecutor(futures.Executor):
+    """An executor that runs calls on a shared `ExecutorPool`.
+
+    Shutting it down, for example by leaving a `with` block, waits for the calls that were submitted through it, but
+    leaves the pool's worker threads running for other callers.
+    """
+
+    def __init__(self, pool: ExecutorPool) -> None:
+        self.pool = pool
+        self._futures: set[futures.Future] = set()
+        self._condition = threading.Condition()
+        self._submitting = 0
+        self._shutdown = False
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> futures.Future[T]:
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            self._submitting += 1
+
+        # Submitted outside the lock, because the pool runs the call in this thread when it is saturated, and the call
+        # may submit through this executor too.
+        try:
+            future = self.pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.__end_submit(None)
+            raise
+
+        self.__end_submit(future)
+        future.add_done_callback(self.__discard_future)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        with self._condition:
+            self._shutdown = True
+
+            if wait:
+                self._condition.wait_for(lambda: self._submitting == 0)
+
+            pending_futures = list(self._futures)
+
+        if cancel_futures:
+            for future in pending_futures:
+                future.cancel()
+        if wait:
+            futures.wait(pending_futures)
+
+    def __end_submit(self, future: futures.Future | None) -> None:
+        with self._condition:
+            self._submitting -= 1
+
+            if future is not None:
+                self._futures.add(future)
+            self._condition.notify_all()
+
+    def __discard_future(self, future: futures.Future) -> None:
+        with self._condition:
+            self._futures.discard(future)
+
+
+@define(eq=False)
+class _ExecutorRegistry(SingletonMixin):
+    """A process-wide registry of named `ExecutorPool`s.
+
+    Pools are created on first use with `default_max_workers` workers, unless they were configured with
+    `configure_pool`.
+
+    Attributes:
+        default_max_workers: Number of worker threads for pools that were not configured, which defaults to the same
+            number as a `ThreadPoolExecutor`.
+    """
+
+    default_max_workers: int = field(default=min(32, (os.cpu_count() or 1) + 4), kw_only=True)
+    _pools: dict[str, ExecutorPool] = field(factory=dict, init=False)
+    _executor_factories: dict[str, Callable[[], PooledExecutor]] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def pools(self) -> dict[str, ExecutorPool]:
+        with self._lock:
+            return self._pools.copy()
+
+    def get_pool(self, name: str) -> ExecutorPool:
+        """Gets a pool by name, creating it if needed.
+
+        Args:
+            name: Name of the pool.
+        """
+        with self._lock:
+            if (pool := self._pools.get(name)) is None:
+                pool = self._pools[name] = ExecutorPool(name, max_workers=self.default_max_workers)
+
+            return pool
+
+    def configure_pool(self, name: str, *, max_workers: int) -> ExecutorPool:
+        """Sets the maximum number of worker threads for a pool, creating it if needed.
+
+        Args:
+            name: Name of the pool.
+            max_workers: Maximum number of worker threads.
+        """
+        with self._lock:
+            if (pool := self._pools.get(name)) is None:
+                pool = self._pools[name] = ExecutorPool(name, max_workers=max_workers)
+
+                return pool
+
+        pool.resize(max_workers)
+
+        return pool
+
+    def get_executor(self, name: str) -> PooledExecutor:
+        """Creates an executor that submits to a pool.
+
+        Args:
+            name: Name of the pool.
+        """
+        return self.get_pool(name).executor()
+
+    def executor_factory(self, name: str) -> Callable[[], PooledExecutor]:
+        """Gets a function that creates executors for a pool, for use as `FuturesExecutorMixin.create_futures_executor`.
+
+        The same function is returned for every call with the same name, so objects that use the same pool compare
+        equal.
+
+        Args:
+            name: Name of the pool.
+        """
+        with self._lock:
+            if (executor_factory := self._executor_factories.get(name)) is None:
+                executor_factory = self._executor_factories[name] = functools.partial(self.get_executor, name)
+
+            return executor_factory
+
+    def metrics(self) -> dict[str, ExecutorPoolMetrics]:
+        """Gets the metrics of every pool, by name."""
+        return {name: pool.metrics for name, pool in self.pools.items()}
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shuts down every pool's worker threads.
+
+        Args:
+            wait: Whether to wait for submitted calls to finish.
+        """
+        for pool in self.pools.values():
+            pool.shutdown(wait=wait)
+
+
+ExecutorRegistry = _ExecutorRegistry()
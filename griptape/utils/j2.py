@@ -1,20 +1,43 @@
 from __future__ import annotations
 
+import functools
+
 from attrs import Factory, define, field
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from .paths import abs_path
 
+TEMPLATE_FROM_STRING_CACHE_SIZE = 512
+
+
+@functools.cache
+def _shared_environment(templates_dir: str) -> Environment:
+    return Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+
+
+@functools.lru_cache(maxsize=TEMPLATE_FROM_STRING_CACHE_SIZE)
+def _template_from_string(environment: Environment, value: str) -> Template:
+    return environment.from_string(value)
+
 
 @define(frozen=True)
 class J2:
+    """Renders Jinja templates.
+
+    J2 instances with the same `templates_dir` share one default `environment`, so each template is only loaded and
+    compiled once per process. Templates compiled by `render_from_string` are cached by their source as well.
+
+    Attributes:
+        template_name: Name of the template to render, relative to `templates_dir`.
+        templates_dir: Directory to load templates from.
+        environment: Jinja Environment to render templates with. Changes to the default Environment are shared by all
+            J2 instances with the same `templates_dir`.
+    """
+
     template_name: str | None = field(default=None)
     templates_dir: str = field(default=abs_path("templates"), kw_only=True)
     environment: Environment = field(
-        default=Factory(
-            lambda self: Environment(loader=FileSystemLoader(self.templates_dir), trim_blocks=True, lstrip_blocks=True),
-            takes_self=True,
-        ),
+        default=Factory(lambda self: _shared_environment(self.templates_dir), takes_self=True),
         kw_only=True,
     )
 
@@ -24,4 +47,4 @@ class J2:
         return self.environment.get_template(self.template_name).render(kwargs).rstrip()
 
     def render_from_string(self, value: str, **kwargs) -> str:
-        return self.environment.from_string(value).render(kwargs)
+        return _template_from_string(self.environment, value).render(kwargs)
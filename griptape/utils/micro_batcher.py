@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from attrs import Factory, define, field
+
+from griptape.utils.queue_dispatcher import QueueDispatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@define(eq=False)
+class MicroBatcher(Generic[T, R]):
+    """Coalesces items that are submitted concurrently, from any number of threads, into batches.
+
+    A background dispatcher thread takes the first waiting item, waits up to `max_wait` seconds for more items until the
+    batch has `max_batch_size` items, and processes the batch with a single call to `fn`.
+
+    Attributes:
+        fn: Processes a batch of items, and returns one result per item, in the same order.
+        max_batch_size: Maximum number of items in a batch.
+        max_wait: Maximum number of seconds that a batch waits for more items.
+        batch_count: Number of batches that were processed.
+        item_count: Number of items that were processed.
+    """
+
+    fn: Callable[[list[T]], Sequence[R]] = field()
+    max_batch_size: int = field(default=32, kw_only=True)
+    max_wait: float = field(default=0.005, kw_only=True)
+    batch_count: int = field(default=0, init=False)
+    item_count: int = field(default=0, init=False)
+    _queue: queue.SimpleQueue[tuple[T, futures.Future[R]]] = field(factory=queue.SimpleQueue, init=False)
+    _dispatcher: QueueDispatcher[tuple[T, futures.Future[R]]] = field(
+        default=Factory(
+            lambda self: QueueDispatcher(self._queue, self.__dispatch, name="griptape-micro-batcher"), takes_self=True
+        ),
+        init=False,
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def submit(self, item: T) -> futures.Future[R]:
+        """Submits an item to be processed in the next batch.
+
+        Args:
+            item: The item to process.
+
+        Returns:
+            A Future for the item's result.
+        """
+        future: futures.Future[R] = futures.Future()
+
+        self._queue.put((item, future))
+        self._dispatcher.start()
+
+        return future
+
+    def submit_all(self, items: Sequence[T]) -> list[R]:
+        """Submits items together, and waits for their results.
+
+        Args:
+            items: The items to process.
+
+        Returns:
+            The results, in the same order as `items`.
+        """
+        return [future.result() for future in [self.submit(item) for item in items]]
+
+    def __dispatch(self) -> None:
+        while (item := self._dispatcher.get()) is not None:
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            self.__process_batch(batch)
+
+    def __process_batch(self, batch: list[tuple[T, futures.Future[R]]]) -> None:
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+
+        if not batch:
+            return
+
+        try:
+            results = self.fn([item for item, _ in batch])
+
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} results for the batch, got {len(results)}.")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results, strict=True):
+                future.set_result(result)
+
+        with self._lock:
+            self.batch_count += 1
+            self.item_count += len(batch)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from attrs import define, field
+
+from griptape.utils.contextvars_utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+@define(eq=False)
+class QueueDispatcher(Generic[T]):
+    """Runs a dispatcher thread that takes items from a queue, and exits once the queue has been idle for a while.
+
+    The thread is started by `start`, which must be called after every item is queued, and runs `target`. `target` takes
+    items with `get`, and returns once `get` returns `None`.
+
+    Attributes:
+        item_queue: The queue that items are taken from.
+        target: The dispatcher thread's loop.
+        name: The dispatcher thread's name.
+        idle_timeout: Seconds without items after which the dispatcher thread exits. It is started again by the next item.
+        copy_context: Whether to run `target` with the context variables of the thread that starts the dispatcher.
+    """
+
+    item_queue: queue.Queue[T] | queue.SimpleQueue[T] = field()
+    target: Callable[[], None] = field()
+    name: str = field(kw_only=True)
+    idle_timeout: float = field(default=30, kw_only=True)
+    copy_context: bool = field(default=False, kw_only=True)
+    _thread: threading.Thread | None = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> bool:
+        """Starts the dispatcher thread, unless it is running.
+
+        Returns:
+            Whether a new dispatcher thread was started.
+        """
+        # Called after queueing, so that an exiting dispatcher either sees the new item or is replaced.
+        with self._lock:
+            if self._thread is not None:
+                return False
+
+            self._thread = threading.Thread(
+                target=with_contextvars(self.target) if self.copy_context else self.target, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+            return True
+
+    def get(self) -> T | None:
+        """Waits for the next item. Only called by the dispatcher thread.
+
+        Returns:
+            The next item, or `None` if the dispatcher thread should exit.
+        """
+        while True:
+            try:
+                return self.item_queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self.item_queue.empty():
+                        self._thread = None
+
+                        return None
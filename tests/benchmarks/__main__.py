@@ -0,0 +1,28 @@
+"""Runs every benchmark in this package.
+
+Usage: `uv run python -m tests.benchmarks [benchmark ...]`, e.g. `uv run python -m tests.benchmarks chunkers`.
+"""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+BENCHMARK_PREFIX = "bench_"
+
+
+def main(names: list[str]) -> None:
+    modules = sorted(
+        module.name.removeprefix(BENCHMARK_PREFIX)
+        for module in pkgutil.iter_modules([str(Path(__file__).parent)])
+        if module.name.startswith(BENCHMARK_PREFIX)
+    )
+
+    for name in names or modules:
+        print(f"== {name} ==")
+        importlib.import_module(f"tests.benchmarks.{BENCHMARK_PREFIX}{name}").main([])
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,94 @@
+"""Benchmarks `BaseChunker` against the previous linear midpoint scan on the test PDFs.
+
+Usage: `uv run python -m tests.benchmarks.bench_chunkers [--tokenizer regex] [--scale 8] [--max-tokens 200]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from attrs import define
+
+from griptape.chunkers import ChunkSeparator, PdfChunker
+from griptape.loaders import PdfLoader
+from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer, SimpleTokenizer
+
+RESOURCES_PATH = Path(__file__).parents[1] / "resources"
+
+
+@define
+class LinearScanPdfChunker(PdfChunker):
+    """Reference implementation that tokenizes every prefix when looking for the midpoint."""
+
+    def _find_midpoint_index(self, separator: ChunkSeparator, subchunks: list[str], half_token_count: int) -> int:
+        midpoint_index = -1
+        best_midpoint_distance = float("inf")
+
+        for index, _ in enumerate(subchunks):
+            subchunk_tokens_count = self.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+
+            midpoint_distance = abs(subchunk_tokens_count - half_token_count)
+            if midpoint_distance < best_midpoint_distance:
+                midpoint_index = index
+                best_midpoint_distance = midpoint_distance
+
+        return midpoint_index
+
+
+@define
+class RegexTokenizer(BaseTokenizer):
+    """Offline stand-in for a BPE tokenizer: counts words and punctuation, at a cost linear in the text length."""
+
+    TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+    def try_count_tokens(self, text: str) -> int:
+        return sum(1 for _ in self.TOKEN_PATTERN.finditer(text))
+
+
+def build_tokenizer(name: str) -> BaseTokenizer:
+    if name == "openai":
+        return OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+    if name == "regex":
+        return RegexTokenizer(model="regex", max_input_tokens=8192, max_output_tokens=4096)
+    return SimpleTokenizer(characters_per_token=4)
+
+
+def time_chunking(chunker: PdfChunker, texts: list[str]) -> tuple[float, list[list[str]]]:
+    start = time.perf_counter()
+    chunks = [[chunk.value for chunk in chunker.chunk(text)] for text in texts]
+
+    return time.perf_counter() - start, chunks
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokenizer", choices=["openai", "regex", "simple"], default="openai")
+    parser.add_argument("--scale", type=int, default=4, help="Number of times each PDF's text is repeated.")
+    parser.add_argument("--max-tokens", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    tokenizer = build_tokenizer(args.tokenizer)
+    texts = [
+        "\n\n".join([PdfLoader().load(path).to_text()] * args.scale) for path in sorted(RESOURCES_PATH.glob("*.pdf"))
+    ]
+
+    linear_time, linear_chunks = time_chunking(
+        LinearScanPdfChunker(tokenizer=tokenizer, max_tokens=args.max_tokens), texts
+    )
+    chunker_time, chunks = time_chunking(PdfChunker(tokenizer=tokenizer, max_tokens=args.max_tokens), texts)
+
+    if chunks != linear_chunks:
+        raise RuntimeError("PdfChunker output differs from the linear scan reference.")
+
+    print(f"documents:   {len(texts)} ({sum(len(text) for text in texts):,} characters)")
+    print(f"chunks:      {sum(len(document_chunks) for document_chunks in chunks):,}")
+    print(f"linear scan: {linear_time:.3f}s")
+    print(f"PdfChunker:  {chunker_time:.3f}s ({linear_time / chunker_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
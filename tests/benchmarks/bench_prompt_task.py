@@ -0,0 +1,111 @@
+"""Benchmarks the per-step overhead of `PromptTask` tool-use loops with and without the prompt stack cache.
+
+The prompt driver calls a tool on every step without waiting on a model, so the time is spent building prompt stacks and
+running subtasks.
+
+Usage: `uv run python -m tests.benchmarks.bench_prompt_task [--tools 10] [--steps 20] [--iterations 5]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from attrs import define, field
+
+from griptape.artifacts import ActionArtifact, TextArtifact
+from griptape.common import ActionCallMessageContent, Message, PromptStack, TextMessageContent, ToolAction
+from griptape.tasks import PromptTask
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tool.tool import MockTool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@define
+class ToolLoopPromptDriver(MockPromptDriver):
+    """Calls one of `tool_count` tools until `steps` actions were called, then answers."""
+
+    tool_count: int = field(default=10, kw_only=True)
+    steps: int = field(default=20, kw_only=True)
+    use_native_tools: bool = field(default=True, kw_only=True)
+
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        action_count = sum(message.has_any_content_type(ActionCallMessageContent) for message in prompt_stack.messages)
+
+        if action_count >= self.steps:
+            content = TextMessageContent(TextArtifact("done"))
+        else:
+            content = ActionCallMessageContent(
+                ActionArtifact(
+                    ToolAction(
+                        tag=f"tag-{action_count}",
+                        name=f"MockTool{action_count % self.tool_count}",
+                        path="test",
+                        input={"test": "foo"},
+                    )
+                )
+            )
+
+        return Message(content=[content], role=Message.ASSISTANT_ROLE, usage=Message.Usage(input_tokens=1))
+
+
+@define
+class UncachedPromptTask(PromptTask):
+    """Reference implementation that builds the whole prompt stack for every prompt."""
+
+    @contextmanager
+    def _caching_prompt_stack(self) -> Iterator[None]:
+        yield
+
+
+def build_task(task_class: type[PromptTask], tool_count: int, steps: int) -> PromptTask:
+    return task_class(
+        "{{ args[0] }} with some context",
+        tools=[MockTool(name=f"MockTool{i}") for i in range(tool_count)],
+        prompt_driver=ToolLoopPromptDriver(tool_count=tool_count, steps=steps),
+        max_subtasks=steps + 2,
+    )
+
+
+def seconds_per_step(task_class: type[PromptTask], tool_count: int, steps: int, iterations: int) -> float:
+    total_time = 0.0
+
+    for _ in range(iterations):
+        task = build_task(task_class, tool_count, steps)
+        start = time.perf_counter()
+        task.run("Input")
+        total_time += time.perf_counter() - start
+
+        if task.output is None or task.output.to_text() != "done" or len(task.subtasks) != steps + 1:
+            raise RuntimeError(f"{task_class.__name__} didn't run {steps} steps.")
+
+    return total_time / (iterations * steps)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=10)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Every step logs its subtask, which would dominate the time.
+    logging.disable(logging.INFO)
+
+    uncached = seconds_per_step(UncachedPromptTask, args.tools, args.steps, args.iterations)
+    cached = seconds_per_step(PromptTask, args.tools, args.steps, args.iterations)
+
+    print(
+        f"{args.tools} tools, {args.steps} steps: {uncached * 1000:>7.2f}ms/step uncached  "
+        f"{cached * 1000:>7.2f}ms/step cached ({uncached / cached:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
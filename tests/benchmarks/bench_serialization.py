@@ -0,0 +1,87 @@
+"""Benchmarks `SerializableMixin` serialization throughput with and without the generated Schema cache.
+
+Objects that opt in to `COMPILED_SERIALIZATION` are also serialized with `CompiledSerializer`.
+
+Usage: `uv run python -m tests.benchmarks.bench_serialization [--iterations 500]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.events import FinishTaskEvent, TextChunkEvent
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema, CompiledSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from griptape.mixins.serializable_mixin import SerializableMixin
+
+
+def build_objects() -> dict[str, SerializableMixin]:
+    artifact = TextArtifact("foo bar baz " * 20, meta={"source": "benchmark"})
+
+    return {
+        "artifact": artifact,
+        "event": FinishTaskEvent(
+            task_id="task",
+            task_parent_ids=["parent"],
+            task_child_ids=["child"],
+            task_input=artifact,
+            task_output=ListArtifact([TextArtifact("foo"), TextArtifact("bar")]),
+        ),
+        "chunk": TextChunkEvent(token="foo", index=1),
+        "run": Run(input=artifact, output=TextArtifact("answer")),
+    }
+
+
+def throughput(fn: Callable[[], object], iterations: int, *, cached: bool) -> float:
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        if not cached:
+            # Generate every Schema from scratch, like before Schemas were cached.
+            BaseSchema._schema_cache.clear()
+        fn()
+
+    return iterations / (time.perf_counter() - start)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    for name, obj in build_objects().items():
+        data = obj.to_dict()
+        operations: dict[str, Callable[[], object]] = {
+            # Dump with the generated Schema directly, since `to_dict` skips it for compiled classes.
+            "to_dict": lambda obj=obj: BaseSchema.from_attrs_cls(type(obj))().dump(obj),
+            "from_dict": lambda obj=obj, data=data: type(obj).from_dict(data),
+        }
+
+        for operation_name, operation in operations.items():
+            uncached = throughput(operation, args.iterations, cached=False)
+            cached = throughput(operation, args.iterations, cached=True)
+            line = (
+                f"{name + '.' + operation_name + ':':<20} {uncached:>9,.0f}/s uncached  "
+                f"{cached:>9,.0f}/s cached ({cached / uncached:.1f}x)"
+            )
+
+            if operation_name == "to_dict" and obj.COMPILED_SERIALIZATION:
+                if CompiledSerializer.dump(obj) != operation():
+                    raise RuntimeError(f"CompiledSerializer output differs from the Schema output for {name}.")
+
+                compiled = throughput(lambda obj=obj: CompiledSerializer.dump(obj), args.iterations, cached=True)
+                line += f"  {compiled:>9,.0f}/s compiled ({compiled / cached:.1f}x)"
+
+            print(line)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,133 @@
+"""Benchmarks `Workflow` scheduling against the previous wave-based scheduler on synthetic DAGs.
+
+Usage: `uv run python -m tests.benchmarks.bench_workflow [--width 16] [--depth 200] [--max-sleep 0.05]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING
+
+from attrs import define
+
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask, CodeExecutionTask
+from griptape.utils import with_contextvars
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@define
+class WaveWorkflow(Workflow):
+    """Reference implementation that re-sorts the graph and waits for every Task in a wave before starting the next."""
+
+    def try_run(self, *args) -> WaveWorkflow:
+        exit_loop = False
+
+        with self.create_futures_executor() as futures_executor:
+            while not self.is_finished() and not exit_loop:
+                futures_list = {}
+
+                for task in self.order_tasks():
+                    if task.can_run():
+                        futures_list[futures_executor.submit(with_contextvars(task.run))] = task
+
+                for future in futures.as_completed(futures_list):
+                    if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                        exit_loop = True
+
+                        break
+
+            return self
+
+
+def sleep_task(task_id: str, seconds: float, parent_ids: list[str]) -> BaseTask:
+    def on_run(task: CodeExecutionTask) -> TextArtifact:
+        time.sleep(seconds)
+
+        return TextArtifact(task_id)
+
+    return CodeExecutionTask(on_run=on_run, id=task_id, parent_ids=parent_ids)
+
+
+def wide_dag(width: int, max_sleep: float) -> list[BaseTask]:
+    """Independent three-Task chains whose slow Task is at a different step in each chain, so every wave is slow."""
+    tasks = []
+
+    for lane in range(width):
+        parent_ids = []
+        for step in range(3):
+            task_id = f"wide_{lane}_{step}"
+            tasks.append(sleep_task(task_id, max_sleep if step == lane % 3 else max_sleep / 10, parent_ids))
+            parent_ids = [task_id]
+
+    return tasks
+
+
+def deep_dag(depth: int) -> list[BaseTask]:
+    """A single chain of instant Tasks, which measures the scheduling overhead per Task."""
+    return [sleep_task(f"deep_{step}", 0, [f"deep_{step - 1}"] if step else []) for step in range(depth)]
+
+
+def layered_dag(width: int, layers: int, max_sleep: float, rng: random.Random) -> list[BaseTask]:
+    """Layers of Tasks that each depend on up to three random Tasks from the previous layer."""
+    tasks = []
+
+    for layer in range(layers):
+        for index in range(width):
+            parent_ids = (
+                [f"layer_{layer - 1}_{parent}" for parent in rng.sample(range(width), k=min(3, width))] if layer else []
+            )
+            tasks.append(sleep_task(f"layer_{layer}_{index}", rng.uniform(0, max_sleep), parent_ids))
+
+    return tasks
+
+
+def time_workflow(
+    workflow_class: type[Workflow], build_tasks: Callable[[], list[BaseTask]], max_workers: int
+) -> tuple[float, dict]:
+    workflow = workflow_class(create_futures_executor=lambda: futures.ThreadPoolExecutor(max_workers=max_workers))
+    workflow.add_tasks(*build_tasks())
+
+    start = time.perf_counter()
+    workflow.run()
+
+    return time.perf_counter() - start, {task.id: task.state for task in workflow.tasks}
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--max-sleep", type=float, default=0.05, help="Maximum duration of a Task in seconds.")
+    parser.add_argument("--max-workers", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dags: dict[str, Callable[[], list[BaseTask]]] = {
+        "wide": lambda: wide_dag(args.width, args.max_sleep),
+        "deep": lambda: deep_dag(args.depth),
+        "layered": lambda: layered_dag(args.width, args.layers, args.max_sleep, random.Random(args.seed)),
+    }
+
+    for name, build_tasks in dags.items():
+        wave_time, wave_states = time_workflow(WaveWorkflow, build_tasks, args.max_workers)
+        workflow_time, workflow_states = time_workflow(Workflow, build_tasks, args.max_workers)
+
+        if workflow_states != wave_states:
+            raise RuntimeError(f"Workflow Task states differ from the wave scheduler reference on the {name} DAG.")
+
+        print(f"{name + ':':<9} {len(workflow_states)} tasks")
+        print(f"  waves:    {wave_time:.3f}s")
+        print(f"  Workflow: {workflow_time:.3f}s ({wave_time / workflow_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -42,6 +42,11 @@ class MockPromptDriver(BasePromptDriver):
 
     def try_run(self, prompt_stack: PromptStack) -> Message:
         output = self.mock_output(prompt_stack) if isinstance(self.mock_output, Callable) else self.mock_output
+        structured_output = (
+            self.mock_structured_output(prompt_stack)
+            if isinstance(self.mock_structured_output, Callable)
+            else self.mock_structured_output
+        )
         if self.use_native_tools and prompt_stack.tools:
             # Hack to simulate CoT. If there are any action messages in the prompt stack, give the answer.
             action_messages = [
@@ -58,7 +63,7 @@ class MockPromptDriver(BasePromptDriver):
                     tag="mock-tag",
                     name="StructuredOutputTool",
                     path="provide_output",
-                    input=self.mock_structured_output,
+                    input=structured_output,
                 )
             else:
                 tool_action = ToolAction(
@@ -75,7 +80,7 @@ class MockPromptDriver(BasePromptDriver):
             )
         if prompt_stack.output_schema is not None:
             return Message(
-                content=[TextMessageContent(TextArtifact(json.dumps(self.mock_structured_output)))],
+                content=[TextMessageContent(TextArtifact(json.dumps(structured_output)))],
                 role=Message.ASSISTANT_ROLE,
                 usage=Message.Usage(input_tokens=100, output_tokens=100),
             )
@@ -93,6 +98,11 @@ class MockPromptDriver(BasePromptDriver):
 
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
         output = self.mock_output(prompt_stack) if isinstance(self.mock_output, Callable) else self.mock_output
+        structured_output = (
+            self.mock_structured_output(prompt_stack)
+            if isinstance(self.mock_structured_output, Callable)
+            else self.mock_structured_output
+        )
         if self.use_native_tools and prompt_stack.tools:
             # Hack to simulate CoT. If there are any action messages in the prompt stack, give the answer.
             action_messages = [
@@ -109,9 +119,7 @@ class MockPromptDriver(BasePromptDriver):
                         path="provide_output",
                     )
                 )
-                yield DeltaMessage(
-                    content=ActionCallDeltaMessageContent(partial_input=json.dumps(self.mock_structured_output))
-                )
+                yield DeltaMessage(content=ActionCallDeltaMessageContent(partial_input=json.dumps(structured_output)))
             else:
                 yield DeltaMessage(
                     content=ActionCallDeltaMessageContent(
@@ -123,7 +131,7 @@ class MockPromptDriver(BasePromptDriver):
                 yield DeltaMessage(content=ActionCallDeltaMessageContent(partial_input='{ "test": "test-value" }'))
         elif prompt_stack.output_schema is not None:
             yield DeltaMessage(
-                content=TextDeltaMessageContent(json.dumps(self.mock_structured_output)),
+                content=TextDeltaMessageContent(json.dumps(structured_output)),
                 role=Message.ASSISTANT_ROLE,
                 usage=Message.Usage(input_tokens=100, output_tokens=100),
             )
@@ -3,6 +3,7 @@ import pytest
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
 from griptape.chunkers.chunk_separator import ChunkSeparator
+from griptape.tokenizers import SimpleTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -150,3 +151,17 @@ class TestTextChunker:
         assert len(chunker.chunk("foo bar baz ")) == 2
 
         assert len(chunker.chunk("foo  bar baz")) == 2
+
+    @pytest.mark.parametrize("half_token_count", [0, 1, 7, 8, 9, 15, 40, 1000])
+    def test_find_midpoint_index(self, half_token_count):
+        chunker = TextChunker(tokenizer=SimpleTokenizer(characters_per_token=2), max_tokens=MAX_TOKENS)
+        separator = ChunkSeparator(" ")
+        subchunks = ["foo", "", "bar", "bazqux", "", "", "a", "quux", "corge", "", "grault"]
+
+        token_counts = [
+            chunker.tokenizer.count_tokens(separator.value.join(subchunks[: index + 1]))
+            for index in range(len(subchunks))
+        ]
+        distances = [abs(token_count - half_token_count) for token_count in token_counts]
+
+        assert chunker._find_midpoint_index(separator, subchunks, half_token_count) == distances.index(min(distances))
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import call
 
 import pytest
@@ -288,3 +289,22 @@ class TestObservable:
             @observable("foo")
             def bar() -> None:
                 pass
+
+    def test_observable_coroutine_function(self, mocker):
+        from griptape.common import observable
+
+        aobserve_spy = mocker.spy(observability.Observability, "aobserve")
+
+        @observable(tags=["Foo.bar()"])
+        async def bar(*args, **kwargs):
+            await asyncio.sleep(0)
+
+            return args[0]
+
+        assert asyncio.run(bar("a", x="y")) == "a"
+        assert bar.__name__ == "bar"
+        aobserve_spy.assert_called_once_with(
+            Observable.Call(
+                func=bar.__wrapped__, args=("a",), kwargs={"x": "y"}, decorator_kwargs={"tags": ["Foo.bar()"]}
+            )
+        )
@@ -1,3 +1,4 @@
+import json
 from contextlib import nullcontext
 from unittest import mock
 
@@ -48,3 +49,12 @@ class TestAmazonBedrockCohereEmbeddingDriver:
     def test_embed(self, value, expected_output, expected_error):
         with expected_error:
             assert AmazonBedrockCohereEmbeddingDriver().embed(value) == expected_output
+
+    def test_embed_batch(self):
+        mock_client = mock.Mock()
+        mock_client.invoke_model.return_value.get().read.return_value = '{"embeddings": [[0, 1, 0], [1, 0, 0]]}'
+
+        driver = AmazonBedrockCohereEmbeddingDriver(client=mock_client)
+
+        assert driver.embed_batch(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert json.loads(mock_client.invoke_model.call_args.kwargs["body"])["texts"] == ["foo", "bar"]
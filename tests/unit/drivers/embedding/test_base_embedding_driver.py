@@ -51,3 +51,56 @@ class TestBaseEmbeddingDriver:
             driver.embed("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_batch(self, driver, mocker):
+        driver.batch_size = 2
+        spy = mocker.spy(driver, "try_embed_chunks")
+        image = ImageArtifact(b"foobar", format="png", width=100, height=100)
+
+        embeddings = driver.embed_batch(["foo", TextArtifact("bar"), image, "baz"])
+
+        assert embeddings == [[0, 1], [0, 1], [0, 1], [0, 1]]
+        assert [call.args[0] for call in spy.call_args_list] == [["foo", "bar"], ["baz"]]
+
+    def test_embed_batch_max_batch_tokens(self, driver, mocker):
+        driver.batch_size = 10
+        driver.max_batch_tokens = 6
+        spy = mocker.spy(driver, "try_embed_chunks")
+
+        driver.embed_batch(["foo", "bar", "bazz"])
+
+        assert [call.args[0] for call in spy.call_args_list] == [["foo", "bar"], ["bazz"]]
+
+    def test_embed_batch_long_string(self, driver, mocker):
+        driver.batch_size = 100
+        spy = mocker.spy(driver, "try_embed_chunks")
+
+        embeddings = driver.embed_batch(["foobar" * 5000, "foo"])
+
+        assert embeddings == [pytest.approx([0, 1]), [0, 1]]
+        assert spy.call_args_list[-1].args[0] == ["foo"]
+        assert len(spy.call_args_list[0].args[0]) > 1
+
+    def test_embed_batch_order(self, driver):
+        driver.batch_size = 3
+        driver.mock_output = lambda chunk: [len(chunk), 0]
+
+        assert driver.embed_batch(["a" * i for i in range(1, 8)]) == [[i, 0] for i in range(1, 8)]
+
+    def test_embed_batch_retries(self, driver, mocker):
+        driver.batch_size = 2
+        driver.max_attempts = 2
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        mocker.patch.object(MockEmbeddingDriver, "try_embed_chunks", side_effect=[Exception("nope"), [[0, 1], [1, 0]]])
+
+        assert driver.embed_batch(["foo", "bar"]) == [[0, 1], [1, 0]]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_batch_throws_when_retries_exhausted(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = Exception("nope")
+
+        with pytest.raises(Exception) as e:
+            driver.embed_batch(["foobar"])
+
+        assert e.value.args[0] == "nope"
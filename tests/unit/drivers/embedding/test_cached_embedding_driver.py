@@ -0,0 +1,84 @@
+import pytest
+
+from griptape.artifacts import ImageArtifact, TextArtifact
+from griptape.drivers.embedding.cached import CachedEmbeddingDriver
+from griptape.drivers.embedding.dummy import DummyEmbeddingDriver
+from griptape.drivers.embedding_cache.local import LocalEmbeddingCacheDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachedEmbeddingDriver:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver()
+
+    @pytest.fixture()
+    def driver(self, embedding_driver):
+        return CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+    def test_init(self, driver, embedding_driver):
+        assert driver.model == embedding_driver.model
+        assert driver.tokenizer is embedding_driver.tokenizer
+        assert isinstance(driver.cache_driver, LocalEmbeddingCacheDriver)
+
+    def test_embed(self, driver, embedding_driver, mocker):
+        spy = mocker.spy(embedding_driver, "embed_batch")
+
+        assert driver.embed("foo") == [0, 1]
+        assert driver.embed(TextArtifact("foo")) == [0, 1]
+        assert spy.call_count == 1
+        assert (driver.hits, driver.misses) == (1, 1)
+
+    def test_embed_batch(self, driver, embedding_driver, mocker):
+        driver.embed("foo")
+        spy = mocker.spy(embedding_driver, "embed_batch")
+
+        assert driver.embed_batch(["foo", "bar", "bar", "baz"]) == [[0, 1]] * 4
+        spy.assert_called_once_with(["bar", "baz"], vector_operation=None)
+        assert (driver.hits, driver.misses) == (2, 3)
+
+    def test_embed_keyed_by_vector_operation(self, driver, embedding_driver, mocker):
+        spy = mocker.spy(embedding_driver, "embed_batch")
+
+        driver.embed("foo", vector_operation="query")
+        driver.embed("foo", vector_operation="upsert")
+        driver.embed("foo", vector_operation="upsert")
+
+        assert spy.call_count == 2
+
+    def test_embed_keyed_by_model(self, embedding_driver):
+        cache_driver = LocalEmbeddingCacheDriver()
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, cache_driver=cache_driver).embed("foo")
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, cache_driver=cache_driver, model="bar")
+
+        driver.embed("foo")
+
+        assert driver.misses == 1
+
+    def test_embed_image(self, driver, mocker):
+        mock_embed = mocker.patch.object(MockEmbeddingDriver, "try_embed_artifact", return_value=[1, 0])
+        image = ImageArtifact(b"image", format="png", width=1, height=1)
+
+        assert driver.embed(image) == [1, 0]
+        assert driver.embed(ImageArtifact(b"image", format="png", width=1, height=1)) == [1, 0]
+        mock_embed.assert_called_once()
+
+    def test_does_not_cache_errors(self):
+        driver = CachedEmbeddingDriver(embedding_driver=DummyEmbeddingDriver())
+
+        with pytest.raises(Exception):  # noqa: B017
+            driver.embed("foo")
+
+        assert driver.cache_driver.load_embeddings([driver._cache_key("foo")]) == [None]
+        assert driver.misses == 0
+
+    def test_to_dict(self):
+        driver = CachedEmbeddingDriver(embedding_driver=DummyEmbeddingDriver(), model="foo")
+
+        assert driver.to_dict() == {
+            "type": "CachedEmbeddingDriver",
+            "embedding_driver": {"type": "DummyEmbeddingDriver"},
+            "cache_driver": {"type": "LocalEmbeddingCacheDriver", "max_entries": 10000},
+            "model": "foo",
+        }
+        assert isinstance(CachedEmbeddingDriver.from_dict(driver.to_dict()).embedding_driver, DummyEmbeddingDriver)
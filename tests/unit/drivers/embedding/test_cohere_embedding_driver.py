@@ -41,3 +41,11 @@ class TestCohereEmbeddingDriver:
                 CohereEmbeddingDriver(model="foo", api_key="bar", input_type="search_document").embed(value)
                 == expected_output
             )
+
+    def test_embed_batch(self, mock_client):
+        mock_client.embed.return_value = Mock(embeddings=[[0, 1, 0], [1, 0, 0]])
+
+        assert CohereEmbeddingDriver(model="foo", api_key="bar", input_type="search_document").embed_batch(
+            ["foo", "bar"]
+        ) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.embed.call_args.kwargs["texts"] == ["foo", "bar"]
@@ -15,3 +15,7 @@ class TestDummyEmbeddingDriver:
     def test_embed(self, embedding_driver):
         with pytest.raises(DummyError):
             embedding_driver.embed("prompt-stack")
+
+    def test_embed_batch(self, embedding_driver):
+        with pytest.raises(DummyError):
+            embedding_driver.embed_batch(["prompt-stack"])
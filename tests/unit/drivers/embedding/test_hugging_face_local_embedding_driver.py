@@ -0,0 +1,92 @@
+import threading
+from concurrent import futures
+
+import pytest
+
+from griptape.artifacts import ImageArtifact, TextArtifact
+from griptape.drivers.embedding.huggingface_local import HuggingFaceLocalEmbeddingDriver
+from griptape.drivers.rerank.local import LocalRerankDriver
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "foo", "bar", "baz", "hello", "world"]
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    transformers = pytest.importorskip("transformers")
+    pytest.importorskip("torch")
+    model_path = tmp_path_factory.mktemp("tiny-bert")
+    vocab_file = model_path / "vocab.txt"
+    vocab_file.write_text("\n".join(VOCAB))
+
+    transformers.BertTokenizerFast(vocab_file=str(vocab_file), model_max_length=32).save_pretrained(model_path)
+    transformers.BertModel(
+        transformers.BertConfig(
+            vocab_size=len(VOCAB),
+            hidden_size=8,
+            num_hidden_layers=1,
+            num_attention_heads=2,
+            intermediate_size=16,
+            max_position_embeddings=32,
+        )
+    ).save_pretrained(model_path)
+
+    return str(model_path)
+
+
+class TestHuggingFaceLocalEmbeddingDriver:
+    @pytest.fixture()
+    def driver(self, model_path):
+        return HuggingFaceLocalEmbeddingDriver(model=model_path)
+
+    def test_init(self, driver):
+        assert driver
+        assert driver.tokenizer.tokenizer is driver.pretrained_tokenizer
+
+    def test_pretrained_model_is_shared(self, driver, model_path):
+        assert HuggingFaceLocalEmbeddingDriver(model=model_path).pretrained_model is driver.pretrained_model
+
+    def test_embed(self, driver):
+        embedding = driver.embed("foo bar")
+
+        assert len(embedding) == 8
+        assert sum(value**2 for value in embedding) == pytest.approx(1)
+        assert driver.embed(TextArtifact("foo bar")) == pytest.approx(embedding)
+
+        with pytest.raises(ValueError, match="HuggingFaceLocalEmbeddingDriver does not support embedding images."):
+            driver.embed(ImageArtifact(b"foobar", format="jpeg", width=1, height=1))
+
+    def test_embed_batch(self, driver):
+        embeddings = driver.embed_batch(["foo", "bar baz hello world"])
+
+        assert embeddings[0] == pytest.approx(driver.embed("foo"), abs=1e-5)
+        assert embeddings[1] == pytest.approx(driver.embed("bar baz hello world"), abs=1e-5)
+
+    def test_embed_concurrently(self, model_path):
+        driver = HuggingFaceLocalEmbeddingDriver(model=model_path, batch_size=4, max_batch_wait=1)
+        start = threading.Barrier(8)
+
+        def embed(text: str) -> list[float]:
+            start.wait()
+
+            return driver.embed(text)
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            embeddings = list(executor.map(embed, ["foo bar"] * 8))
+
+        assert all(embedding == pytest.approx(embeddings[0], abs=1e-5) for embedding in embeddings)
+        assert driver._micro_batcher.item_count == 8
+        assert driver._micro_batcher.batch_count < 8
+
+    def test_rerank(self, driver):
+        artifacts = [TextArtifact("hello world"), TextArtifact("foo bar")]
+
+        assert len(LocalRerankDriver(embedding_driver=driver).run("foo bar", artifacts)) == 2
+
+    def test_to_dict(self, driver, model_path):
+        assert driver.to_dict() == {
+            "type": "HuggingFaceLocalEmbeddingDriver",
+            "model": model_path,
+            "device": "cpu",
+            "normalize": True,
+            "max_batch_wait": 0.005,
+        }
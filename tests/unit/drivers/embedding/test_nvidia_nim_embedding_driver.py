@@ -61,3 +61,13 @@ class TestNvidiaNimEmbeddingDriver:
         driver.embed("foobar", vector_operation="upsert")
         assert mock_openai.call_args.kwargs["input"] == "foobar"
         assert mock_openai.call_args.kwargs["extra_body"]["input_type"] == "passage"
+
+    def test_embed_batch(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+
+        assert NvidiaNimEmbeddingDriver().embed_batch(["foo", "bar"], vector_operation="upsert") == [
+            [0, 1, 0],
+            [1, 0, 0],
+        ]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+        assert mock_openai.call_args.kwargs["extra_body"]["input_type"] == "passage"
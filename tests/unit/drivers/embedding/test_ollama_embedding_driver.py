@@ -12,7 +12,7 @@ class TestOllamaEmbeddingDriver:
     def mock_client(self, mocker):
         mock_client = mocker.patch("ollama.Client")
 
-        mock_client.return_value.embeddings.return_value = {"embedding": [0, 1, 0]}
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0]]}
 
         return mock_client
 
@@ -38,3 +38,15 @@ class TestOllamaEmbeddingDriver:
     def test_embed(self, value, expected_output, expected_error):
         with expected_error:
             assert OllamaEmbeddingDriver(model="foo").embed(value) == expected_output
+
+    def test_embed_uses_embed_endpoint(self, mock_client):
+        OllamaEmbeddingDriver(model="foo").embed("foobar")
+
+        mock_client.return_value.embed.assert_called_once_with(model="foo", input=["foobar"])
+        mock_client.return_value.embeddings.assert_not_called()
+
+    def test_embed_batch(self, mock_client):
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0], [1, 0, 0]]}
+
+        assert OllamaEmbeddingDriver(model="foo").embed_batch(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        mock_client.return_value.embed.assert_called_once_with(model="foo", input=["foo", "bar"])
@@ -49,3 +49,9 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_embed_batch(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+
+        assert OpenAiEmbeddingDriver().embed_batch(["foo", TextArtifact("bar")]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
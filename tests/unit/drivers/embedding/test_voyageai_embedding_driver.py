@@ -44,3 +44,9 @@ class TestVoyageAiEmbeddingDriver:
     def test_embed(self, value, expected_output, expected_error):
         with expected_error:
             assert VoyageAiEmbeddingDriver().embed(value) == expected_output
+
+    def test_embed_batch(self, mock_client):
+        mock_client.return_value.embed.return_value = Mock(embeddings=[[0, 1, 0], [1, 0, 0]])
+
+        assert VoyageAiEmbeddingDriver().embed_batch(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.return_value.embed.call_args.args[0] == ["foo", "bar"]
@@ -0,0 +1,37 @@
+import pytest
+
+from griptape.drivers.embedding_cache.local import LocalEmbeddingCacheDriver
+
+
+class TestLocalEmbeddingCacheDriver:
+    @pytest.fixture()
+    def driver(self):
+        return LocalEmbeddingCacheDriver(max_entries=2)
+
+    def test_store_and_load(self, driver):
+        driver.store_embeddings({"foo": [0.0, 1.0], "bar": [1.0, 0.0]})
+
+        assert driver.load_embeddings(["foo", "baz", "bar"]) == [[0.0, 1.0], None, [1.0, 0.0]]
+
+    def test_evicts_least_recently_used(self, driver):
+        driver.store_embeddings({"foo": [0.0], "bar": [1.0]})
+        driver.load_embeddings(["foo"])
+        driver.store_embeddings({"baz": [2.0]})
+
+        assert driver.load_embeddings(["foo", "bar", "baz"]) == [[0.0], None, [2.0]]
+
+    def test_unbounded(self):
+        driver = LocalEmbeddingCacheDriver(max_entries=None)
+
+        driver.store_embeddings({str(i): [float(i)] for i in range(100)})
+
+        assert None not in driver.load_embeddings([str(i) for i in range(100)])
+
+    def test_clear(self, driver):
+        driver.store_embeddings({"foo": [0.0]})
+        driver.clear()
+
+        assert driver.load_embeddings(["foo"]) == [None]
+
+    def test_to_dict(self, driver):
+        assert driver.to_dict() == {"type": "LocalEmbeddingCacheDriver", "max_entries": 2}
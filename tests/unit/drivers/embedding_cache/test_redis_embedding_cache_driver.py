@@ -0,0 +1,37 @@
+import array
+
+import pytest
+
+from griptape.drivers.embedding_cache.redis import RedisEmbeddingCacheDriver
+
+
+class TestRedisEmbeddingCacheDriver:
+    @pytest.fixture(autouse=True)
+    def mock_client(self, mocker):
+        return mocker.patch("redis.Redis").return_value
+
+    @pytest.fixture()
+    def driver(self):
+        return RedisEmbeddingCacheDriver(host="localhost", ttl=60)
+
+    def test_load_embeddings(self, driver, mock_client):
+        mock_client.mget.return_value = [array.array("d", [0.1, 0.2]).tobytes(), None]
+
+        assert driver.load_embeddings(["foo", "bar"]) == [[0.1, 0.2], None]
+        mock_client.mget.assert_called_once_with(["griptape:embedding:foo", "griptape:embedding:bar"])
+
+    def test_store_embeddings(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value.__enter__.return_value
+
+        driver.store_embeddings({"foo": [0.1, 0.2]})
+
+        pipeline.set.assert_called_once_with("griptape:embedding:foo", array.array("d", [0.1, 0.2]).tobytes(), ex=60)
+        pipeline.execute.assert_called_once()
+
+    def test_clear(self, driver, mock_client):
+        mock_client.scan_iter.return_value = [b"griptape:embedding:foo"]
+
+        driver.clear()
+
+        mock_client.scan_iter.assert_called_once_with(match="griptape:embedding:*")
+        mock_client.delete.assert_called_once_with(b"griptape:embedding:foo")
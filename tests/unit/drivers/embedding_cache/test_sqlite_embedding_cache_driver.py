@@ -0,0 +1,45 @@
+import sqlite3
+
+import pytest
+
+from griptape.drivers.embedding_cache.sqlite import SqliteEmbeddingCacheDriver
+
+
+class TestSqliteEmbeddingCacheDriver:
+    @pytest.fixture()
+    def database_file(self, tmp_path):
+        return str(tmp_path / "embeddings.db")
+
+    @pytest.fixture()
+    def driver(self, database_file):
+        return SqliteEmbeddingCacheDriver(database_file=database_file)
+
+    def test_store_and_load(self, driver):
+        driver.store_embeddings({"foo": [0.1, 0.2], "bar": [0.3, 0.4]})
+
+        assert driver.load_embeddings(["foo", "baz", "bar"]) == [[0.1, 0.2], None, [0.3, 0.4]]
+        assert driver.load_embeddings([]) == []
+
+    def test_store_replaces(self, driver):
+        driver.store_embeddings({"foo": [0.1]})
+        driver.store_embeddings({"foo": [0.2]})
+
+        assert driver.load_embeddings(["foo"]) == [[0.2]]
+
+    def test_load_more_keys_than_sqlite_variables(self, driver):
+        driver.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        keys = [f"key-{i}" for i in range(1200)]
+        driver.store_embeddings({key: [float(i)] for i, key in enumerate(keys)})
+
+        assert driver.load_embeddings(keys) == [[float(i)] for i in range(1200)]
+
+    def test_persistence(self, driver, database_file):
+        driver.store_embeddings({"foo": [0.1, 0.2]})
+
+        assert SqliteEmbeddingCacheDriver(database_file=database_file).load_embeddings(["foo"]) == [[0.1, 0.2]]
+
+    def test_clear(self, driver):
+        driver.store_embeddings({"foo": [0.1]})
+        driver.clear()
+
+        assert driver.load_embeddings(["foo"]) == [None]
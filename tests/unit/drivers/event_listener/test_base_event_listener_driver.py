@@ -1,4 +1,7 @@
-from unittest.mock import ANY, MagicMock
+import threading
+from unittest.mock import MagicMock
+
+import pytest
 
 from tests.mocks.mock_event import MockEvent
 from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
@@ -6,19 +9,20 @@ from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
 
 class TestBaseEventListenerDriver:
     def test_publish_event_no_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=False, create_futures_executor=lambda: executor)
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=mock_fn)
         mock_event_payload = MockEvent().to_dict()
 
         driver.publish_event(mock_event_payload)
+        driver.flush_events()
 
-        executor.submit.assert_called_once_with(ANY, mock_event_payload)
+        mock_fn.assert_called_once_with(mock_event_payload)
+        assert driver.metrics.published == 1
 
     def test_publish_event_yes_batched(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
+        published = threading.Event()
+        mock_fn = MagicMock(side_effect=lambda _: published.set())
+        driver = MockEventListenerDriver(batched=True, flush_interval=60, on_event_payload_batch_publish=mock_fn)
         mock_event_payload = MockEvent().to_dict()
 
         # Publish 9 events to fill the batch
@@ -26,19 +30,87 @@ class TestBaseEventListenerDriver:
         for mock_event_payload in mock_event_payloads:
             driver.publish_event(mock_event_payload)
 
-        assert len(driver._batch) == 9
-        executor.submit.assert_not_called()
+        assert not published.wait(0.1)
+        assert driver.metrics.queue_depth == 9
+        mock_fn.assert_not_called()
 
         # Publish the 10th event to trigger the batch publish
         driver.publish_event(mock_event_payload)
 
-        assert len(driver._batch) == 0
-        executor.submit.assert_called_once_with(ANY, [*mock_event_payloads, mock_event_payload])
+        assert published.wait(1)
+        assert driver.batch == []
+        mock_fn.assert_called_once_with([*mock_event_payloads, mock_event_payload])
+
+    def test_publish_event_flush_interval(self):
+        published = threading.Event()
+        mock_fn = MagicMock(side_effect=lambda _: published.set())
+        driver = MockEventListenerDriver(batched=True, flush_interval=0.1, on_event_payload_batch_publish=mock_fn)
+        mock_event_payload = MockEvent().to_dict()
+
+        driver.publish_event(mock_event_payload)
+
+        assert published.wait(1)
+        mock_fn.assert_called_once_with([mock_event_payload])
+
+    def test_publish_event_does_not_block(self):
+        release = threading.Event()
+
+        def publish(_: dict) -> None:
+            release.wait()
+
+        driver = MockEventListenerDriver(batched=False, on_event_payload_publish=publish)
+
+        for _ in range(3):
+            driver.publish_event(MockEvent().to_dict())
+
+        release.set()
+        driver.flush_events()
+
+        assert driver.metrics.published == 3
+
+    def test_publish_event_queue_full_drop(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def publish(_: dict) -> None:
+            started.set()
+            release.wait()
+
+        driver = MockEventListenerDriver(
+            batched=False, max_queue_size=1, queue_full_policy="drop", on_event_payload_publish=publish
+        )
+
+        # Wait for the dispatcher to take the first event off the queue.
+        driver.publish_event(MockEvent().to_dict())
+        started.wait()
+        driver.publish_event(MockEvent().to_dict())
+        driver.publish_event(MockEvent().to_dict())
+        release.set()
+        driver.flush_events()
+
+        metrics = driver.metrics
+        assert metrics.published == 2
+        assert metrics.dropped == 1
+
+    def test_publish_event_late_and_failed(self):
+        driver = MockEventListenerDriver(
+            batched=False,
+            late_event_threshold=0,
+            on_event_payload_publish=MagicMock(side_effect=[None, Exception("Test Exception")]),
+            max_attempts=1,
+        )
+
+        driver.publish_event(MockEvent().to_dict())
+        driver.publish_event(MockEvent().to_dict())
+        driver.flush_events()
+
+        metrics = driver.metrics
+        assert metrics.published == 1
+        assert metrics.late == 1
+        assert metrics.failed == 1
 
     def test_flush_events(self):
-        executor = MagicMock()
-        executor.__enter__.return_value = executor
-        driver = MockEventListenerDriver(batched=True, create_futures_executor=lambda: executor)
+        driver = MockEventListenerDriver(batched=True, flush_interval=60)
         driver.try_publish_event_payload_batch = MagicMock(side_effect=driver.try_publish_event_payload)
 
         driver.flush_events()
@@ -47,12 +119,42 @@ class TestBaseEventListenerDriver:
         mock_event_payloads = [MockEvent().to_dict() for _ in range(3)]
         for mock_event_payload in mock_event_payloads:
             driver.publish_event(mock_event_payload)
-        assert len(driver.batch) == 3
+        assert driver.metrics.queue_depth == 3
 
         driver.flush_events()
-        executor.submit.assert_called_once_with(ANY, mock_event_payloads)
+        driver.try_publish_event_payload_batch.assert_called_once_with(mock_event_payloads)
         assert len(driver.batch) == 0
 
+    def test_flush_events_from_threads(self):
+        mock_fn = MagicMock()
+        driver = MockEventListenerDriver(batched=True, flush_interval=60, on_event_payload_batch_publish=mock_fn)
+
+        def publish_events() -> None:
+            for _ in range(25):
+                driver.publish_event(MockEvent().to_dict())
+            driver.flush_events()
+
+        threads = [threading.Thread(target=publish_events) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(len(call.args[0]) for call in mock_fn.call_args_list) == 100
+        assert driver.metrics.published == 100
+
+    def test_deprecated_init_args(self):
+        mock_fn = MagicMock()
+        mock_event_payload = MockEvent().to_dict()
+
+        with pytest.deprecated_call():
+            MockEventListenerDriver(create_futures_executor=MagicMock())
+        with pytest.deprecated_call():
+            driver = MockEventListenerDriver(batch=[mock_event_payload], on_event_payload_batch_publish=mock_fn)
+        driver.flush_events()
+
+        mock_fn.assert_called_once_with([mock_event_payload])
+
     def test__safe_publish_event_payload(self):
         mock_fn = MagicMock()
         driver = MockEventListenerDriver(
@@ -14,7 +14,7 @@ class TestGriptapeCloudEventListenerDriver:
     def mock_post(self, mocker):
         data = {"data": {"id": "test"}}
 
-        mock_post = mocker.patch("requests.post")
+        mock_post = mocker.patch("requests.Session.post")
         mock_post.return_value = Mock(status_code=201, json=data)
 
         return mock_post
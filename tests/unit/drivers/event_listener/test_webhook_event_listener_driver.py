@@ -9,7 +9,7 @@ from tests.mocks.mock_event import MockEvent
 class TestWebhookEventListenerDriver:
     @pytest.fixture(autouse=True)
     def mock_post(self, mocker):
-        mock_post = mocker.patch("requests.post")
+        mock_post = mocker.patch("requests.Session.post")
         mock_post.return_value = Mock(status_code=201)
 
         return mock_post
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -113,6 +114,35 @@ class TestOpenTelemetryObservabilityDriver:
         mock_span_exporter.export.assert_called_with(expected_spans)
         mock_span_exporter.export.reset_mock()
 
+    def test_context_manager_aobserve(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.OK),
+                ExpectedSpan(name="func()", parent="main", status_code=StatusCode.OK),
+                ExpectedSpan(
+                    name="failing_func()", parent="main", status_code=StatusCode.ERROR, exception=Exception("Boom")
+                ),
+            ]
+        )
+
+        async def func(word: str):
+            await asyncio.sleep(0)
+
+            return word + " you"
+
+        async def failing_func():
+            await asyncio.sleep(0)
+
+            raise Exception("Boom")
+
+        with driver:
+            assert asyncio.run(driver.aobserve(Observable.Call(func=func, instance=None, args=["Hi"]))) == "Hi you"
+            with pytest.raises(Exception, match="Boom"):
+                asyncio.run(driver.aobserve(Observable.Call(func=failing_func, instance=None)))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
     def test_context_manager_observe_exception_function(self, driver, mock_span_exporter):
         expected_spans = ExpectedSpans(
             spans=[
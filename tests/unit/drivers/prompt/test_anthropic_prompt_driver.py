@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from schema import Schema
@@ -156,6 +157,26 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_client.return_value.messages.create = AsyncMock(
+            return_value=mock_client.return_value.messages.create.return_value
+        )
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        async def events():
+            for event in mock_stream_client.return_value.messages.create.return_value:
+                yield event
+
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_stream_client.return_value.messages.create = AsyncMock(return_value=events())
+
+        return mock_async_stream_client
+
     @pytest.fixture(params=[True, False])
     def prompt_stack(self, request):
         prompt_stack = PromptStack()
@@ -423,6 +444,56 @@ class TestAnthropicPromptDriver:
         event = next(stream)
         assert event.usage.output_tokens == 10
 
+    def test_atry_run(self, mock_client, mock_async_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key")
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_client.return_value.messages.create.assert_not_called()
+        mock_async_client.return_value.messages.create.assert_awaited_once_with(**driver._base_params(prompt_stack))
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.name == "MockTool"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_run_with_custom_client(self, mock_client, mock_async_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", client=mock_client.return_value)
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_client.return_value.messages.create.assert_called_once_with(**driver._base_params(prompt_stack))
+        mock_async_client.assert_not_called()
+        assert message.value[0].value == "model-output"
+
+    def test_atry_stream(self, mock_async_stream_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        async def collect():
+            return [event async for event in driver.atry_stream(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        mock_async_stream_client.return_value.messages.create.assert_awaited_once_with(
+            **driver._base_params(prompt_stack), stream=True
+        )
+        assert events[0].usage.input_tokens == 5
+        assert isinstance(events[1].content, TextDeltaMessageContent)
+        assert events[2].content.text == "model-output"
+        assert isinstance(events[3].content, ActionCallDeltaMessageContent)
+        assert events[3].content.tag == "mock-id"
+        assert events[4].content.partial_input == '{"foo": "bar"}'
+        assert events[5].usage.output_tokens == 10
+
+    def test_arun_stream(self, mock_async_stream_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        message = asyncio.run(driver.arun(prompt_stack))
+
+        assert message.value[0].value == "model-outputmodel-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
     def test_try_run_with_top_p_and_top_k(self, mock_client, prompt_stack, messages):
         # Given
         driver = AnthropicPromptDriver(
@@ -122,6 +122,21 @@ class TestAzureOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         assert AzureOpenAiChatPromptDriver(azure_endpoint="foobar", azure_deployment="foobar", model="gpt-4")
         assert AzureOpenAiChatPromptDriver(azure_endpoint="foobar", model="gpt-4").azure_deployment == "gpt-4"
 
+    def test_async_client(self, mocker):
+        mock_async_client = mocker.patch("openai.AsyncAzureOpenAI")
+        driver = AzureOpenAiChatPromptDriver(azure_endpoint="endpoint", model="gpt-4", api_key="api-key")
+
+        assert driver.async_client is mock_async_client.return_value
+        mock_async_client.assert_called_once_with(
+            organization=None,
+            api_key="api-key",
+            api_version=driver.api_version,
+            azure_endpoint="endpoint",
+            azure_deployment="gpt-4",
+            azure_ad_token=None,
+            azure_ad_token_provider=None,
+        )
+
     @pytest.mark.parametrize("use_native_tools", [True, False])
     @pytest.mark.parametrize("structured_output_strategy", ["native", "tool"])
     @pytest.mark.parametrize("api_version", ["2023-05-15", "2024-02-01", "2024-06-01", "2024-10-21"])
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import warnings
 
@@ -5,7 +6,7 @@ import pytest
 
 from griptape.artifacts import ActionArtifact, ErrorArtifact, TextArtifact
 from griptape.common import AudioMessageContent, Message, PromptStack, TextMessageContent
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.events import EventListener, FinishPromptEvent, StartPromptEvent, TextChunkEvent
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
@@ -63,6 +64,59 @@ class TestBasePromptDriver:
             if "audio" in modalities:
                 assert result.has_any_content_type(AudioMessageContent)
 
+    @pytest.mark.parametrize("stream", [True, False])
+    @pytest.mark.parametrize("use_native_tools", [True, False])
+    @pytest.mark.parametrize("tools", [[], [MockTool()]])
+    def test_arun(self, use_native_tools, stream, tools):
+        driver = MockPromptDriver(stream=stream, use_native_tools=use_native_tools, max_attempts=1)
+
+        result = asyncio.run(driver.arun(PromptStack(tools=tools)))
+
+        assert isinstance(result, Message)
+        if use_native_tools and tools:
+            assert result.value.input == {"test": "test-value"}
+        else:
+            assert result.to_text() == driver.run(PromptStack(tools=tools)).to_text()
+
+    def test_arun_retries(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=3, min_retry_delay=0, max_retry_delay=0)
+
+        assert asyncio.run(driver.arun(PromptStack())).value == "success"
+
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=1)
+
+        with pytest.raises(Exception, match="failed attempt"):
+            asyncio.run(driver.arun(PromptStack()))
+
+    @pytest.mark.parametrize("stream", [True, False])
+    def test_arun_publishes_events(self, mocker, stream):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        asyncio.run(MockPromptDriver(stream=stream).arun(TextArtifact("foo")))
+
+        event_types = [type(call_args[0][0]) for call_args in mock_publish_event.call_args_list]
+        mock_publish_event.reset_mock()
+        MockPromptDriver(stream=stream).run(TextArtifact("foo"))
+        assert event_types == [type(call_args[0][0]) for call_args in mock_publish_event.call_args_list]
+        assert event_types.count(StartPromptEvent) == 1
+        assert event_types.count(FinishPromptEvent) == 1
+
+    def test_run_stream_skips_unhandled_chunk_events(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        MockPromptDriver(stream=True).run(TextArtifact("foo"))
+
+        event_types = [type(call_args[0][0]) for call_args in mock_publish_event.call_args_list]
+        assert StartPromptEvent in event_types
+        assert TextChunkEvent not in event_types
+
+        mock_publish_event.reset_mock()
+        with EventListener(event_types=[TextChunkEvent]):
+            MockPromptDriver(stream=True).run(TextArtifact("foo"))
+
+        event_types = [type(call_args[0][0]) for call_args in mock_publish_event.call_args_list]
+        assert TextChunkEvent in event_types
+
     def test_native_structured_output_strategy(self):
         from schema import Schema
 
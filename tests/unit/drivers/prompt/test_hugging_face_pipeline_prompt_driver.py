@@ -1,10 +1,22 @@
+import threading
+import time
+from concurrent import futures
+from unittest.mock import MagicMock
+
 import pytest
 
-from griptape.common import PromptStack
+from griptape.common import DeltaMessage, PromptStack, TextDeltaMessageContent
+from griptape.drivers.prompt import huggingface_pipeline_prompt_driver
 from griptape.drivers.prompt.huggingface_pipeline import HuggingFacePipelinePromptDriver
 
 
 class TestHuggingFacePipelinePromptDriver:
+    @pytest.fixture(autouse=True)
+    def clear_batched_pipelines(self):
+        huggingface_pipeline_prompt_driver._batched_pipelines.clear()
+        yield
+        huggingface_pipeline_prompt_driver._batched_pipelines.clear()
+
     @pytest.fixture(autouse=True)
     def mock_pipeline(self, mocker):
         mock_pipeline = mocker.patch("transformers.pipeline")
@@ -62,18 +74,149 @@ class TestHuggingFacePipelinePromptDriver:
         assert message.usage.input_tokens == 3
         assert message.usage.output_tokens == 3
 
+    def test_try_run_batches_concurrent_prompts(self, prompt_stack, messages, mock_pipeline):
+        # Given
+        def generate(inputs, **kwargs):
+            if "batch_size" in kwargs:
+                return [[{"generated_text": [{"content": "batched-output"}]}] for _ in inputs]
+            return [{"generated_text": [{"content": "model-output"}]}]
+
+        mock_pipeline.side_effect = generate
+        mock_pipeline.tokenizer.pad_token = None
+        drivers = [
+            HuggingFacePipelinePromptDriver(model="foo", max_tokens=42, batch_size=3, max_batch_wait=5),
+            HuggingFacePipelinePromptDriver(model="foo", max_tokens=42, batch_size=3, max_batch_wait=5),
+            HuggingFacePipelinePromptDriver(
+                model="foo", max_tokens=42, temperature=0.5, batch_size=3, max_batch_wait=5
+            ),
+        ]
+
+        # When
+        with futures.ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda driver: driver.try_run(prompt_stack), drivers))
+
+        # Then
+        assert [result.value for result in results] == ["batched-output", "batched-output", "model-output"]
+        assert mock_pipeline.call_count == 2
+        mock_pipeline.assert_any_call(
+            [messages, messages], batch_size=2, max_new_tokens=42, temperature=0.1, do_sample=True
+        )
+        mock_pipeline.assert_any_call(messages, max_new_tokens=42, temperature=0.5, do_sample=True)
+        assert mock_pipeline.tokenizer.padding_side == "left"
+        assert mock_pipeline.tokenizer.pad_token == mock_pipeline.tokenizer.eos_token
+
+    def test_try_run_isolates_failing_batches(self, prompt_stack, mock_pipeline):
+        # Given
+        def generate(inputs, **kwargs):
+            if kwargs["temperature"] == 0.5:
+                raise ValueError("generation failed")
+            return [{"generated_text": [{"content": "model-output"}]}]
+
+        mock_pipeline.side_effect = generate
+        drivers = [
+            HuggingFacePipelinePromptDriver(model="foo", batch_size=2, max_batch_wait=5),
+            HuggingFacePipelinePromptDriver(model="foo", temperature=0.5, batch_size=2, max_batch_wait=5),
+        ]
+
+        # When
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            results = [executor.submit(driver.try_run, prompt_stack) for driver in drivers]
+
+        # Then
+        assert results[0].result().value == "model-output"
+        with pytest.raises(ValueError, match="generation failed"):
+            results[1].result()
+
+    def test_pipeline_is_shared_by_model(self, mocker):
+        # Given
+        mock_transformers_pipeline = mocker.patch("transformers.pipeline")
+
+        # When
+        pipelines = [
+            HuggingFacePipelinePromptDriver(model="foo").pipeline,
+            HuggingFacePipelinePromptDriver(model="foo", max_tokens=42).pipeline,
+            HuggingFacePipelinePromptDriver(model="bar").pipeline,
+            HuggingFacePipelinePromptDriver(model="foo", batch_size=2).pipeline,
+            HuggingFacePipelinePromptDriver(model="foo", max_batch_wait=1).pipeline,
+        ]
+
+        # Then
+        assert pipelines[0] is pipelines[1]
+        assert mock_transformers_pipeline.call_count == 4
+        mock_transformers_pipeline.assert_any_call(task="text-generation", model="foo", tokenizer=mocker.ANY)
+
     @pytest.mark.parametrize("structured_output_strategy", ["rule", "foo"])
-    def test_try_stream(self, prompt_stack, mock_pipeline, structured_output_strategy):
+    def test_try_stream(self, mocker, prompt_stack, messages, mock_pipeline, structured_output_strategy):
         # Given
+        mock_streamer = MagicMock()
+        mock_streamer.__iter__.return_value = iter(["model", "", "-output"])
+        mocker.patch("transformers.TextIteratorStreamer", return_value=mock_streamer)
         driver = HuggingFacePipelinePromptDriver(
             model="foo", max_tokens=42, pipeline=mock_pipeline, structured_output_strategy=structured_output_strategy
         )
 
         # When
-        with pytest.raises(Exception) as e:
-            driver.try_stream(prompt_stack)
+        stream = list(driver.try_stream(prompt_stack))
+
+        # Then
+        mock_pipeline.assert_called_once_with(
+            messages, streamer=mock_streamer, max_new_tokens=42, temperature=0.1, do_sample=True
+        )
+        assert isinstance(stream[0].content, TextDeltaMessageContent)
+        assert stream[0].content.text == "model"
+        assert isinstance(stream[1].content, TextDeltaMessageContent)
+        assert stream[1].content.text == "-output"
+        assert isinstance(stream[2], DeltaMessage)
+        assert stream[2].usage.input_tokens == 3
+        assert stream[2].usage.output_tokens == 3
+
+    def test_try_stream_raises_pipeline_errors(self, mocker, prompt_stack, mock_pipeline):
+        # Given
+        mock_streamer = MagicMock()
+        mock_streamer.__iter__.return_value = iter([])
+        mocker.patch("transformers.TextIteratorStreamer", return_value=mock_streamer)
+        mock_pipeline.side_effect = ValueError("generation failed")
+        driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42, pipeline=mock_pipeline)
+
+        # When
+        with pytest.raises(ValueError, match="generation failed"):
+            list(driver.try_stream(prompt_stack))
 
-        assert e.value.args[0] == "streaming is not supported"
+        # Then
+        mock_streamer.end.assert_called_once()
+
+    def test_try_stream_does_not_overlap_batches(self, mocker, prompt_stack, mock_pipeline):
+        # Given
+        running = threading.Semaphore(1)
+        overlapped = threading.Event()
+
+        def generate(inputs, **kwargs):
+            if not running.acquire(blocking=False):
+                overlapped.set()
+            time.sleep(0.1)
+            running.release()
+
+            return [{"generated_text": [{"content": "model-output"}]}]
+
+        mock_pipeline.side_effect = generate
+        mock_streamer = MagicMock()
+        mock_streamer.__iter__.return_value = iter([])
+        mocker.patch("transformers.TextIteratorStreamer", return_value=mock_streamer)
+        driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42, pipeline=mock_pipeline)
+
+        # When
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            results = [
+                executor.submit(driver.try_run, prompt_stack),
+                executor.submit(lambda: list(driver.try_stream(prompt_stack))),
+            ]
+
+            for result in results:
+                result.result()
+
+        # Then
+        assert mock_pipeline.call_count == 2
+        assert not overlapped.is_set()
 
     @pytest.mark.parametrize("choices", [[], [1, 2]])
     def test_try_run_throws_when_multiple_choices_returned(self, choices, mock_pipeline, prompt_stack):
@@ -1,4 +1,6 @@
+import asyncio
 import json
+from unittest.mock import AsyncMock
 
 import pytest
 from schema import Schema
@@ -252,6 +254,24 @@ class TestOllamaPromptDriver:
             {"content": "keep-going", "role": "user"},
         ]
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("ollama.AsyncClient")
+        mock_async_client.return_value.chat = AsyncMock(return_value=mock_client.return_value.chat.return_value)
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        async def chunks():
+            for chunk in mock_stream_client.return_value.chat.return_value:
+                yield chunk
+
+        mock_async_stream_client = mocker.patch("ollama.AsyncClient")
+        mock_async_stream_client.return_value.chat = AsyncMock(return_value=chunks())
+
+        return mock_async_stream_client
+
     def test_init(self):
         assert OllamaPromptDriver(model="llama")
 
@@ -379,3 +399,45 @@ class TestOllamaPromptDriver:
         event = next(stream)
         assert isinstance(event.content, TextDeltaMessageContent)
         assert event.content.text == ""
+
+    def test_async_client_forwards_auth_kwargs(self, mocker):
+        mock_async_client_cls = mocker.patch("ollama.AsyncClient")
+        driver = OllamaPromptDriver(model="llama3", host="http://localhost:11434", api_key="secret")
+
+        assert driver.async_client is mock_async_client_cls.return_value
+        mock_async_client_cls.assert_called_once_with(host="http://localhost:11434", api_key="secret")
+
+    def test_atry_run(self, mock_client, mock_async_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama")
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_client.return_value.chat.assert_not_called()
+        mock_async_client.return_value.chat.assert_awaited_once_with(**driver._base_params(prompt_stack))
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+
+    def test_atry_run_with_custom_client(self, mock_client, mock_async_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama", client=mock_client.return_value)
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_client.return_value.chat.assert_called_once_with(**driver._base_params(prompt_stack))
+        mock_async_client.assert_not_called()
+        assert message.value[0].value == "model-output"
+
+    def test_atry_stream(self, mock_async_stream_client, prompt_stack):
+        driver = OllamaPromptDriver(model="llama", stream=True)
+
+        async def collect():
+            return [event async for event in driver.atry_stream(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        mock_async_stream_client.return_value.chat.assert_awaited_once_with(
+            **driver._base_params(prompt_stack), stream=True
+        )
+        assert events[0].content.text == "model-output"
+        assert [event.content.index for event in events[1:3]] == [0, 1]
+        assert all(isinstance(event.content, ActionCallDeltaMessageContent) for event in events[1:3])
+        assert events[3].content.text == ""
@@ -1,6 +1,7 @@
+import asyncio
 import base64
 from copy import deepcopy
-from unittest.mock import ANY, MagicMock, Mock
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock
 
 import pytest
 import schema
@@ -263,6 +264,26 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         )
         return mock_chat_create
 
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_async_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = AsyncMock(
+            return_value=mock_chat_completion_create.return_value
+        )
+
+        return mock_async_chat_create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        async def stream():
+            for chunk in mock_chat_completion_stream_create.return_value:
+                yield chunk
+
+        mock_async_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = AsyncMock(
+            return_value=stream()
+        )
+
+        return mock_async_chat_create
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -959,3 +980,71 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
             max_tokens=1,
         )
         assert event.value[0].value == "model-output"
+
+    def test_atry_run(self, mock_chat_completion_create, mock_async_chat_completion_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_chat_completion_create.assert_not_called()
+        mock_async_chat_completion_create.assert_awaited_once_with(**driver._base_params(prompt_stack))
+        assert message.value[0].value == "model-output"
+        assert isinstance(message.value[1], AudioArtifact)
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_chat_completion_stream_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        async def collect():
+            return [event async for event in driver.atry_stream(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        mock_async_chat_completion_stream_create.assert_awaited_once_with(
+            **driver._base_params(prompt_stack), stream=True
+        )
+        assert isinstance(events[0].content, TextDeltaMessageContent)
+        assert events[0].content.text == "model-output"
+        assert isinstance(events[1].content, ActionCallDeltaMessageContent)
+        assert events[1].content.tag == "mock-id"
+        assert events[2].content.partial_input == '{"foo": "bar"}'
+        assert events[3].usage.input_tokens == 5
+        assert events[3].usage.output_tokens == 10
+        assert [type(event.content) for event in events[4:]] == [AudioDeltaMessageContent] * 3
+
+    def test_atry_run_with_custom_client(
+        self, mock_chat_completion_create, mock_async_chat_completion_create, prompt_stack
+    ):
+        client = Mock()
+        client.chat.completions.create = mock_chat_completion_create
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, client=client)
+
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        mock_chat_completion_create.assert_called_once_with(**driver._base_params(prompt_stack))
+        mock_async_chat_completion_create.assert_not_awaited()
+        assert message.value[0].value == "model-output"
+
+    def test_atry_stream_with_custom_client(self, mock_chat_completion_stream_create, prompt_stack):
+        client = Mock()
+        client.chat.completions.create = mock_chat_completion_stream_create
+        driver = OpenAiChatPromptDriver(
+            model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, client=client, stream=True
+        )
+
+        async def collect():
+            return [event async for event in driver.atry_stream(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        mock_chat_completion_stream_create.assert_called_once_with(**driver._base_params(prompt_stack), stream=True)
+        assert events[0].content.text == "model-output"
+
+    def test_arun(self, mock_async_chat_completion_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+
+        message = asyncio.run(driver.arun(prompt_stack))
+
+        mock_async_chat_completion_create.assert_awaited_once()
+        assert message.value[0].value == "model-output"
@@ -1,10 +1,11 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import boto3
 import numpy as np
 import pytest
 
 from griptape.drivers.vector.amazon_opensearch import AmazonOpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestAmazonOpenSearchVectorStoreDriver:
@@ -52,3 +53,26 @@ class TestAmazonOpenSearchVectorStoreDriver:
             results = driver.query(query_vector, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    @pytest.mark.parametrize(
+        ("service", "action"),
+        [
+            ("es", {"index": {"_index": "test", "_id": "foo"}}),
+            ("aoss", {"index": {"_index": "test"}}),
+        ],
+    )
+    def test_upsert_vectors(self, service, action):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": False, "items": [{"index": {"_id": "foo"}}]}
+        driver = AmazonOpenSearchVectorStoreDriver(
+            host="localhost",
+            index_name="test",
+            service=service,
+            http_auth=("user", "pass"),
+            session=create_autospec(boto3.Session, instance=True),
+            client=client,
+            embedding_driver=MockEmbeddingDriver(),
+        )
+
+        assert driver.upsert_vectors([AmazonOpenSearchVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])]) == ["foo"]
+        assert client.bulk.call_args.kwargs["body"][0] == action
@@ -73,3 +73,34 @@ class TestBaseVectorStoreDriver(ABC):
     def test_does_entry_exist_exception(self, driver):
         with patch.object(driver, "load_entry", side_effect=Exception):
             assert driver.does_entry_exist("does_not_exist") is False
+
+    def test_upsert_collection_batches(self, driver):
+        driver.embedding_driver.batch_size = 2
+
+        with patch.object(driver, "upsert_vectors", wraps=driver.upsert_vectors) as mock_upsert_vectors:
+            ids = driver.upsert_collection([TextArtifact("foo"), TextArtifact("bar"), TextArtifact("baz")])
+
+        assert len(ids) == 3
+        assert sorted(len(call.args[0]) for call in mock_upsert_vectors.call_args_list) == [1, 2]
+        assert sorted(artifact.value for artifact in driver.load_artifacts()) == ["bar", "baz", "foo"]
+
+    def test_upsert_batch(self, driver):
+        ids = driver.upsert_batch(["foo", TextArtifact("bar")], namespace="test-namespace", meta={"foo": "bar"})
+
+        assert ids == [driver.load_entry(vector_id, namespace="test-namespace").id for vector_id in ids]
+        assert [entry.to_artifact().value for entry in driver.load_entries(namespace="test-namespace")] == [
+            "foo",
+            "bar",
+        ]
+        assert all(entry.meta["foo"] == "bar" for entry in driver.load_entries(namespace="test-namespace"))
+
+    def test_upsert_vectors(self, driver):
+        ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="test-namespace"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], namespace="test-namespace"),
+            ]
+        )
+
+        assert ids == ["foo", "bar"]
+        assert driver.load_entry("bar", namespace="test-namespace").vector == [1, 0]
@@ -58,10 +58,66 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
 
     @pytest.mark.parametrize("execution_number", range(1000))
     def test_upsert_collection_meta(self, driver, mocker, execution_number):
-        spy = mocker.spy(driver, "upsert_vector")
+        spy = mocker.spy(driver, "upsert_vectors")
         artifact_1 = TextArtifact("foo bar", id="foo")
         artifact_2 = TextArtifact("bar foo", id="bar")
 
         driver.upsert_collection({"foo": [artifact_1, artifact_2]}, meta={"foo": "bar"})
 
-        assert spy.call_args_list[0].kwargs["meta"]["artifact"] != spy.call_args_list[1].kwargs["meta"]["artifact"]
+        entries = [entry for call in spy.call_args_list for entry in call.args[0]]
+
+        assert entries[0].meta["artifact"] != entries[1].meta["artifact"]
+        assert entries[0].meta["foo"] == entries[1].meta["foo"] == "bar"
+
+    def test_query_vector_matrix_index_matches_fallback(self):
+        vectors = {f"foo-{i}": [float(i % 7), float(i % 3) - 1.0, 1.0] for i in range(50)}
+        matrix_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        fallback_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), use_matrix_index=False)
+
+        for vector_id, vector in vectors.items():
+            namespace = "even" if int(vector_id.split("-")[1]) % 2 == 0 else None
+            matrix_driver.upsert_vector(vector, vector_id=vector_id, namespace=namespace)
+            fallback_driver.upsert_vector(vector, vector_id=vector_id, namespace=namespace)
+
+        for count in (None, 1, 5, 50, 100):
+            for namespace in (None, "even"):
+                matrix_result = matrix_driver.query_vector([1.0, 0.5, 1.0], count=count, namespace=namespace)
+                fallback_result = fallback_driver.query_vector([1.0, 0.5, 1.0], count=count, namespace=namespace)
+
+                assert [r.id for r in matrix_result] == [r.id for r in fallback_result]
+                assert [r.score for r in matrix_result] == pytest.approx([r.score for r in fallback_result], abs=1e-6)
+
+    def test_query_vector_matrix_index_updated_on_upsert(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        assert driver.query_vector([0.0, 1.0], count=1)[0].id == "foo"
+
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        driver.upsert_vector([0.0, -1.0], vector_id="foo")
+
+        result = driver.query_vector([0.0, 1.0])
+
+        assert [r.id for r in result] == ["bar", "foo"]
+        assert result[1].score == pytest.approx(-1.0)
+
+    def test_query_vector_matrix_index_rebuilt_on_entries_change(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.query_vector([1.0, 0.0])
+
+        driver.entries = {"bar": LocalVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0])}
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0])] == ["bar"]
+
+    def test_query_vector_custom_relatedness(self, mocker):
+        calculate_relatedness = mocker.Mock(side_effect=lambda x, y: -y[0])
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), calculate_relatedness=calculate_relatedness
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([2.0, 0.0], vector_id="bar")
+
+        result = driver.query_vector([1.0, 0.0], count=1)
+
+        assert calculate_relatedness.call_count == 2
+        assert [r.id for r in result] == ["foo"]
+        assert result[0].score == -1.0
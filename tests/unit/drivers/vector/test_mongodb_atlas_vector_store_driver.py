@@ -1,5 +1,7 @@
 import mongomock
 import pytest
+from bson import ObjectId
+from pymongo import InsertOne, ReplaceOne
 
 from griptape.artifacts import TextArtifact
 from griptape.drivers.vector import BaseVectorStoreDriver
@@ -97,3 +99,20 @@ class TestMongoDbAtlasVectorStoreDriver:
         results = list(driver.load_entries())
         assert results is not None
         assert len(results) == 0
+
+    def test_upsert_vectors(self, driver, mocker):
+        mock_collection = mocker.patch.object(driver, "get_collection").return_value
+
+        ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="new"),
+                BaseVectorStoreDriver.Entry(id=None, vector=[0.3, 0.4], meta={"foo": "bar"}),
+            ]
+        )
+
+        operations = mock_collection.bulk_write.call_args.args[0]
+        assert ids[0] == "foo"
+        assert operations == [
+            ReplaceOne({"_id": "foo"}, {"vector": [0.1, 0.2], "namespace": "new", "meta": None}, upsert=True),
+            InsertOne({"_id": ObjectId(ids[1]), "vector": [0.3, 0.4], "namespace": None, "meta": {"foo": "bar"}}),
+        ]
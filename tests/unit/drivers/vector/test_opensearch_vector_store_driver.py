@@ -1,9 +1,10 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import numpy as np
 import pytest
 
 from griptape.drivers.vector.opensearch import OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -60,3 +61,38 @@ class TestOpenSearchVectorStoreDriver:
             results = driver.query(query_string, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_upsert_vectors(self):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": False, "items": [{"index": {"_id": "foo"}}, {"index": {"_id": "bar"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        ids = driver.upsert_vectors(
+            [
+                OpenSearchVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="company"),
+                OpenSearchVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert ids == ["foo", "bar"]
+        client.bulk.assert_called_once_with(
+            body=[
+                {"index": {"_index": "test", "_id": "foo"}},
+                {"vector": [0.1, 0.2], "namespace": "company", "metadata": None},
+                {"index": {"_index": "test", "_id": "bar"}},
+                {"vector": [0.3, 0.4], "namespace": None, "metadata": {"foo": "bar"}},
+            ]
+        )
+        client.index.assert_not_called()
+
+    def test_upsert_vectors_errors(self):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": True, "items": [{"index": {"_id": "foo", "error": "bad vector"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(RuntimeError, match="bad vector"):
+            driver.upsert_vectors([OpenSearchVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])])
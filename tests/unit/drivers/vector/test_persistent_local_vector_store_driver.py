@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 
@@ -29,3 +30,268 @@ class TestPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+
+class TestLogPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def persist_file(self, temp_dir):
+        return os.path.join(temp_dir, "store.jsonl")
+
+    @pytest.fixture()
+    def driver(self, persist_file):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+    def test_persistence(self, driver, persist_file):
+        driver.upsert(TextArtifact("persistent foobar"))
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+    def test_upsert_appends(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", namespace="bar", meta={"foo": "bar"})
+        driver.upsert_vector([1.0, 0.0], vector_id="baz")
+
+        with open(persist_file) as file:
+            lines = file.read().splitlines()
+
+        assert json.loads(lines[0]) == LocalVectorStoreDriver.LOG_FORMAT_HEADER
+        assert json.loads(lines[1]) == {
+            "key": "bar-foo",
+            "id": "foo",
+            "vector": [0.0, 1.0],
+            "meta": {"foo": "bar"},
+            "namespace": "bar",
+        }
+        assert len(lines) == 3
+
+    def test_latest_record_wins(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").vector == [1.0, 0.0]
+
+    def test_compaction(self, persist_file):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log", compaction_ratio=2
+        )
+
+        for i in range(5):
+            driver.upsert_vector([float(i), 1.0], vector_id="foo")
+
+        with open(persist_file) as file:
+            assert len(file.read().splitlines()) <= 3
+
+        driver.compact()
+
+        with open(persist_file) as file:
+            lines = file.read().splitlines()
+
+        assert len(lines) == 2
+        assert json.loads(lines[1])["vector"] == [4.0, 1.0]
+
+    def test_truncated_record_ignored(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "id": "b')
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert list(new_driver.entries.keys()) == ["foo"]
+
+    def test_upsert_after_truncated_record(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "id": "b')
+
+        LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        ).upsert_vector([1.0, 0.0], vector_id="baz")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert list(new_driver.entries.keys()) == ["foo", "baz"]
+        assert new_driver.load_entry("baz").vector == [1.0, 0.0]
+
+    def test_upsert_after_interrupted_append(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        # A record that was cut off while the driver kept running.
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "id": "b')
+
+        driver.upsert_vector([1.0, 0.0], vector_id="baz")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert list(new_driver.entries.keys()) == ["foo", "baz"]
+
+    def test_migrate_json_format(self, persist_file):
+        json_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        json_driver.upsert(TextArtifact("foobar"), namespace="foo")
+
+        log_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+        )
+
+        assert log_driver.load_entries(namespace="foo")[0].to_artifact().value == "foobar"
+
+        with open(persist_file) as file:
+            assert json.loads(file.readline()) == LocalVectorStoreDriver.LOG_FORMAT_HEADER
+
+    def test_vectors_file(self, temp_dir, persist_file):
+        vectors_file = os.path.join(temp_dir, "store.vectors")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+
+        driver.upsert_vector([0.5, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.25, 0.5], vector_id="bar")
+
+        with open(persist_file) as file:
+            assert "vector" not in json.loads(file.read().splitlines()[1])
+        assert os.path.getsize(vectors_file) == 5 * 4
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+
+        assert new_driver.load_entry("foo").vector == [0.5, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.25, 0.5]
+
+    def test_vectors_file_after_interrupted_write(self, temp_dir, persist_file):
+        vectors_file = os.path.join(temp_dir, "store.vectors")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+        driver.upsert_vector([0.5, 1.0], vector_id="foo")
+
+        with open(vectors_file, "ab") as file:
+            file.write(b"\x00\x01")
+
+        driver.upsert_vector([1.0, 0.25], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+
+        assert new_driver.load_entry("foo").vector == [0.5, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.25]
+
+    def test_vectors_file_compaction(self, temp_dir, persist_file):
+        vectors_file = os.path.join(temp_dir, "store.vectors")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+        driver.upsert_vector([0.5, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.25], vector_id="bar")
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        driver.compact()
+
+        with open(persist_file) as file:
+            assert json.loads(file.readline())["vectors_file"] == "store.vectors.1"
+        assert not os.path.exists(vectors_file)
+        assert os.path.getsize(f"{vectors_file}.1") == 4 * 4
+
+        driver.upsert_vector([0.25, 0.5], vector_id="baz")
+        driver.compact()
+
+        with open(persist_file) as file:
+            assert json.loads(file.readline())["vectors_file"] == "store.vectors"
+        assert not os.path.exists(f"{vectors_file}.1")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+
+        assert new_driver.load_entry("foo").vector == [0.0, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.25]
+        assert new_driver.load_entry("baz").vector == [0.25, 0.5]
+
+    def test_vectors_file_interrupted_compaction(self, mocker, temp_dir, persist_file):
+        vectors_file = os.path.join(temp_dir, "store.vectors")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+        driver.upsert_vector([0.5, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.25], vector_id="bar")
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        replace = os.replace
+
+        def interrupted_replace(src, dst):
+            if dst == persist_file:
+                raise OSError("interrupted")
+            replace(src, dst)
+
+        mocker.patch("os.replace", side_effect=interrupted_replace)
+        with pytest.raises(OSError, match="interrupted"):
+            driver.compact()
+        mocker.stopall()
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=vectors_file,
+        )
+
+        assert new_driver.load_entry("foo").vector == [0.0, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.25]
+
+    def test_vectors_file_required(self, temp_dir, persist_file):
+        LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="log",
+            persist_vectors_file=os.path.join(temp_dir, "store.vectors"),
+        ).upsert_vector([0.5, 1.0], vector_id="foo")
+
+        with pytest.raises(ValueError, match="persist_vectors_file"):
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="log"
+            )
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
 
 from griptape.drivers.vector.pgvector import PgVectorVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -57,6 +58,33 @@ class TestPgVectorVectorStoreDriver:
         mock_session.merge.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    def test_upsert_vectors(self, mock_session, mock_engine):
+        test_id = str(uuid.uuid4())
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        returned_ids = driver.upsert_vectors(
+            [
+                PgVectorVectorStoreDriver.Entry(id=test_id, vector=[1.0, 2.0, 3.0], meta={"foo": "bar"}),
+                PgVectorVectorStoreDriver.Entry(id=None, vector=[4.0, 5.0, 6.0]),
+                PgVectorVectorStoreDriver.Entry(id=test_id, vector=[7.0, 8.0, 9.0], namespace="foo"),
+            ]
+        )
+
+        assert returned_ids[0] == returned_ids[2] == test_id
+        assert uuid.UUID(returned_ids[1])
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        mock_session.merge.assert_not_called()
+
+        params = mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        assert params["id_m0"] == uuid.UUID(test_id)
+        assert params["vector_m0"] == [7.0, 8.0, 9.0]
+        assert params["namespace_m0"] == "foo"
+        assert params["id_m1"] == uuid.UUID(returned_ids[1])
+        assert "id_m2" not in params
+
     def test_load_entry(self, mock_session, mock_engine):
         test_id = str(uuid.uuid4())
         test_vec = [0.1, 0.2, 0.3]
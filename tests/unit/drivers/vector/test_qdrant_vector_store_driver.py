@@ -175,3 +175,40 @@ class TestQdrantVectorStoreDriver:
             assert results[1].id == "id2"
             assert results[1].vector == [0.4, 0.5, 0.6]
             assert results[1].meta == {"key2": "value2"}
+
+    def test_upsert_vectors(self, driver):
+        entries = [
+            QdrantVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], meta={"foo": "bar"}),
+            QdrantVectorStoreDriver.Entry(id=None, vector=[0.3, 0.4]),
+        ]
+
+        with patch.object(driver.client, "upsert") as mock_upsert:
+            ids = driver.upsert_vectors(entries)
+
+        expected_ids = ["foo", str(uuid.uuid5(uuid.NAMESPACE_DNS, str([0.3, 0.4])))]
+        assert ids == expected_ids
+        mock_upsert.assert_called_once_with(
+            collection_name=driver.collection_name,
+            points=import_optional_dependency("qdrant_client.http.models").Batch(
+                ids=expected_ids, vectors=[[0.1, 0.2], [0.3, 0.4]], payloads=[{"foo": "bar"}, {}]
+            ),
+        )
+
+    def test_upsert_vectors_with_content(self, driver):
+        entries = [
+            QdrantVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], meta={"foo": "bar"}),
+            QdrantVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4]),
+        ]
+
+        with patch.object(driver.client, "upsert") as mock_upsert:
+            driver.upsert_vectors(entries, content="baz")
+
+        mock_upsert.assert_called_once_with(
+            collection_name=driver.collection_name,
+            points=import_optional_dependency("qdrant_client.http.models").Batch(
+                ids=["foo", "bar"],
+                vectors=[[0.1, 0.2], [0.3, 0.4]],
+                payloads=[{"foo": "bar", "data": "baz"}, {"data": "baz"}],
+            ),
+        )
+        assert entries[0].meta == {"foo": "bar"}
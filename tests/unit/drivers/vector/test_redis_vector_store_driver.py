@@ -117,3 +117,20 @@ class TestRedisVectorStorageDriver:
         assert results[0].score == 0.456198036671
         assert results[0].meta == {"foo": "bar"}
         assert results[0].vector == [1.0, 2.0, 3.0]
+
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value.__enter__.return_value
+
+        ids = driver.upsert_vectors(
+            [
+                RedisVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0], namespace="some_namespace"),
+                RedisVectorStoreDriver.Entry(id="bar", vector=[3.0, 4.0], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert ids == ["foo", "bar"]
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args[0] for call in pipeline.hset.call_args_list] == ["some_namespace:foo", "bar"]
+        assert pipeline.hset.call_args_list[1].kwargs["mapping"]["metadata"] == '{"foo": "bar"}'
+        pipeline.execute.assert_called_once()
+        mock_client.hset.assert_not_called()
@@ -2,9 +2,10 @@ import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.engines.rag import RagContext
-from griptape.engines.rag.modules import PromptResponseRagModule
+from griptape.engines.rag.modules import FootnotePromptResponseRagModule, PromptResponseRagModule
 from griptape.rules import Rule, Ruleset
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptResponseRagModule:
@@ -29,3 +30,38 @@ class TestPromptResponseRagModule:
         assert "*META*" in system_message
         assert "*TEXT SEGMENT 1*" in system_message
         assert "*TEXT SEGMENT 2*" in system_message
+
+    @pytest.mark.parametrize("max_input_tokens", [0, 600, 700, 900, 1200, 2000, 5000])
+    @pytest.mark.parametrize("module_class", [PromptResponseRagModule, FootnotePromptResponseRagModule])
+    def test_run_fits_text_chunks(self, max_input_tokens, module_class):
+        module = module_class(
+            prompt_driver=MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens)),
+            answer_token_offset=100,
+        )
+        context = RagContext(
+            query="test", text_chunks=[TextArtifact(f"*TEXT SEGMENT {i}*" * (i % 4 + 1)) for i in range(30)]
+        )
+        tokenizer = module.prompt_driver.tokenizer
+
+        # The number of chunks that fit when adding one chunk at a time.
+        expected = 0
+        for chunk_count in range(1, len(context.text_chunks) + 1):
+            system_prompt = module.generate_system_template(context, context.text_chunks[:chunk_count])
+            prompt = module.prompt_driver.prompt_stack_to_string(module.generate_prompt_stack(system_prompt, "test"))
+            if tokenizer.count_tokens(prompt) + module.answer_token_offset >= tokenizer.max_input_tokens:
+                break
+            expected = chunk_count
+
+        assert module._fit_text_chunks(context) == module.generate_system_template(
+            context, context.text_chunks[:expected]
+        )
+
+    def test_run_fits_text_chunks_with_few_renders(self, mocker):
+        module = PromptResponseRagModule(
+            prompt_driver=MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=2000))
+        )
+        spy = mocker.spy(module, "generate_system_template")
+
+        module.run(RagContext(query="test", text_chunks=[TextArtifact(f"*TEXT SEGMENT {i}*") for i in range(100)]))
+
+        assert spy.call_count < 10
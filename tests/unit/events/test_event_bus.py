@@ -1,6 +1,7 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
-from griptape.events import EventBus, EventListener
+from griptape.common import PromptStack
+from griptape.events import BaseEvent, BasePromptEvent, EventBus, EventListener
 from griptape.events.finish_prompt_event import FinishPromptEvent
 from griptape.events.start_prompt_event import StartPromptEvent
 from griptape.utils import with_contextvars
@@ -61,6 +62,63 @@ class TestEventBus:
         # Then
         mock_handler.assert_called_once_with(mock_event)
 
+    def test_publish_event_routes_by_event_type(self):
+        prompt_handler = Mock(return_value=None)
+        base_handler = Mock(return_value=None)
+        EventBus.add_event_listeners(
+            [
+                EventListener(prompt_handler, event_types=[BasePromptEvent]),
+                EventListener(base_handler, event_types=[BaseEvent]),
+            ]
+        )
+        prompt_event = StartPromptEvent(prompt_stack=PromptStack(), model="foo")
+        mock_event = MockEvent()
+
+        EventBus.publish_event(prompt_event)
+        EventBus.publish_event(mock_event)
+
+        prompt_handler.assert_called_once_with(prompt_event)
+        assert base_handler.call_args_list == [call(prompt_event), call(mock_event)]
+
+    def test_get_event_listeners(self):
+        e1: EventListener = EventListener(event_types=[StartPromptEvent])
+        e2 = EventListener(lambda e: e)
+        EventBus.add_event_listeners([e1, e2])
+
+        assert EventBus.get_event_listeners(StartPromptEvent) == [e1, e2]
+        assert EventBus.get_event_listeners(StartPromptEvent) is EventBus.get_event_listeners(StartPromptEvent)
+        assert EventBus.get_event_listeners(FinishPromptEvent) == [e2]
+
+        EventBus.remove_event_listener(e2)
+
+        assert EventBus.get_event_listeners(StartPromptEvent) == [e1]
+        assert EventBus.get_event_listeners(FinishPromptEvent) == []
+
+        e1.event_types = [FinishPromptEvent]
+
+        assert EventBus.get_event_listeners(StartPromptEvent) == []
+        assert EventBus.get_event_listeners(FinishPromptEvent) == [e1]
+
+    def test_has_event_listeners(self):
+        assert not EventBus.has_event_listeners(MockEvent)
+
+        with EventListener(event_types=[MockEvent]):
+            assert EventBus.has_event_listeners(MockEvent)
+            assert not EventBus.has_event_listeners(StartPromptEvent)
+
+        assert not EventBus.has_event_listeners(MockEvent)
+
+    def test_publish_event_flush(self):
+        event_listener_driver = Mock()
+        EventBus.add_event_listener(
+            EventListener(event_types=[StartPromptEvent], event_listener_driver=event_listener_driver)
+        )
+
+        EventBus.publish_event(MockEvent(), flush=True)
+
+        event_listener_driver.publish_event.assert_not_called()
+        event_listener_driver.flush_events.assert_called_once()
+
     def test_context_manager(self):
         e1 = EventListener()
         EventBus.add_event_listeners([e1])
@@ -1,8 +1,10 @@
 import json
 
+import pytest
+
 from griptape.artifacts import TextArtifact
 from griptape.common import PromptStack
-from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run
+from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run, SummaryConversationMemory
 from griptape.structures import Agent, Pipeline
 from griptape.tasks import PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
@@ -177,3 +179,58 @@ class TestConversationMemory:
         assert prompt_stack.messages[2].content[0].artifact.value == "bar2"
         assert prompt_stack.messages[-2].content[0].artifact.value == "foo"
         assert prompt_stack.messages[-1].content[0].artifact.value == "bar"
+
+    @pytest.mark.parametrize("max_input_tokens", [0, 20, 50, 90, 91, 92, 150, 400, 1000])
+    @pytest.mark.parametrize("summary", [None, "summary " * 20])
+    def test_add_to_prompt_stack_autopruning_matches_linear_scan(self, max_input_tokens, summary):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens))
+        runs = [
+            Run(input=TextArtifact(f"foo{i}" * (i % 3 + 1)), output=TextArtifact(f"bar{i}" * (i % 5 + 1)))
+            for i in range(20)
+        ]
+        # The summary is not part of the per-run token counts, so the estimate has to be corrected.
+        memory: BaseConversationMemory = (
+            SummaryConversationMemory(autoprune=True, offset=len(runs), summary=summary, runs=runs)
+            if summary
+            else ConversationMemory(autoprune=True, runs=runs)
+        )
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("fizz")
+
+        # The last number of runs that fit when pruning one run at a time.
+        expected = next(
+            (
+                n
+                for n in range(len(memory.runs), 0, -1)
+                if prompt_driver.tokenizer.count_input_tokens_left(
+                    prompt_driver.prompt_stack_to_string(
+                        PromptStack(messages=[*prompt_stack.messages, *memory.to_prompt_stack(n).messages])
+                    )
+                )
+                > 0
+            ),
+            0,
+        )
+
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+        expected_messages = memory.to_prompt_stack(expected).messages if expected else []
+        assert [message.to_text() for message in prompt_stack.messages[1:]] == [
+            message.to_text() for message in expected_messages
+        ]
+
+    def test_add_to_prompt_stack_caches_run_token_counts(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=1000))
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(200)],
+        )
+        spy = mocker.spy(prompt_driver, "prompt_stack_to_string")
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        first_call_count = spy.call_count
+        spy.reset_mock()
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        assert first_call_count < len(memory.runs) + 10
+        assert spy.call_count < 10
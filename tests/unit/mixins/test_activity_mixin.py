@@ -2,6 +2,7 @@ import pytest
 from pydantic import BaseModel
 from schema import Literal, Optional
 
+from griptape.utils.decorators import activity
 from tests.mocks.mock_tool.tool import MockTool
 from tests.mocks.mock_tool_pydantic.tool import MockToolPydantic
 
@@ -41,6 +42,15 @@ class TestActivityMixin:
         assert len(tool.activities()) == 8
         assert tool.activities()[0] == tool.test
 
+    def test_activities_with_instance_activity(self, tool):
+        def test_instance(self, params: dict) -> str:
+            return "foo"
+
+        tool.test_instance = activity(config={"description": "Instance activity"})(test_instance).__get__(tool)
+
+        assert tool.find_activity("test_instance") == tool.test_instance
+        assert len(tool.activities()) == 9
+
     def test_allowlist_and_denylist_validation(self):
         with pytest.raises(ValueError):
             MockTool(test_field="hello", test_int=5, allowlist=["not_an_activity"], denylist=[])
@@ -117,6 +127,24 @@ class TestActivityMixin:
             "type": "object",
         }
 
+    def test_activity_schema_cache(self, tool):
+        json_schema = tool.to_activity_json_schema(tool.test, "InputSchema")
+
+        assert tool.activity_schema(tool.test) is tool.activity_schema(tool.test)
+        assert tool.to_activity_json_schema(tool.test, "InputSchema") == json_schema
+
+        tool.extra_schema_properties = {"test": {Literal("new_property"): str}}
+
+        assert "new_property" in tool.to_activity_json_schema(tool.test, "InputSchema")["properties"]
+        assert "new_property" not in json_schema["properties"]
+
+    def test_activity_schema_cache_allowlist(self, tool):
+        assert len(tool.activities()) == 8
+
+        tool.allowlist = ["test"]
+
+        assert tool.activities() == [tool.test]
+
     def test_callable_schema(self):
         tool = MockTool(custom_schema={"test": str})
         schema = tool.activity_schema(tool.test_callable_schema).json_schema("InputSchema")
@@ -2,6 +2,9 @@ from concurrent import futures
 
 import pytest
 
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import ExecutorRegistry, PooledExecutor
 from tests.mocks.mock_futures_executor import MockFuturesExecutor
 
 
@@ -11,6 +14,17 @@ class TestFuturesExecutorMixin:
 
         assert MockFuturesExecutor(create_futures_executor=lambda: executor).futures_executor == executor
 
+    def test_default_futures_executor(self):
+        executor = MockFuturesExecutor().create_futures_executor()
+
+        assert isinstance(executor, PooledExecutor)
+        assert executor.pool is ExecutorRegistry.get_pool("default")
+
+    def test_futures_executor_pool(self):
+        assert MockFuturesExecutor().create_futures_executor == MockFuturesExecutor().create_futures_executor
+        assert PromptTask().create_futures_executor().pool is ExecutorRegistry.get_pool("tasks")
+        assert Workflow().create_futures_executor().pool is ExecutorRegistry.get_pool("workflows")
+
     def test_deprecated_futures_executor(self):
         mock_executor = MockFuturesExecutor()
         with pytest.warns(DeprecationWarning, match=r"`FuturesExecutorMixin\.futures_executor` is deprecated"):
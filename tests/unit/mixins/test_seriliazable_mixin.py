@@ -7,7 +7,7 @@ from griptape.artifacts import BaseArtifact, TextArtifact
 from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
 from griptape.memory import TaskMemory
 from griptape.memory.structure import ConversationMemory
-from griptape.schemas import BaseSchema
+from griptape.schemas import BaseSchema, CompiledSerializer
 from griptape.tasks.base_task import BaseTask
 from griptape.tasks.tool_task import ToolTask
 from griptape.tools.base_tool import BaseTool
@@ -122,3 +122,23 @@ class TestSerializableMixin:
 
         assert parsed["generated_image_urls"] == ["http://example.com/image1.png"]
         assert parsed["conversation_output"] == "Hello, Collin!"
+
+    def test_compiled_serialization(self, mocker):
+        artifact = TextArtifact("foo")
+        dump = mocker.spy(CompiledSerializer, "dump")
+
+        assert artifact.to_dict() == BaseSchema.from_attrs_cls(TextArtifact)().dump(artifact)
+        assert json.loads(artifact.to_json()) == artifact.to_dict()
+        assert dump.call_count == 3
+
+        assert artifact.to_dict(serializable_overrides={"name": False}) == {
+            "type": "TextArtifact",
+            "id": artifact.id,
+            "reference": None,
+            "meta": {},
+            "value": "foo",
+        }
+        assert dump.call_count == 3
+
+        MockSerializable().to_dict()
+        assert dump.call_count == 3
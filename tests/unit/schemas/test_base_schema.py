@@ -47,6 +47,17 @@ class TestBaseSchema:
         assert isinstance(schema.fields["baz"]._candidate_fields[0].inner, fields.Integer)
         assert schema.fields["baz"].allow_none is True
 
+    def test_from_attrs_cls_cached(self):
+        schema_class = BaseSchema.from_attrs_cls(MockSerializable)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is schema_class
+        assert BaseSchema.from_attrs_cls(MockSerializable, types_overrides={}, serializable_overrides={}) is (
+            schema_class
+        )
+        assert BaseSchema.from_attrs_cls(MockSerializable, serializable_overrides={"bar": True}) is not schema_class
+        assert BaseSchema.from_attrs_cls(MockSerializable, types_overrides={"foo": int}) is not schema_class
+        assert PolymorphicSchema.from_attrs_cls(MockSerializable) is not schema_class
+
     def test_get_field_for_type(self):
         assert isinstance(BaseSchema._get_field_for_type(BaseArtifact), fields.Nested)
 
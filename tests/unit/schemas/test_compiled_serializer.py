@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from griptape.artifacts import (
+    ActionArtifact,
+    BlobArtifact,
+    BooleanArtifact,
+    ImageArtifact,
+    JsonArtifact,
+    ListArtifact,
+    TextArtifact,
+)
+from griptape.common import Message, PromptStack, Reference, TextMessageContent, ToolAction
+from griptape.drivers.vector import BaseVectorStoreDriver
+from griptape.events import FinishPromptEvent, FinishTaskEvent, TextChunkEvent
+from griptape.memory.structure import ConversationMemory, Run
+from griptape.schemas import BaseSchema, CompiledSerializer
+from tests.mocks.mock_serializable import MockSerializable
+
+
+def build_objects() -> list:
+    return [
+        MockSerializable(),
+        MockSerializable(
+            bar="bar",
+            baz=[1, 2],
+            secret="secret",
+            nested=MockSerializable.NestedMockSerializable(foo="baz"),
+            model=MockSerializable.MockOutput(foo="bar"),
+            buzz={"foo": MockSerializable()},
+        ),
+        TextArtifact("foo", meta={"foo": "bar"}, reference=Reference(title="title", authors=["author"])),
+        ImageArtifact(b"image", format="png", width=1, height=1),
+        BlobArtifact(b"blob"),
+        BooleanArtifact(value=True),
+        JsonArtifact({"foo": ["bar"]}),
+        ListArtifact([TextArtifact("foo"), TextArtifact("bar")]),
+        ActionArtifact(ToolAction(tag="tag", name="name", path="path", input={"foo": "bar"})),
+        BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1.5], meta={"artifact": TextArtifact("foo").to_json()}),
+        TextChunkEvent(token="foo", index=1),
+        FinishPromptEvent(result="foo", input_token_count=1, output_token_count=None, model="model"),
+        FinishTaskEvent(
+            task_id="task",
+            task_parent_ids=["parent"],
+            task_child_ids=[],
+            task_input=TextArtifact("foo"),
+            task_output=ListArtifact([TextArtifact("bar")]),
+        ),
+        Run(input=TextArtifact("foo"), output=ImageArtifact(b"image", format="png", width=1, height=1), meta={}),
+        PromptStack(messages=[Message(content=[TextMessageContent(TextArtifact("foo"))], role=Message.USER_ROLE)]),
+        ConversationMemory(runs=[Run(input=TextArtifact("foo"), output=TextArtifact("bar"))], autoload=False),
+    ]
+
+
+class TestCompiledSerializer:
+    @pytest.mark.parametrize("obj", build_objects(), ids=lambda obj: obj.__class__.__name__)
+    def test_dump_matches_schema(self, obj):
+        expected = BaseSchema.from_attrs_cls(obj.__class__)().dump(obj)
+
+        assert CompiledSerializer.dump(obj) == expected
+        assert list(CompiledSerializer.dump(obj)) == list(expected)
+
+    @pytest.mark.parametrize("obj", build_objects(), ids=lambda obj: obj.__class__.__name__)
+    def test_round_trip(self, obj):
+        data = CompiledSerializer.dump(obj)
+
+        assert obj.__class__.from_dict(data).to_dict() == data
+        assert json.loads(CompiledSerializer.dumps(obj)) == json.loads(json.dumps(data))
+
+    def test_get_dump_function_cached(self):
+        dump_function = CompiledSerializer.get_dump_function(TextArtifact)
+
+        assert CompiledSerializer.get_dump_function(TextArtifact) is dump_function
+
+    def test_dump_nested_subclass(self):
+        obj = MockSerializable(nested=MockSerializable.NestedMockSerializable())
+
+        assert CompiledSerializer.dump(obj)["nested"] == {"type": "NestedMockSerializable", "foo": "bar"}
+
+    def test_dumps_falls_back_to_json(self):
+        obj = TextArtifact("foo", meta={"big": 2**64, "model": MockSerializable.MockOutput(foo="bar")})
+
+        assert json.loads(CompiledSerializer.dumps(obj))["meta"] == {"big": 2**64, "model": {"foo": "bar"}}
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -331,6 +332,17 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        first_task = PromptTask("test")
+        second_task = PromptTask("{{ parent_output }}")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+
+        result = asyncio.run(pipeline.arun())
+
+        assert "mock output" in result.output_task.output.to_text()
+        assert first_task.state == BaseTask.State.FINISHED
+        assert second_task.state == BaseTask.State.FINISHED
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline()
@@ -381,6 +393,15 @@ class TestPipeline:
 
         assert pipeline.output is not None
 
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_arun_with_error_artifact(self, error_artifact_task, fail_fast):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(tasks=[error_artifact_task, end_task], fail_fast=fail_fast)
+
+        asyncio.run(pipeline.arun())
+
+        assert end_task.is_finished() is not fail_fast
+
     def test_add_duplicate_task(self):
         task = PromptTask("test")
         pipeline = Pipeline()
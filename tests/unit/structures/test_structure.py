@@ -1,7 +1,13 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+from typing import Any
+
 import pytest
 
-from griptape.events import FinishStructureRunEvent, FinishTaskEvent, StartTaskEvent
-from griptape.structures import Agent, Pipeline
+from griptape.events import FinishStructureRunEvent, FinishTaskEvent, StartStructureRunEvent, StartTaskEvent
+from griptape.structures import Agent, Pipeline, Workflow
 from griptape.tasks import PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 
@@ -20,6 +26,75 @@ class TestStructure:
         ):
             assert agent.output
 
+    def test_find_task(self):
+        first_task = PromptTask("1", id="first")
+        second_task = PromptTask("2", id="second")
+        pipeline = Pipeline(tasks=[first_task])
+
+        assert pipeline.find_task("first") is first_task
+        assert pipeline.try_find_task("second") is None
+        with pytest.raises(ValueError, match="Task with id second doesn't exist."):
+            pipeline.find_task("second")
+
+        pipeline.add_task(second_task)
+
+        assert pipeline.find_task("second") is second_task
+        assert pipeline.tasks == [first_task, second_task]
+
+    def test_find_task_after_insert(self):
+        first_task = PromptTask("1", id="first")
+        second_task = PromptTask("2", id="second")
+        inserted_task = PromptTask("inserted", id="inserted")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+        assert pipeline.try_find_task("inserted") is None
+
+        pipeline.insert_task(first_task, inserted_task)
+
+        assert pipeline.find_task("inserted") is inserted_task
+        assert pipeline.tasks == [first_task, inserted_task, second_task]
+
+    def test_find_task_after_replacing_tasks(self):
+        first_task = PromptTask("1", id="first")
+        second_task = PromptTask("2", id="second")
+        agent = Agent(tasks=[first_task])
+        workflow = Workflow(tasks=[first_task])
+        assert agent.find_task("first") is first_task
+        assert workflow.find_task("first") is first_task
+
+        agent.add_task(second_task)
+        workflow._tasks = [[second_task]]
+
+        for structure in (agent, workflow):
+            assert structure.try_find_task("first") is None
+            assert structure.find_task("second") is second_task
+            assert structure.tasks == [second_task]
+
+    def test_find_task_from_threads(self):
+        class SlowList(list):
+            def __getitem__(self, index: Any) -> Any:
+                # Widens the window in which Tasks are indexed, so that threads index concurrently without a lock.
+                if isinstance(index, slice):
+                    time.sleep(0.1)
+                return super().__getitem__(index)
+
+        tasks = [PromptTask(str(i), id=str(i)) for i in range(3)]
+        workflow = Workflow()
+        workflow._tasks = SlowList(tasks)
+
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            found = list(executor.map(workflow.find_task, ["0", "2"]))
+
+        assert found == [tasks[0], tasks[2]]
+        assert workflow.tasks == tasks
+
+    def test_tasks_returns_copy(self):
+        task = PromptTask("1")
+        pipeline = Pipeline(tasks=[task])
+
+        pipeline.tasks.clear()
+
+        assert pipeline.tasks == [task]
+
     def test_conversation_mode_per_structure(self):
         pipeline = Pipeline(
             conversation_memory_strategy="per_structure",
@@ -170,3 +245,88 @@ class TestStructure:
         for idx, event in enumerate(events):
             assert isinstance(event, expected_event_types[idx])
         assert len(EventBus.event_listeners) == 0
+
+    def test_arun_stream(self):
+        from griptape.events import (
+            EventBus,
+            FinishPromptEvent,
+            StartPromptEvent,
+            StartStructureRunEvent,
+        )
+
+        agent = Agent()
+        event_types = [StartStructureRunEvent, StartTaskEvent, StartPromptEvent, FinishPromptEvent, FinishTaskEvent]
+
+        async def collect():
+            return [event async for event in agent.arun_stream()]
+
+        events = asyncio.run(collect())
+
+        assert [type(event) for event in events] == event_types
+        assert agent.output.value == "mock output"
+        assert len(EventBus.event_listeners) == 0
+
+    def test_arun_stream_custom_event_types(self):
+        from griptape.events import FinishPromptEvent, StartPromptEvent
+
+        agent = Agent()
+
+        async def collect():
+            return [event async for event in agent.arun_stream(event_types=[StartPromptEvent, FinishPromptEvent])]
+
+        events = asyncio.run(collect())
+
+        assert [type(event) for event in events] == [StartPromptEvent, FinishPromptEvent]
+
+    def test_arun_finishes_off_the_event_loop(self, mocker):
+        after_run = Agent.after_run
+        threads = []
+
+        def spy_after_run(agent: Agent) -> None:
+            threads.append(threading.current_thread())
+            after_run(agent)
+
+        mocker.patch.object(Agent, "after_run", spy_after_run)
+        agent = Agent()
+
+        asyncio.run(agent.arun())
+
+        assert threads
+        assert threads[0] is not threading.main_thread()
+        assert agent.output.value == "mock output"
+
+    def test_arun_stream_closed_early(self):
+        from griptape.events import EventBus
+
+        def slow_output(_) -> str:
+            time.sleep(1)
+
+            return "mock output"
+
+        agent = Agent(prompt_driver=MockPromptDriver(mock_output=slow_output))
+
+        async def first_event():
+            stream = agent.arun_stream()
+            event = await anext(stream)
+            start = time.perf_counter()
+            await stream.aclose()
+
+            return event, time.perf_counter() - start
+
+        event, close_time = asyncio.run(first_event())
+
+        assert isinstance(event, StartStructureRunEvent)
+        assert close_time < 0.5
+        assert len(EventBus.event_listeners) == 0
+
+    def test_arun_stream_raises(self):
+        from griptape.events import EventBus
+
+        pipeline = Pipeline(tasks=[PromptTask(id="task", parent_ids=["missing"])])
+
+        async def collect():
+            return [event async for event in pipeline.arun_stream()]
+
+        with pytest.raises(ValueError, match="Task with id missing doesn't exist."):
+            asyncio.run(collect())
+        assert len(EventBus.event_listeners) == 0
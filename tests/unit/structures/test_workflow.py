@@ -1,6 +1,9 @@
+import asyncio
+import threading
 import time
 
 import pytest
+from attrs import define
 
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.memory.structure import ConversationMemory
@@ -201,6 +204,19 @@ class TestWorkflow:
         assert task1.state == BaseTask.State.FINISHED
         assert task2.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task1 = PromptTask("test")
+        task2 = PromptTask("test")
+        task3 = PromptTask("{{ parents_output_text }}", parent_ids=[task1.id, task2.id])
+        workflow = Workflow(tasks=[task1, task2, task3])
+
+        asyncio.run(workflow.arun())
+
+        assert task1.state == BaseTask.State.FINISHED
+        assert task2.state == BaseTask.State.FINISHED
+        assert task3.state == BaseTask.State.FINISHED
+        assert task3.input.to_text() == "mock output\nmock output"
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         workflow = Workflow()
@@ -767,6 +783,74 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_does_not_wait_for_independent_tasks(self):
+        downstream_started = threading.Event()
+
+        def slow_fn(task):
+            # Only finishes once a Task on another branch has started after its own parent.
+            return TextArtifact(str(downstream_started.wait(timeout=5)))
+
+        def downstream_fn(task):
+            downstream_started.set()
+            return TextArtifact("done")
+
+        slow_task = CodeExecutionTask(on_run=slow_fn, id="slow")
+        fast_task = CodeExecutionTask(on_run=lambda task: TextArtifact("done"), id="fast")
+        downstream_task = CodeExecutionTask(on_run=downstream_fn, id="downstream", parent_ids=["fast"])
+        workflow = Workflow(tasks=[slow_task, fast_task, downstream_task])
+
+        workflow.run()
+
+        assert slow_task.output is not None
+        assert slow_task.output.value == "True"
+        assert downstream_task.is_finished()
+
+    def test_run_with_error_artifact_stops_scheduling(self, error_artifact_task, waiting_task):
+        child_task = CodeExecutionTask(on_run=lambda task: TextArtifact("child"))
+        child_task.add_parent(waiting_task)
+        workflow = Workflow(tasks=[waiting_task, error_artifact_task, child_task])
+
+        workflow.run()
+
+        assert waiting_task.is_finished()
+        assert child_task.is_pending()
+
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_arun_with_error_artifact(self, error_artifact_task, fail_fast):
+        done_task = CodeExecutionTask(on_run=lambda task: TextArtifact("done"))
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, done_task])
+        workflow = Workflow(tasks=[done_task, error_artifact_task, end_task], fail_fast=fail_fast)
+
+        asyncio.run(workflow.arun())
+
+        assert done_task.is_finished()
+        assert end_task.is_finished() is not fail_fast
+
+    def test_arun_runs_independent_tasks_concurrently(self):
+        started = {"first": asyncio.Event(), "second": asyncio.Event()}
+
+        @define
+        class WaitingTask(CodeExecutionTask):
+            async def try_arun(self) -> TextArtifact:
+                # Each Task only finishes once the other one has started.
+                started[self.id].set()
+                other_id = "second" if self.id == "first" else "first"
+                await asyncio.wait_for(started[other_id].wait(), timeout=5)
+
+                return TextArtifact("done")
+
+        first_task = WaitingTask(on_run=lambda task: TextArtifact("unused"), id="first")
+        second_task = WaitingTask(on_run=lambda task: TextArtifact("unused"), id="second")
+        end_task = PromptTask("end", parent_ids=["first", "second"])
+        workflow = Workflow(tasks=[first_task, second_task, end_task])
+
+        asyncio.run(workflow.arun())
+
+        assert first_task.output.value == "done"
+        assert second_task.output.value == "done"
+        assert end_task.is_finished()
+
     def test_nested_tasks(self):
         workflow = Workflow(
             tasks=[
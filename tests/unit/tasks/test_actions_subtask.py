@@ -1,4 +1,6 @@
+import asyncio
 import json
+import threading
 
 import pytest
 import schema
@@ -286,6 +288,33 @@ class TestActionsSubtask:
         assert isinstance(subtask.output.value[0], ErrorArtifact)
         assert subtask.output.value[0].value == "error value"
 
+    def test_arun_executes_tools_concurrently(self, mocker):
+        barrier = threading.Barrier(2, timeout=5)
+        run_action = ActionsSubtask.run_action
+
+        def wait_for_other_action(subtask, action):
+            # Both actions have to be running at the same time to get past the barrier.
+            barrier.wait()
+
+            return run_action(subtask, action)
+
+        mocker.patch.object(ActionsSubtask, "run_action", autospec=True, side_effect=wait_for_other_action)
+        actions_input = ListArtifact(
+            [
+                ActionArtifact(ToolAction(tag="foo", name="MockTool", path="test", input={"test": "a"})),
+                ActionArtifact(ToolAction(tag="bar", name="MockTool", path="test", input={"test": "b"})),
+            ]
+        )
+
+        task = PromptTask(tools=[MockTool()])
+        Agent().add_task(task)
+        subtask = task.add_subtask(ActionsSubtask(actions_input))
+        asyncio.run(subtask.arun())
+
+        assert isinstance(subtask.output, ListArtifact)
+        assert [artifact.value for artifact in subtask.output.value] == ["ack a", "ack b"]
+        assert [artifact.name for artifact in subtask.output.value] == ["foo output", "bar output"]
+
     def test_origin_task(self):
         valid_input = TextArtifact(
             "Thought: need to test\n"
@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.events import EventBus
 from griptape.events.event_listener import EventListener
 from griptape.structures import Agent, Workflow
@@ -116,6 +117,22 @@ class TestBaseTask:
 
         assert EventBus.event_listeners[0].on_event.call_count == 2
 
+    def test_arun_publish_events(self, task):
+        output = asyncio.run(task.arun())
+
+        assert output.value == "foobar"
+        assert task.is_finished()
+        assert EventBus.event_listeners[0].on_event.call_count == 2
+
+    def test_arun_error(self, task, mocker):
+        mocker.patch.object(task, "try_run", side_effect=Exception("error"))
+
+        output = asyncio.run(task.arun())
+
+        assert isinstance(output, ErrorArtifact)
+        assert output.value == "error"
+        assert task.is_finished()
+
     def test_add_parent(self, task):
         agent = Agent()
         parent = MockTask("parent foobar", id="parent_foobar", structure=agent)
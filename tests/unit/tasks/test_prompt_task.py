@@ -1,3 +1,4 @@
+import asyncio
 import re
 from contextlib import nullcontext
 
@@ -14,7 +15,7 @@ from griptape.rules import Rule
 from griptape.rules.json_schema_rule import JsonSchemaRule
 from griptape.rules.ruleset import Ruleset
 from griptape.structures import Agent, Pipeline
-from griptape.tasks import PromptTask
+from griptape.tasks import OutputSchemaValidationSubtask, PromptTask
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
 
@@ -261,6 +262,45 @@ class TestPromptTask:
         task.run()
         assert len(task.subtasks) == 2
 
+    def test_prompt_stack_cache(self, mocker):
+        task = PromptTask(input="foo", prompt_driver=MockPromptDriver(use_native_tools=True), tools=[MockTool()])
+        generate_system_template = mocker.spy(task, "generate_system_template")
+
+        task.run()
+
+        assert len(task.subtasks) == 2
+        assert generate_system_template.call_count == 1
+        assert task._prompt_stack_cache is None
+
+    def test_prompt_stack_cache_meta_memory(self, mocker):
+        prompt_driver = MockPromptDriver(use_native_tools=True)
+        task = PromptTask(input="foo", prompt_driver=prompt_driver, tools=[MockTool(off_prompt=True)])
+        Agent().add_task(task)
+        run = mocker.spy(prompt_driver, "run")
+
+        task.run()
+
+        system_messages = [call.args[0].system_messages[0].to_text() for call in run.call_args_list]
+        assert len(system_messages) == 2
+        assert "You have access to additional contextual information" not in system_messages[0]
+        assert "You have access to additional contextual information" in system_messages[1]
+
+    def test_prompt_stack_cache_messages(self):
+        task = PromptTask(input="foo", prompt_driver=MockPromptDriver(use_native_tools=True), tools=[MockTool()])
+        task.run()
+        task.output = None
+        expected_messages = [(message.role, message.to_text()) for message in task.prompt_stack.messages]
+
+        with task._caching_prompt_stack():
+            for _ in range(2):
+                messages = [(message.role, message.to_text()) for message in task.prompt_stack.messages]
+
+                assert messages == expected_messages
+
+            task.subtasks.pop()
+
+            assert len(task.prompt_stack.messages) == len(expected_messages) - 2
+
     @pytest.mark.parametrize("structured_output_strategy", ["native"])
     @pytest.mark.parametrize(
         ("output_schema", "expected_output", "expected_context"),
@@ -305,6 +345,58 @@ class TestPromptTask:
 
         assert result.to_text() == expected
 
+    @pytest.mark.parametrize(
+        ("reflect_on_tool_use", "expected"),
+        [(True, "mock output"), (False, "ack test-value")],
+    )
+    def test_arun(self, reflect_on_tool_use, expected):
+        task = PromptTask(
+            tools=[MockTool()],
+            prompt_driver=MockPromptDriver(use_native_tools=True),
+            reflect_on_tool_use=reflect_on_tool_use,
+        )
+
+        result = asyncio.run(task.arun())
+
+        assert result.to_text() == expected
+        assert len(task.subtasks) == (2 if reflect_on_tool_use else 1)
+
+    def test_arun_output_schema(self):
+        task = PromptTask(
+            input="foo",
+            prompt_driver=MockPromptDriver(structured_output_strategy="tool", mock_structured_output={"foo": "bar"}),
+            output_schema=schema.Schema({"foo": str}),
+        )
+
+        assert asyncio.run(task.arun()).value == {"foo": "bar"}
+
+    def test_arun_output_schema_runs_subtasks_async(self, mocker):
+        arun = mocker.spy(OutputSchemaValidationSubtask, "arun")
+        run = mocker.spy(OutputSchemaValidationSubtask, "run")
+        outputs = iter([{}, {"foo": "bar"}])
+        task = PromptTask(
+            input="foo",
+            prompt_driver=MockPromptDriver(
+                structured_output_strategy="rule", mock_structured_output=lambda _: next(outputs)
+            ),
+            output_schema=schema.Schema({"foo": str}),
+        )
+
+        assert asyncio.run(task.arun()).value == {"foo": "bar"}
+        assert arun.call_count == 1
+        run.assert_not_called()
+
+    def test_arun_custom_subtask_runners(self):
+        async def async_runner(subtask_input):
+            return TextArtifact(f"{subtask_input.value} async")
+
+        def sync_runner(subtask_input):
+            return TextArtifact(f"{subtask_input.value} sync")
+
+        task = PromptTask(input="foo", prompt_driver=MockPromptDriver(), subtask_runners=[async_runner, sync_runner])
+
+        assert asyncio.run(task.arun()).value == "mock output async sync"
+
     @pytest.mark.parametrize(
         ("output_schema", "should_raise"),
         [
@@ -70,3 +70,30 @@ class TestAnthropicTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_estimate_token_count_mode(self, mock_client):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", token_count_mode="estimate")
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 4
+        assert tokenizer.count_tokens("The quick brown fox jumps over the lazy dog.") == 11
+        assert tokenizer.count_tokens("") == 0
+        assert tokenizer.count_input_tokens_left("foo bar huzzah") == 199996
+        mock_client.return_value.beta.messages.count_tokens.assert_not_called()
+
+    def test_estimate_tokens_margin(self):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", token_count_mode="estimate", token_estimate_margin=0)
+
+        assert tokenizer.estimate_tokens("foo bar huzzah") == 3
+        assert tokenizer.estimate_tokens("internationalization 12345\n\n価格") == 4 + 5 + 1 + 2
+
+    def test_hybrid_token_count_mode(self, mock_client):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", token_count_mode="hybrid")
+        count_tokens = mock_client.return_value.beta.messages.count_tokens
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 4
+        assert tokenizer.count_tokens_for_limit("foo bar huzzah", 100) == 4
+        assert tokenizer.count_tokens_for_limit("foo bar huzzah", 1) == 4
+        count_tokens.assert_not_called()
+
+        assert tokenizer.count_tokens_for_limit("foo bar huzzah", 3) == 5
+        count_tokens.assert_called_once()
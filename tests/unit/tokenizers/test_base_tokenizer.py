@@ -1,5 +1,9 @@
 import logging
 
+import pytest
+from attrs import define
+
+from griptape.tokenizers import BaseTokenizer
 from tests.mocks.mock_tokenizer import MockTokenizer
 
 
@@ -12,3 +16,73 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_cache(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        spy = mocker.spy(tokenizer, "try_count_tokens_batch")
+
+        assert tokenizer.count_tokens("foo bar") == 7
+        assert tokenizer.count_tokens("foo bar") == 7
+        assert spy.call_count == 1
+        assert tokenizer.token_count_cache_hits == 1
+        assert tokenizer.token_count_cache_misses == 1
+        assert tokenizer.token_count_cache_hit_rate == 0.5
+
+    def test_count_tokens_batch(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        tokenizer.count_tokens("foo")
+        spy = mocker.spy(tokenizer, "try_count_tokens_batch")
+
+        assert tokenizer.count_tokens_batch(["foo", "foo bar", "baz", "foo bar"]) == [3, 7, 3, 7]
+        spy.assert_called_once_with(["foo bar", "baz"])
+        assert (tokenizer.token_count_cache_hits, tokenizer.token_count_cache_misses) == (2, 3)
+
+    def test_count_tokens_cache_evicts_least_recently_used(self, mocker):
+        tokenizer = MockTokenizer(model="foo", token_count_cache_size=2)
+        tokenizer.count_tokens_batch(["foo", "bar"])
+        tokenizer.count_tokens("foo")
+        tokenizer.count_tokens("baz")
+        spy = mocker.spy(tokenizer, "try_count_tokens_batch")
+
+        tokenizer.count_tokens_batch(["foo", "bar", "baz"])
+
+        spy.assert_called_once_with(["bar"])
+
+    def test_count_tokens_cache_disabled(self, mocker):
+        tokenizer = MockTokenizer(model="foo", token_count_cache_size=0)
+        spy = mocker.spy(tokenizer, "try_count_tokens_batch")
+
+        tokenizer.count_tokens("foo")
+        tokenizer.count_tokens("foo")
+
+        assert spy.call_count == 2
+        assert tokenizer.token_count_cache_hit_rate == 0.0
+
+    def test_clear_token_count_cache(self, mocker):
+        tokenizer = MockTokenizer(model="foo")
+        tokenizer.count_tokens("foo")
+        tokenizer.clear_token_count_cache()
+        spy = mocker.spy(tokenizer, "try_count_tokens_batch")
+
+        tokenizer.count_tokens("foo")
+
+        assert spy.call_count == 1
+
+    def test_count_tokens_override(self):
+        @define
+        class LegacyTokenizer(BaseTokenizer):
+            def count_tokens(self, text: str) -> int:
+                return len(text.split())
+
+        tokenizer = LegacyTokenizer(model="foo")
+
+        assert tokenizer.count_tokens("foo bar") == 2
+        assert tokenizer.count_tokens_batch(["foo bar", "baz"]) == [2, 1]
+
+    def test_count_tokens_not_implemented(self):
+        @define
+        class IncompleteTokenizer(BaseTokenizer):
+            pass
+
+        with pytest.raises(TypeError, match="try_count_tokens"):
+            IncompleteTokenizer(model="foo")
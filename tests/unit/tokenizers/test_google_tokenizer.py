@@ -38,3 +38,10 @@ class TestGoogleTokenizer:
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
         assert tokenizer.count_output_tokens_left(["foo", "bar", "huzzah"]) == expected
+
+    def test_estimate_token_count_mode(self, mock_client):
+        tokenizer = GoogleTokenizer(model="gemini-2.0-flash", api_key="1234", token_count_mode="estimate")
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 4
+        assert tokenizer.count_tokens(["foo", "bar", "huzzah"]) == 5  # pyright: ignore[reportArgumentType]
+        mock_client.return_value.models.count_tokens.assert_called_once()
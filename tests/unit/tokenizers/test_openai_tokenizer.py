@@ -32,6 +32,14 @@ class TestOpenAiTokenizer:
     def test_token_count_for_text(self, tokenizer, expected):
         assert tokenizer.count_tokens("foo bar huzzah") == expected
 
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o"], indirect=["tokenizer"])
+    def test_token_count_batch(self, tokenizer, mocker):
+        spy = mocker.spy(tokenizer, "try_count_tokens")
+
+        assert tokenizer.count_tokens_batch(["foo bar huzzah", "foo"]) == [5, 1]
+        assert tokenizer.count_tokens("foo") == 1
+        spy.assert_not_called()
+
     def test_initialize_with_unknown_model(self):
         tokenizer = OpenAiTokenizer(model="not-a-real-model")
         assert tokenizer.max_input_tokens == OpenAiTokenizer.DEFAULT_MAX_TOKENS - OpenAiTokenizer.TOKEN_OFFSET
@@ -201,6 +201,19 @@ class TestBaseTool:
 
         assert tool_schema == self.TARGET_TOOL_SCHEMA
 
+    def test_schema_cache(self, tool):
+        tool = MockTool()
+        tool_schema = tool.schema()
+        activity_schemas = tool.activity_schemas()
+
+        assert tool.activity_schemas() == activity_schemas
+        assert tool.schema() == tool_schema
+
+        tool.allowlist = ["test"]
+
+        assert len(tool.activity_schemas()) == 1
+        assert tool.schema() != tool_schema
+
     def test_to_native_tool_name(self, tool, mocker):
         tool = MockTool()
 
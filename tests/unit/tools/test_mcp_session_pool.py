@@ -0,0 +1,193 @@
+import asyncio
+import time
+import weakref
+from concurrent import futures
+from contextlib import asynccontextmanager
+
+import pytest
+
+from griptape.tools.mcp import session_pool as session_pool_module
+from griptape.tools.mcp.session_pool import (
+    McpSessionPool,
+    acquire_session_pool,
+    get_event_loop,
+    release_session_pool,
+    release_session_pool_soon,
+)
+
+
+class MockSession:
+    def __init__(self) -> None:
+        self.owner_task = asyncio.current_task()
+        self.initialize_count = 0
+        self.healthy = True
+
+    async def initialize(self) -> None:
+        self.initialize_count += 1
+
+    async def send_ping(self) -> None:
+        if not self.healthy:
+            raise ConnectionError("Ping failed")
+
+    async def call_tool(self, name: str, params: dict) -> str:
+        await asyncio.sleep(params.get("sleep", 0))
+
+        return f"{name}: {params}"
+
+    async def disconnect(self) -> None:
+        self.owner_task.cancel()  # pyright: ignore[reportOptionalMemberAccess]
+        await asyncio.wait([self.owner_task])  # pyright: ignore[reportArgumentType]
+
+        raise ConnectionError("Disconnected")
+
+
+class TestMcpSessionPool:
+    @pytest.fixture()
+    def sessions(self):
+        return {"opened": [], "closed": []}
+
+    @pytest.fixture()
+    def session_pool(self, sessions):
+        @asynccontextmanager
+        async def session_factory():
+            session = MockSession()
+            sessions["opened"].append(session)
+
+            try:
+                yield session
+            finally:
+                # The session must be closed by the task that opened it.
+                assert asyncio.current_task() is session.owner_task
+                sessions["closed"].append(session)
+
+        session_pool = McpSessionPool(session_factory, max_sessions=2)
+
+        yield session_pool
+
+        session_pool.close()
+
+    def test_run_reuses_session(self, session_pool, sessions):
+        for _ in range(3):
+            assert session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {}))) == "foo: {}"
+
+        assert len(sessions["opened"]) == 1
+        assert sessions["opened"][0].initialize_count == 1
+        assert session_pool.session_count == 1
+
+    def test_run_concurrently(self, session_pool, sessions):
+        def call(index: int) -> str:
+            return session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {"sleep": 0.2})))
+
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(call, range(4)))
+
+        assert results == ["foo: {'sleep': 0.2}"] * 4
+        assert time.perf_counter() - start < 0.7
+        assert len(sessions["opened"]) == 2
+
+    def test_health_check(self, session_pool, sessions):
+        session_pool.health_check_interval = 0
+        session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+        sessions["opened"][0].healthy = False
+
+        session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+
+        assert len(sessions["opened"]) == 2
+        assert sessions["closed"] == sessions["opened"][:1]
+        assert session_pool.session_count == 1
+
+    def test_reconnect(self, session_pool, sessions):
+        async def call_tool(session: MockSession) -> str:
+            if session is sessions["opened"][0]:
+                await session.disconnect()
+
+            return await session.call_tool("foo", {})
+
+        assert session_pool.run(session_pool.call(call_tool)) == "foo: {}"
+        assert len(sessions["opened"]) == 2
+        assert session_pool.session_count == 1
+
+    def test_error_keeps_connected_session(self, session_pool, sessions):
+        async def call_tool(session: MockSession) -> str:
+            raise ValueError("Tool error")
+
+        with pytest.raises(ValueError, match="Tool error"):
+            session_pool.run(session_pool.call(call_tool))
+
+        session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+
+        assert len(sessions["opened"]) == 1
+
+    def test_close(self, session_pool, sessions):
+        session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+        session_pool.close()
+
+        assert sessions["closed"] == sessions["opened"]
+
+        with pytest.raises(RuntimeError, match="closed"):
+            session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+
+    def test_shared_session_pool(self, mocker, sessions):
+        @asynccontextmanager
+        async def create_session(connection):
+            session = MockSession()
+            sessions["opened"].append((connection["command"], session))
+
+            try:
+                yield session
+            finally:
+                sessions["closed"].append((connection["command"], session))
+
+        mocker.patch.object(session_pool_module, "create_session", create_session)
+        connection = {"transport": "stdio", "command": "foo", "args": ["bar"], "env": None}
+
+        session_pools = [
+            acquire_session_pool(connection),
+            acquire_session_pool({**connection, "args": ["bar"]}),
+            acquire_session_pool({**connection, "command": "baz"}),
+        ]
+        for session_pool in session_pools:
+            session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+
+        assert session_pools[0] is session_pools[1]
+        assert session_pools[0] is not session_pools[2]
+        assert [command for command, _ in sessions["opened"]] == ["foo", "baz"]
+
+        assert release_session_pool(session_pools[0])
+        assert sessions["closed"] == []
+
+        assert release_session_pool(session_pools[1])
+        assert release_session_pool(session_pools[2])
+        assert sessions["closed"] == sessions["opened"]
+        assert acquire_session_pool(connection) is not session_pools[0]
+        assert not release_session_pool(McpSessionPool(create_session))
+
+    def test_shared_session_pool_does_not_reference_users(self, mocker, sessions):
+        @asynccontextmanager
+        async def create_session(connection):
+            session = MockSession()
+            sessions["opened"].append(session)
+
+            try:
+                yield session
+            finally:
+                sessions["closed"].append(session)
+
+        class User:
+            pass
+
+        mocker.patch.object(session_pool_module, "create_session", create_session)
+        user = User()
+        session_pool = acquire_session_pool({"transport": "stdio", "command": "foo"})
+        weakref.finalize(user, release_session_pool_soon, session_pool)
+        session_pool.run(session_pool.call(lambda session: session.call_tool("foo", {})))
+
+        del user
+        # Waits for the release that is scheduled on the event loop.
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), get_event_loop()).result()
+        deadline = time.monotonic() + 5
+        while sessions["closed"] != sessions["opened"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert sessions["closed"] == sessions["opened"]
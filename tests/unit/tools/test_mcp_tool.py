@@ -1 +1,68 @@
-class TestMCPTool: ...
+import gc
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from griptape.tools.mcp import session_pool as session_pool_module
+from griptape.tools.mcp.tool import MCPTool
+
+
+class TestMCPTool:
+    @pytest.fixture()
+    def sessions(self, mocker):
+        sessions = {"opened": [], "closed": []}
+
+        class MockSession:
+            async def initialize(self) -> None:
+                pass
+
+            async def list_tools(self) -> SimpleNamespace:
+                return SimpleNamespace(tools=[])
+
+        @asynccontextmanager
+        async def create_session(connection):
+            session = MockSession()
+            sessions["opened"].append(session)
+
+            try:
+                yield session
+            finally:
+                sessions["closed"].append(session)
+
+        mocker.patch.object(session_pool_module, "create_session", create_session)
+
+        return sessions
+
+    @pytest.fixture()
+    def connection(self):
+        return {"transport": "stdio", "command": "foo", "args": []}
+
+    def test_tools_share_sessions(self, sessions, connection):
+        tools = [
+            MCPTool(connection=connection, install_dependencies_on_init=False),
+            MCPTool(connection=connection, install_dependencies_on_init=False),
+        ]
+
+        assert tools[0].session_pool is tools[1].session_pool
+        assert len(sessions["opened"]) == 1
+
+        tools[0].close()
+        tools[0].close()
+
+        assert sessions["closed"] == []
+
+        tools[1].close()
+
+        assert sessions["closed"] == sessions["opened"]
+
+    def test_garbage_collected_tools_close_sessions(self, sessions, connection):
+        MCPTool(connection=connection, install_dependencies_on_init=False)
+        gc.collect()
+
+        deadline = time.monotonic() + 5
+        while not sessions["closed"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert sessions["closed"] == sessions["opened"]
@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+from griptape.utils import ExecutorPool, ExecutorRegistry, PooledExecutor
+
+
+class TestExecutorRegistry:
+    @pytest.fixture()
+    def pool(self):
+        pool = ExecutorPool("test", max_workers=2)
+
+        yield pool
+
+        pool.shutdown()
+
+    def test_get_pool(self):
+        pool = ExecutorRegistry.get_pool("test-get-pool")
+
+        assert ExecutorRegistry.get_pool("test-get-pool") is pool
+        assert pool.max_workers == ExecutorRegistry.default_max_workers
+        assert ExecutorRegistry.pools["test-get-pool"] is pool
+
+    def test_configure_pool(self):
+        pool = ExecutorRegistry.configure_pool("test-configure-pool", max_workers=3)
+
+        assert ExecutorRegistry.get_pool("test-configure-pool") is pool
+        assert pool.max_workers == 3
+
+        ExecutorRegistry.configure_pool("test-configure-pool", max_workers=1)
+
+        assert pool.max_workers == 1
+        assert pool.executor().submit(lambda: "foo").result() == "foo"
+        assert ExecutorRegistry.metrics()["test-configure-pool"].max_workers == 1
+
+    def test_executor_factory(self):
+        executor_factory = ExecutorRegistry.executor_factory("test-executor-factory")
+
+        assert ExecutorRegistry.executor_factory("test-executor-factory") is executor_factory
+        assert isinstance(executor_factory(), PooledExecutor)
+        assert executor_factory().pool is ExecutorRegistry.get_pool("test-executor-factory")
+
+    def test_submit(self, pool):
+        with pool.executor() as executor:
+            future = executor.submit(lambda value: f"{value}-bar", "foo")
+
+        assert future.result() == "foo-bar"
+
+        metrics = pool.metrics
+        assert metrics.submitted == 1
+        assert metrics.completed == 1
+        assert metrics.queue_depth == 0
+        assert metrics.active_workers == 0
+        assert metrics.average_wait_time >= 0
+
+    def test_bounded_concurrency(self, pool):
+        release = threading.Event()
+        running = threading.Semaphore(0)
+
+        def block() -> str:
+            running.release()
+            release.wait()
+
+            return threading.current_thread().name
+
+        with pool.executor() as executor:
+            results = [executor.submit(block) for _ in range(4)]
+            running.acquire()
+            running.acquire()
+
+            metrics = pool.metrics
+            assert metrics.active_workers == 2
+            assert metrics.queue_depth == 2
+
+            release.set()
+
+        assert all(result.result().startswith("griptape-test") for result in results)
+        assert pool.metrics.completed == 4
+        assert pool.metrics.max_wait_time > 0
+
+    def test_shutdown_executor_keeps_pool(self, pool):
+        executor = pool.executor()
+        executor.submit(lambda: None)
+        executor.shutdown()
+
+        with pytest.raises(RuntimeError, match="after shutdown"):
+            executor.submit(lambda: None)
+
+        assert pool.executor().submit(lambda: "foo").result() == "foo"
+
+    def test_nested_submit_runs_inline_when_saturated(self, pool):
+        def outer() -> list[str]:
+            with pool.executor() as executor:
+                return [executor.submit(threading.current_thread).result().name for _ in range(2)]
+
+        pool.resize(1)
+        thread_names = pool.submit(outer).result()
+
+        assert all(name.startswith("griptape-test") for name in thread_names)
+        assert pool.metrics.inline_runs == 2
+
+    def test_nested_submit_through_same_executor_when_saturated(self, pool):
+        executor = pool.executor()
+
+        def inner() -> str:
+            return executor.submit(lambda: "foo").result()
+
+        def outer() -> str:
+            return executor.submit(inner).result()
+
+        pool.resize(1)
+
+        assert executor.submit(outer).result(timeout=5) == "foo"
+        assert pool.metrics.inline_runs == 2
+
+        executor.shutdown()
+
+    def test_inline_run_error(self, pool):
+        def fail() -> None:
+            raise ValueError("foo")
+
+        pool.resize(1)
+
+        with pytest.raises(ValueError, match="foo"):
+            pool.submit(lambda: pool.submit(fail).result()).result()
@@ -0,0 +1,31 @@
+import pytest
+
+from griptape.utils import J2
+
+
+class TestJ2:
+    def test_render(self):
+        assert J2("rulesets/rulesets.j2").render(rulesets=[]) == ""
+
+    def test_render_without_template_name(self):
+        with pytest.raises(ValueError, match="template_name is required."):
+            J2().render()
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("Hello {{ name }}!", name="world") == "Hello world!"
+        assert J2().render_from_string("Hello {{ name }}!", name="there") == "Hello there!"
+
+    def test_shares_environment(self, tmp_path):
+        assert J2().environment is J2("rulesets/rulesets.j2").environment
+        assert J2(templates_dir=str(tmp_path)).environment is not J2().environment
+
+    def test_caches_templates(self, mocker):
+        spy = mocker.spy(J2().environment, "from_string")
+
+        J2().render_from_string("{{ count }} is cached", count=1)
+        J2().render_from_string("{{ count }} is cached", count=2)
+
+        assert spy.call_count == 1
+        assert J2().environment.get_template("rulesets/rulesets.j2") is J2().environment.get_template(
+            "rulesets/rulesets.j2"
+        )
@@ -0,0 +1,65 @@
+import threading
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import MicroBatcher
+
+
+class TestMicroBatcher:
+    def test_submit(self):
+        def process(items: list[str]) -> list[str]:
+            return [item.upper() for item in items]
+
+        micro_batcher = MicroBatcher(process)
+
+        assert micro_batcher.submit("foo").result() == "FOO"
+        assert micro_batcher.submit_all(["foo", "bar"]) == ["FOO", "BAR"]
+        assert micro_batcher.item_count == 3
+
+    def test_coalesces_concurrent_submits(self):
+        batches = []
+
+        def process(items: list[int]) -> list[int]:
+            batches.append(items)
+
+            return [item * 2 for item in items]
+
+        micro_batcher = MicroBatcher(process, max_batch_size=4, max_wait=1)
+        start = threading.Barrier(8)
+
+        def submit(item: int) -> int:
+            start.wait()
+
+            return micro_batcher.submit(item).result()
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(submit, range(8)))
+
+        assert results == [item * 2 for item in range(8)]
+        assert all(len(batch) <= 4 for batch in batches)
+        assert len(batches) < 8
+        assert micro_batcher.batch_count == len(batches)
+        assert micro_batcher.item_count == 8
+
+    def test_max_wait(self):
+        micro_batcher = MicroBatcher(lambda items: [len(items)] * len(items), max_batch_size=4, max_wait=0)
+
+        assert micro_batcher.submit("foo").result(timeout=1) == 1
+
+    def test_error(self):
+        def process(items: list[str]) -> list[str]:
+            raise ValueError("foo")
+
+        micro_batcher = MicroBatcher(process)
+
+        with pytest.raises(ValueError, match="foo"):
+            micro_batcher.submit("foo").result()
+        with pytest.raises(ValueError, match="foo"):
+            micro_batcher.submit_all(["foo", "bar"])
+
+    def test_result_count_mismatch(self):
+        micro_batcher = MicroBatcher(lambda items: [])
+
+        with pytest.raises(ValueError, match="Expected 1 results for the batch, got 0."):
+            micro_batcher.submit("foo").result()
@@ -0,0 +1,61 @@
+import contextvars
+import queue
+import time
+
+from griptape.utils import QueueDispatcher
+
+context_var = contextvars.ContextVar("context_var", default=None)
+
+
+class TestQueueDispatcher:
+    def test_restarts_after_idle_timeout(self):
+        items = []
+        item_queue = queue.SimpleQueue()
+
+        def dispatch() -> None:
+            while (item := dispatcher.get()) is not None:
+                items.append(item)
+
+        dispatcher = QueueDispatcher(item_queue, dispatch, name="test-dispatcher", idle_timeout=0.01)
+
+        item_queue.put("foo")
+        assert dispatcher.start()
+        assert not dispatcher.start()
+
+        self._wait_until_idle(dispatcher)
+
+        item_queue.put("bar")
+        assert dispatcher.start()
+
+        self._wait_until_idle(dispatcher)
+
+        assert items == ["foo", "bar"]
+
+    def test_copy_context(self):
+        values = []
+        item_queue = queue.SimpleQueue()
+
+        def dispatch() -> None:
+            while dispatcher.get() is not None:
+                values.append(context_var.get())
+
+        context_var.set("foo")
+
+        for copy_context in (True, False):
+            dispatcher = QueueDispatcher(
+                item_queue, dispatch, name="test-dispatcher", idle_timeout=0.01, copy_context=copy_context
+            )
+            item_queue.put("item")
+            dispatcher.start()
+
+            self._wait_until_idle(dispatcher)
+
+        assert values == ["foo", None]
+
+    def _wait_until_idle(self, dispatcher: QueueDispatcher) -> None:
+        deadline = time.monotonic() + 5
+
+        while dispatcher.is_running and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not dispatcher.is_running